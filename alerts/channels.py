@@ -7,6 +7,15 @@ import logging
 from datetime import datetime, timezone
 from typing import Protocol, runtime_checkable
 
+try:
+    from orjson import OPT_APPEND_NEWLINE, dumps as _orjson_dumps  # optional, faster encode
+
+    def _json_line(entry: dict) -> str:
+        return _orjson_dumps(entry, option=OPT_APPEND_NEWLINE).decode()
+except ImportError:
+    def _json_line(entry: dict) -> str:
+        return json.dumps(entry) + "\n"
+
 logger = logging.getLogger("btcmonitor.alerts.channels")
 
 
@@ -35,12 +44,36 @@ class ConsoleChannel:
 class FileChannel:
     """Append alerts to a JSON lines log file."""
 
-    def __init__(self, log_path="data/alerts.jsonl"):
+    def __init__(self, log_path="data/alerts.jsonl", log_file=None):
+        """
+        Args:
+            log_path: JSONL file, opened in append mode for each alert
+            log_file: Already-open text stream to write to instead of log_path
+        """
         self.log_path = log_path
+        self.log_file = log_file
 
     def send(self, alert):
+        self.send_batch([alert])
+
+    def send_batch(self, alerts):
+        """Append one line per alert with a single open and write."""
+        if not alerts:
+            return
+        data = "".join(_json_line(self._entry(alert)) for alert in alerts)
+        try:
+            if self.log_file is not None:
+                self.log_file.write(data)
+            else:
+                with open(self.log_path, "a") as f:
+                    f.write(data)
+        except Exception as e:
+            logger.warning(f"Failed to write alert to file: {e}")
+
+    @staticmethod
+    def _entry(alert) -> dict:
         sev = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
-        entry = {
+        return {
             "timestamp": alert.triggered_at.isoformat() if hasattr(alert.triggered_at, 'isoformat') else str(alert.triggered_at),
             "rule_id": getattr(alert, 'rule_id', ''),
             "rule_name": getattr(alert, 'rule_name', ''),
@@ -49,11 +82,6 @@ class FileChannel:
             "threshold": getattr(alert, 'threshold', None),
             "message": getattr(alert, 'message', ''),
         }
-        try:
-            with open(self.log_path, "a") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception as e:
-            logger.warning(f"Failed to write alert to file: {e}")
 
 
 class DesktopChannel:
@@ -157,10 +185,11 @@ class DesktopChannel:
 
 
 class EmailChannel:
-    """Email alert channel — sends CRITICAL alerts as individual emails.
+    """Email alert channel — sends CRITICAL alerts by email.
 
     Only sends for CRITICAL severity to avoid inbox flooding.
-    Rate limited: max 1 email per 30 minutes.
+    Rate limited: max 1 email per 30 minutes; several CRITICAL alerts from
+    one evaluation pass are combined into that one email.
     """
 
     def __init__(self, config: dict):
@@ -171,25 +200,48 @@ class EmailChannel:
         self._cooldown = 1800  # 30 minutes
 
     def send(self, alert) -> bool:
+        return self.send_batch([alert])[0]
+
+    def send_batch(self, alerts) -> list:
+        """Email a pass's CRITICAL alerts as a single message.
+
+        Returns one bool per alert; non-CRITICAL and rate-limited alerts are False.
+        """
+        results = [False] * len(alerts)
         if not self.enabled or not self.sender.is_configured():
-            return False
+            return results
 
-        severity = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
-        if severity != "CRITICAL":
-            return False
+        critical = []
+        for i, alert in enumerate(alerts):
+            severity = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
+            if severity == "CRITICAL":
+                critical.append(i)
+        if not critical:
+            return results
 
         now = time.time()
         if now - self._last_sent < self._cooldown:
             logger.debug("EmailChannel: rate limited")
-            return False
+            return results
+
+        if len(critical) == 1:
+            alert = alerts[critical[0]]
+            rule_name, message = alert.rule_name, alert.message
+            metric_value = getattr(alert, 'metric_value', None)
+        else:
+            rule_name = f"{len(critical)} critical alerts"
+            message = " | ".join(f"{alerts[i].rule_name}: {alerts[i].message}" for i in critical)
+            metric_value = None
 
         result = self.sender.send_alert(
-            rule_name=alert.rule_name,
-            severity=severity,
-            message=alert.message,
-            metric_value=getattr(alert, 'metric_value', None),
+            rule_name=rule_name,
+            severity="CRITICAL",
+            message=message,
+            metric_value=metric_value,
         )
 
         if result:
             self._last_sent = now
-        return result
+            for i in critical:
+                results[i] = True
+        return results
@@ -1,19 +1,13 @@
 """Alert evaluation engine."""
 import logging
 from datetime import datetime, timezone
+from operator import eq, ge, gt, le, lt, ne
 from models.alerts import AlertRecord
 from models.enums import MetricName
 
 logger = logging.getLogger("btcmonitor.alerts.engine")
 
-OPERATOR_MAP = {
-    "<": lambda v, t: v < t,
-    ">": lambda v, t: v > t,
-    "<=": lambda v, t: v <= t,
-    ">=": lambda v, t: v >= t,
-    "==": lambda v, t: v == t,
-    "!=": lambda v, t: v != t,
-}
+OPERATOR_MAP = {"<": lt, ">": gt, "<=": le, ">=": ge, "==": eq, "!=": ne}
 
 
 class AlertEngine:
@@ -22,12 +16,12 @@ class AlertEngine:
         self.db = db
         self.channels = channels or []
 
-    def _extract_metric_value(self, snapshot, metric_name, derived=None):
-        """Get metric value from snapshot or derived metrics dict."""
-        derived = derived or {}
-        if metric_name in derived:
-            return derived[metric_name]
+    def _metric_values(self, snapshot, derived=None):
+        """Every metric name a rule can reference, mapped to its value.
 
+        Built once per evaluation pass so each rule is a single dict lookup;
+        derived metrics override snapshot fields of the same name.
+        """
         # Map metric names to snapshot fields
         field_map = {
             "PRICE": snapshot.price.price_usd,
@@ -50,7 +44,9 @@ class AlertEngine:
             "DOMINANCE": snapshot.sentiment.btc_dominance_pct,
             "btc_dominance_pct": snapshot.sentiment.btc_dominance_pct,
         }
-        return field_map.get(metric_name)
+        if derived:
+            field_map.update(derived)
+        return field_map
 
     def _evaluate_condition(self, value, operator, threshold):
         if value is None:
@@ -122,11 +118,11 @@ class AlertEngine:
 
     def evaluate_rules(self, snapshot, ignore_cooldowns=False):
         """Evaluate all enabled rules against current snapshot."""
-        derived = self.compute_derived_metrics(snapshot)
+        metrics = self._metric_values(snapshot, self.compute_derived_metrics(snapshot))
         triggered = []
 
         for rule in self.rules_manager.get_enabled_rules():
-            value = self._extract_metric_value(snapshot, rule.metric, derived)
+            value = metrics.get(rule.metric)
             if value is None:
                 continue
 
@@ -149,8 +145,9 @@ class AlertEngine:
 
             if not ignore_cooldowns:
                 self.db.save_alert(record)
-                self._dispatch(record)
 
+        if not ignore_cooldowns:
+            self._dispatch(triggered)
         return triggered
 
     def evaluate_composites(self, snapshot, triggered_rules):
@@ -159,7 +156,7 @@ class AlertEngine:
         composite_alerts = []
 
         for composite in self.rules_manager.get_composites():
-            if all(rid in triggered_ids for rid in composite.required_rules):
+            if triggered_ids.issuperset(composite.required_rules):
                 if not self._check_cooldown(composite.id, composite.cooldown_seconds):
                     continue
 
@@ -174,8 +171,8 @@ class AlertEngine:
                 )
                 composite_alerts.append(record)
                 self.db.save_alert(record)
-                self._dispatch(record)
 
+        self._dispatch(composite_alerts)
         return composite_alerts
 
     def check(self, snapshot):
@@ -186,11 +183,11 @@ class AlertEngine:
 
     def test_rules(self, snapshot):
         """Evaluate ALL rules ignoring cooldowns, for testing/validation."""
-        derived = self.compute_derived_metrics(snapshot)
+        metrics = self._metric_values(snapshot, self.compute_derived_metrics(snapshot))
         results = []
 
         for rule in self.rules_manager.get_all_rules():
-            value = self._extract_metric_value(snapshot, rule.metric, derived)
+            value = metrics.get(rule.metric)
             would_fire = self._evaluate_condition(value, rule.operator, rule.threshold) if value is not None else False
 
             results.append({
@@ -219,11 +216,26 @@ class AlertEngine:
             lines.append(f"[{icon}] [{a.severity}] {a.message}")
         return "\n".join(lines)
 
-    def _dispatch(self, record):
+    def _dispatch(self, records):
+        """Deliver one pass's alerts; channels with send_batch get them in a single call."""
+        if not records:
+            return
+        critical = any(r.severity == "CRITICAL" for r in records)
         for channel in self.channels:
-            try:
-                channel.send(record)
-                if record.severity == "CRITICAL" and hasattr(channel, "send_sound"):
+            send_batch = getattr(channel, "send_batch", None)
+            if send_batch is not None:
+                try:
+                    send_batch(records)
+                except Exception as e:
+                    logger.warning(f"Channel dispatch error: {e}")
+            else:
+                for record in records:
+                    try:
+                        channel.send(record)
+                    except Exception as e:
+                        logger.warning(f"Channel dispatch error: {e}")
+            if critical and hasattr(channel, "send_sound"):
+                try:
                     channel.send_sound()
-            except Exception as e:
-                logger.warning(f"Channel dispatch error: {e}")
+                except Exception as e:
+                    logger.warning(f"Channel dispatch error: {e}")
@@ -1,11 +1,38 @@
 """Nadeau-framework composite signal evaluator."""
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
+import numpy as np
 from models.enums import LTHProxy, ReflexivityState, SignalStatus, CyclePhase
 from utils.constants import days_since_last_halving
 
 logger = logging.getLogger("btcmonitor.alerts.nadeau")
 
+# (phase_description, expected_behavior) for post-halving years 1-3, then pre-halving
+CYCLE_PHASES = (
+    ("Post-halving Year 1: Historically bullish, supply shock taking effect",
+     "Typically early-to-mid bull market"),
+    ("Post-halving Year 2: Peak territory or early correction",
+     "Watch for distribution signs, mid-cycle corrections common"),
+    ("Post-halving Year 3: Correction/consolidation period",
+     "Bear market or choppy consolidation typically in progress"),
+    ("Pre-halving year: Accumulation phase building toward next cycle",
+     "Smart money accumulating, market resets before next halving catalyst"),
+)
+
+
+@lru_cache(maxsize=8)
+def _cycle_position(since):
+    """Cycle position for a days-since-halving count (changes once a day, so memoized)."""
+    year = since / 365
+    phase_desc, expected = CYCLE_PHASES[min(max(int(year), 0), 3)]
+    return {
+        "days_since_halving": since,
+        "years_into_cycle": round(year, 1),
+        "phase_description": phase_desc,
+        "expected_behavior": expected,
+    }
+
 
 class NadeauSignalEvaluator:
     def __init__(self, db):
@@ -49,28 +76,7 @@ class NadeauSignalEvaluator:
 
     def evaluate_cycle_position(self, snapshot):
         """Evaluate where we are per Nadeau's cycle framework."""
-        since = days_since_last_halving()
-        year = since / 365
-
-        if year < 1:
-            phase_desc = "Post-halving Year 1: Historically bullish, supply shock taking effect"
-            expected = "Typically early-to-mid bull market"
-        elif year < 2:
-            phase_desc = "Post-halving Year 2: Peak territory or early correction"
-            expected = "Watch for distribution signs, mid-cycle corrections common"
-        elif year < 3:
-            phase_desc = "Post-halving Year 3: Correction/consolidation period"
-            expected = "Bear market or choppy consolidation typically in progress"
-        else:
-            phase_desc = "Pre-halving year: Accumulation phase building toward next cycle"
-            expected = "Smart money accumulating, market resets before next halving catalyst"
-
-        return {
-            "days_since_halving": since,
-            "years_into_cycle": round(year, 1),
-            "phase_description": phase_desc,
-            "expected_behavior": expected,
-        }
+        return dict(_cycle_position(days_since_last_halving()))
 
     def evaluate_reflexivity_signals(self, snapshot):
         """Check for narrative shift / FUD exhaustion indicators."""
@@ -78,10 +84,10 @@ class NadeauSignalEvaluator:
         mvrv = snapshot.valuation.mvrv_ratio
 
         # Check fear & greed trend (need historical snapshots)
-        snapshots = self.db.get_snapshots(limit=30)
-        if len(snapshots) >= 7:
-            recent_fears = [s.sentiment.fear_greed_value for s in snapshots[:7]]
-            avg_recent = sum(recent_fears) / len(recent_fears)
+        recent_fears = self.db.get_snapshot_columns(["fear_greed_value"], limit=7)["fear_greed_value"]
+        # NULL readings come back as NaN; require seven real ones
+        if np.count_nonzero(~np.isnan(recent_fears)) >= 7:
+            avg_recent = float(np.nanmean(recent_fears))
         else:
             avg_recent = fear
 
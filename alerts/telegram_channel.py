@@ -15,6 +15,8 @@ class TelegramChannel:
     """Send alert notifications via Telegram.
 
     Implements the AlertChannel protocol: send(self, alert) -> None.
+    Messages are queued on the bot's background sender so alert evaluation
+    never blocks on Telegram.
     """
 
     def __init__(self, bot, min_severity="WARNING"):
@@ -35,6 +37,13 @@ class TelegramChannel:
         )
 
         try:
-            self.bot.send_message(text)
+            future = self.bot.send_message_async(text)
         except Exception as e:
             logger.warning("Telegram alert failed: %s", e)
+            return
+        future.add_done_callback(_log_failure)
+
+
+def _log_failure(future):
+    if future.exception() is not None:
+        logger.warning("Telegram alert failed: %s", future.exception())
@@ -118,7 +118,7 @@ class Dashboard:
         data["price_changes"] = {}
         for label, days in [("7d", 7), ("30d", 30), ("90d", 90)]:
             try:
-                data["price_changes"][label] = self.monitor.get_price_change(days)
+                data["price_changes"][label] = self.monitor.get_price_change(days, data["price_history"])
             except Exception:
                 data["price_changes"][label] = None
 
@@ -279,11 +279,10 @@ class DCAChartGenerator:
     # ─── Visual Timeline Charts ──────────────────────────────────
 
     def _generate_price_path(self, current_price, target_price, months):
-        """Generate monthly price points along a linear path."""
+        """Generate monthly price points along a linear path, as a float array."""
         if months <= 0:
-            return [current_price]
-        step = (target_price - current_price) / months
-        return [current_price + step * m for m in range(months + 1)]
+            return np.array([current_price], dtype=float)
+        return np.linspace(current_price, target_price, months + 1)
 
     def plot_scenario_fan(self, current_price, projections, monthly_dca=200,
                           key_levels=None, next_halving_date=None,
@@ -331,7 +330,7 @@ class DCAChartGenerator:
             top = fc["at_top"]["target_price"]
             bear_path = self._generate_price_path(current_price, bottom, bear_months)
             bull_path = self._generate_price_path(bottom, top, bull_months)[1:]
-            full_path = bear_path + bull_path
+            full_path = np.concatenate((bear_path, bull_path))
             full_dates = [today + timedelta(days=30 * m) for m in range(len(full_path))]
             _glow(ax, full_dates, full_path, CYAN, lw=2)
             ax.plot([], [], color=CYAN, linewidth=2, linestyle="-.",
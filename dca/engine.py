@@ -1,6 +1,6 @@
 """DCA simulation engine."""
 import logging
-from datetime import date, timedelta
+from datetime import date
 from models.dca import DCAResult, DCAComparison
 from models.enums import Frequency
 
@@ -11,31 +11,23 @@ class DCAEngine:
     def __init__(self, db):
         self.db = db
 
+    # Days between buys for the fixed-step frequencies; weekly/biweekly align to Monday
+    STEP_DAYS = {"daily": 1, "weekly": 7, "biweekly": 14}
+
     def _generate_buy_dates(self, start, end, frequency):
         """Generate list of buy dates based on frequency."""
+        last = min(end, date.today())
+        step = self.STEP_DAYS.get(frequency)  # Frequency is a str enum, so members hash as their values
+        if step is not None:
+            first = start.toordinal()
+            if step > 1:
+                first += -start.weekday() % 7
+            return [date.fromordinal(o) for o in range(first, last.toordinal() + 1, step)]
+
         dates = []
-        current = start
-        today = date.today()
-
-        if frequency == Frequency.DAILY or frequency == "daily":
-            while current <= end and current <= today:
-                dates.append(current)
-                current += timedelta(days=1)
-        elif frequency == Frequency.WEEKLY or frequency == "weekly":
-            # Align to Monday
-            while current.weekday() != 0:
-                current += timedelta(days=1)
-            while current <= end and current <= today:
-                dates.append(current)
-                current += timedelta(weeks=1)
-        elif frequency == Frequency.BIWEEKLY or frequency == "biweekly":
-            while current.weekday() != 0:
-                current += timedelta(days=1)
-            while current <= end and current <= today:
-                dates.append(current)
-                current += timedelta(weeks=2)
-        elif frequency == Frequency.MONTHLY or frequency == "monthly":
-            while current <= end and current <= today:
+        if frequency == Frequency.MONTHLY:
+            current = start
+            while current <= last:
                 dates.append(date(current.year, current.month, 1))
                 if current.month == 12:
                     current = date(current.year + 1, 1, 1)
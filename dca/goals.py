@@ -30,15 +30,17 @@ class GoalTracker:
 
     def get_goal(self, goal_id=None):
         """Get a goal by ID, or the most recent goal if no ID given."""
-        if goal_id:
-            row = self.db.conn.execute("SELECT * FROM goals WHERE id = ?", (goal_id,)).fetchone()
-        else:
-            row = self.db.conn.execute("SELECT * FROM goals ORDER BY created_at DESC LIMIT 1").fetchone()
+        with self.db.reader() as conn:
+            if goal_id:
+                row = conn.execute("SELECT * FROM goals WHERE id = ?", (goal_id,)).fetchone()
+            else:
+                row = conn.execute("SELECT * FROM goals ORDER BY created_at DESC LIMIT 1").fetchone()
         return dict(row) if row else None
 
     def list_goals(self):
         """List all goals."""
-        rows = self.db.conn.execute("SELECT * FROM goals ORDER BY created_at DESC").fetchall()
+        with self.db.reader() as conn:
+            rows = conn.execute("SELECT * FROM goals ORDER BY created_at DESC").fetchall()
         return [dict(r) for r in rows]
 
     def get_progress(self, current_price, goal_id=None):
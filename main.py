@@ -36,7 +36,7 @@ def _init_components(config_path=None, verbose=False):
     config = load_config(config_path)
 
     db_path = config["database"]["path"]
-    db = Database(db_path)
+    db = Database(db_path, packed_snapshots=config["database"].get("packed_snapshots", False))
     db.connect()
 
     api = APIRegistry(config)
@@ -1241,8 +1241,15 @@ def service_install(ctx, fetch_interval, digest_day, digest_hour):
     day_names = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
 
     for job, status in results.items():
-        if status == "installed":
+        if job == "log_rotation":
+            if status == "installed":
+                console.print(f"  [green]{job}:[/green] newsyslog rotation installed")
+            else:
+                console.print(f"  [dim]{job}: {status}[/dim]")
+        elif status == "installed":
             console.print(f"  [green]{job}:[/green] installed and loaded")
+        elif status == "unchanged":
+            console.print(f"  [green]{job}:[/green] already installed (plist unchanged)")
         else:
             console.print(f"  [red]{job}:[/red] {status}")
 
@@ -1401,7 +1408,8 @@ def service_run_digest(ctx):
         logger.info(f"Digest generated: {len(html)} chars HTML")
 
         # Send email
-        result = sender.send_digest(html, subject="Your Weekly Bitcoin Digest")
+        with sender:
+            result = sender.send_digest(html, subject="Your Weekly Bitcoin Digest")
         if result:
             logger.info(f"Digest email sent to {sender.to_address}")
 
@@ -1500,10 +1508,11 @@ def email_test(ctx):
         console.print("[red]Email not configured.[/red] Run: python main.py email setup")
         return
 
-    result = sender.send_digest(
-        html_content="<h1>Test Email</h1><p>Bitcoin Cycle Monitor email is working.</p>",
-        subject="BTC Monitor -- Test Email",
-    )
+    with sender:
+        result = sender.send_digest(
+            html_content="<h1>Test Email</h1><p>Bitcoin Cycle Monitor email is working.</p>",
+            subject="BTC Monitor -- Test Email",
+        )
     if result:
         console.print(f"[green]Test email sent to {sender.to_address}[/green]")
     else:
@@ -1528,7 +1537,8 @@ def email_send_digest(ctx):
     wd = WeeklyDigest(c["monitor"], c["cycle"], c["alert_engine"], c["nadeau"], c["db"])
     html = wd.format_html()
 
-    result = sender.send_digest(html, subject="Your Weekly Bitcoin Digest")
+    with sender:
+        result = sender.send_digest(html, subject="Your Weekly Bitcoin Digest")
     if result:
         console.print(f"[green]Digest sent to {sender.to_address}[/green]")
     else:
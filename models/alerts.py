@@ -27,7 +27,7 @@ class CompositeSignal:
     cooldown_seconds: int = 86400
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertRecord:
     id: Optional[int] = None
     rule_id: str = ""
@@ -38,3 +38,17 @@ class AlertRecord:
     message: str = ""
     triggered_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     acknowledged: bool = False
+
+    def to_dict(self) -> dict:
+        """Plain dict of every field, triggered_at as ISO 8601."""
+        return {
+            "id": self.id,
+            "rule_id": self.rule_id,
+            "rule_name": self.rule_name,
+            "metric_value": self.metric_value,
+            "threshold": self.threshold,
+            "severity": self.severity,
+            "message": self.message,
+            "triggered_at": self.triggered_at.isoformat(),
+            "acknowledged": self.acknowledged,
+        }
@@ -1,32 +1,84 @@
 """SQLite database for storing metrics, price history, alerts, and DCA portfolios."""
 import sqlite3
 import logging
+import queue
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from models.metrics import CombinedSnapshot
+from models.metrics import CombinedSnapshot, PriceRecord, PACKED_FIELDS, SNAPSHOT_COLUMNS
 
 logger = logging.getLogger("btcmonitor.db")
 
+READER_POOL_SIZE = 4
+
+SNAPSHOT_NUMERIC_COLUMNS = set(PACKED_FIELDS)
+
+
+def _snapshot_factory(cursor, row):
+    """Row factory building CombinedSnapshot directly from a SNAPSHOT_COLUMNS tuple."""
+    return CombinedSnapshot.from_row(row)
+
 
 class Database:
-    def __init__(self, db_path="data/bitcoin.db"):
+    def __init__(self, db_path="data/bitcoin.db", readers=READER_POOL_SIZE, packed_snapshots=False):
         self.db_path = db_path
         self.conn = None
+        # Store snapshots as struct-packed blobs in metrics_snapshots_v2
+        self.packed_snapshots = packed_snapshots
+        self._num_readers = readers
+        self._readers = None
+        self._all_readers = []
+        # rule_id -> last triggered_at, primed in connect() and kept current by save_alert()
+        self._last_alert_cache = {}
+        # (token, dates, prices) built by get_price_arrays(); see _price_cache_token()
+        self._price_arrays = None
+        self._price_generation = 0
 
     def connect(self):
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        # Single writer connection; WAL lets the reader pool run alongside it.
         self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA foreign_keys=ON")
         self._create_tables()
+        self._prime_alert_cache()
+
+        self._readers = queue.SimpleQueue()
+        if self.db_path != ":memory:":
+            for _ in range(self._num_readers):
+                rc = sqlite3.connect(self.db_path, check_same_thread=False)
+                rc.row_factory = sqlite3.Row
+                rc.execute("PRAGMA query_only=ON")
+                self._all_readers.append(rc)
+                self._readers.put(rc)
         return self
 
     def close(self):
+        for rc in self._all_readers:
+            rc.close()
+        self._all_readers = []
+        self._readers = None
         if self.conn:
             self.conn.close()
             self.conn = None
 
+    @contextmanager
+    def reader(self):
+        """Borrow a read-only connection from the pool.
+
+        Falls back to the writer connection for in-memory databases, which
+        cannot be shared between connections.
+        """
+        if not self._all_readers:
+            yield self.conn
+            return
+        rc = self._readers.get()
+        try:
+            yield rc
+        finally:
+            self._readers.put(rc)
+
     def __enter__(self):
         self.connect()
         return self
@@ -60,6 +112,17 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp
                 ON metrics_snapshots(timestamp);
 
+            CREATE TABLE IF NOT EXISTS metrics_snapshots_v2 (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                fear_greed_label TEXT,
+                source TEXT DEFAULT 'api',
+                payload BLOB NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_snapshots_v2_timestamp
+                ON metrics_snapshots_v2(timestamp);
+
             CREATE TABLE IF NOT EXISTS price_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 date TEXT NOT NULL UNIQUE,
@@ -86,6 +149,42 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_alerts_triggered
                 ON alert_history(triggered_at);
 
+            CREATE INDEX IF NOT EXISTS idx_alerts_unack
+                ON alert_history(triggered_at DESC) WHERE acknowledged = 0;
+
+            -- Alert counts maintained on insert so stats never scan alert_history
+            CREATE TABLE IF NOT EXISTS alert_counters (
+                severity TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE TABLE IF NOT EXISTS alert_daily_counts (
+                day TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, severity)
+            );
+
+            INSERT INTO alert_counters (severity, count)
+                SELECT severity, COUNT(*) FROM alert_history
+                WHERE NOT EXISTS (SELECT 1 FROM alert_counters)
+                GROUP BY severity;
+
+            INSERT INTO alert_daily_counts (day, severity, count)
+                SELECT date(triggered_at), severity, COUNT(*) FROM alert_history
+                WHERE NOT EXISTS (SELECT 1 FROM alert_daily_counts)
+                GROUP BY date(triggered_at), severity;
+
+            CREATE TRIGGER IF NOT EXISTS trg_alert_count
+            AFTER INSERT ON alert_history
+            BEGIN
+                INSERT INTO alert_counters (severity, count) VALUES (NEW.severity, 1)
+                    ON CONFLICT(severity) DO UPDATE SET count = count + 1;
+                INSERT INTO alert_daily_counts (day, severity, count)
+                    VALUES (date(NEW.triggered_at), NEW.severity, 1)
+                    ON CONFLICT(day, severity) DO UPDATE SET count = count + 1;
+            END;
+
             CREATE TABLE IF NOT EXISTS dca_portfolios (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
@@ -120,6 +219,18 @@ class Database:
     # --- Metrics Snapshots ---
 
     def save_snapshot(self, snapshot: CombinedSnapshot):
+        if self.packed_snapshots:
+            self.conn.execute("""
+                INSERT INTO metrics_snapshots_v2 (timestamp, fear_greed_label, source, payload)
+                VALUES (?, ?, ?, ?)
+            """, (
+                snapshot.timestamp.isoformat(), snapshot.sentiment.fear_greed_label,
+                snapshot.source, snapshot.pack(),
+            ))
+            self.conn.commit()
+            logger.debug(f"Saved packed snapshot at {snapshot.timestamp.isoformat()}")
+            return
+
         d = snapshot.to_dict()
         self.conn.execute("""
             INSERT INTO metrics_snapshots
@@ -138,16 +249,62 @@ class Database:
         self.conn.commit()
         logger.debug(f"Saved snapshot at {d['timestamp']}")
 
+    @property
+    def _snapshot_table(self):
+        return "metrics_snapshots_v2" if self.packed_snapshots else "metrics_snapshots"
+
+    def _snapshot_row(self, row):
+        """Flatten a snapshot row from either table into a to_dict()-style dict."""
+        d = dict(row)
+        payload = d.pop("payload", None)
+        if payload is not None:
+            d.update(CombinedSnapshot.unpack_fields(payload))
+        return d
+
     def get_latest_snapshot(self):
-        row = self.conn.execute(
-            "SELECT * FROM metrics_snapshots ORDER BY timestamp DESC LIMIT 1"
-        ).fetchone()
-        if row is None:
-            return None
-        return CombinedSnapshot.from_dict(dict(row))
+        return next(self.iter_snapshots(limit=1), None)
+
+    def iter_snapshots(self, start=None, end=None, limit=1000):
+        """Yield snapshots newest-first without materializing the full list."""
+        if self.packed_snapshots:
+            query, params = self._snapshot_query("*", start, end, limit)
+            with self.reader() as conn:
+                for r in conn.execute(query, params):
+                    yield CombinedSnapshot.from_dict(self._snapshot_row(r))
+            return
+
+        query, params = self._snapshot_query(", ".join(SNAPSHOT_COLUMNS), start, end, limit)
+        with self.reader() as conn:
+            cur = conn.cursor()
+            cur.row_factory = _snapshot_factory
+            yield from cur.execute(query, params)
 
     def get_snapshots(self, start=None, end=None, limit=1000):
-        query = "SELECT * FROM metrics_snapshots WHERE 1=1"
+        return list(self.iter_snapshots(start, end, limit))
+
+    def get_snapshot_columns(self, columns, start=None, end=None, limit=1000):
+        """Return {column: float64 ndarray} newest-first, skipping dataclass reconstruction.
+
+        NULLs come back as NaN.
+        """
+        import numpy as np
+        unknown = set(columns) - SNAPSHOT_NUMERIC_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown snapshot columns: {sorted(unknown)}")
+        select = "payload" if self.packed_snapshots else ", ".join(columns)
+        query, params = self._snapshot_query(select, start, end, limit)
+        with self.reader() as conn:
+            rows = conn.execute(query, params).fetchall()
+        if self.packed_snapshots:
+            idx = [PACKED_FIELDS.index(c) for c in columns]
+            packed = np.frombuffer(b"".join(r[0] for r in rows), dtype="<f8")
+            arr = packed.reshape(len(rows), len(PACKED_FIELDS))[:, idx]
+        else:
+            arr = np.array([tuple(r) for r in rows], dtype=np.float64).reshape(len(rows), len(columns))
+        return {col: arr[:, i] for i, col in enumerate(columns)}
+
+    def _snapshot_query(self, select, start, end, limit):
+        query = f"SELECT {select} FROM {self._snapshot_table} WHERE 1=1"
         params = []
         if start:
             query += " AND timestamp >= ?"
@@ -157,19 +314,33 @@ class Database:
             params.append(end.isoformat() if hasattr(end, 'isoformat') else end)
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
-        rows = self.conn.execute(query, params).fetchall()
-        return [CombinedSnapshot.from_dict(dict(r)) for r in rows]
+        return query, params
 
     def get_metric_history(self, metric_column, days=30):
         """Get historical values of a specific metric column."""
-        rows = self.conn.execute(f"""
-            SELECT timestamp, {metric_column} as value
-            FROM metrics_snapshots
-            WHERE {metric_column} IS NOT NULL
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (days * 24,)).fetchall()  # Assume ~hourly snapshots, get enough
-        return [(r["timestamp"], r["value"]) for r in reversed(rows)]
+        limit = days * 24  # Assume ~hourly snapshots, get enough
+        if self.packed_snapshots:
+            history = []
+            with self.reader() as conn:
+                for r in conn.execute(
+                    "SELECT * FROM metrics_snapshots_v2 ORDER BY timestamp DESC"
+                ):
+                    value = self._snapshot_row(r).get(metric_column)
+                    if value is not None:
+                        history.append((r["timestamp"], value))
+                        if len(history) >= limit:
+                            break
+            return history[::-1]
+
+        with self.reader() as conn:
+            rows = conn.execute(f"""
+                SELECT timestamp, {metric_column} as value
+                FROM metrics_snapshots
+                WHERE {metric_column} IS NOT NULL
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+            return [(r["timestamp"], r["value"]) for r in reversed(rows)]
 
     # --- Price History ---
 
@@ -177,54 +348,116 @@ class Database:
         self.conn.executemany("""
             INSERT OR REPLACE INTO price_history (date, price_usd, market_cap, volume)
             VALUES (?, ?, ?, ?)
-        """, [(r["date"], r["price_usd"], r.get("market_cap", 0), r.get("volume", 0))
+        """, [r.as_row() if isinstance(r, PriceRecord)
+              else (r["date"], r["price_usd"], r.get("market_cap", 0), r.get("volume", 0))
               for r in records])
         self.conn.commit()
+        self._price_generation += 1
         logger.debug(f"Saved {len(records)} price history records")
 
     def get_price_history(self, start_date=None, end_date=None):
-        query = "SELECT * FROM price_history WHERE 1=1"
-        params = []
-        if start_date:
-            query += " AND date >= ?"
-            params.append(str(start_date))
-        if end_date:
-            query += " AND date <= ?"
-            params.append(str(end_date))
-        query += " ORDER BY date ASC"
-        rows = self.conn.execute(query, params).fetchall()
-        return [dict(r) for r in rows]
+        with self.reader() as conn:
+            query = "SELECT * FROM price_history WHERE 1=1"
+            params = []
+            if start_date:
+                query += " AND date >= ?"
+                params.append(str(start_date))
+            if end_date:
+                query += " AND date <= ?"
+                params.append(str(end_date))
+            query += " ORDER BY date ASC"
+            rows = conn.execute(query, params).fetchall()
+            return [dict(r) for r in rows]
 
     def get_price_for_date(self, target_date):
         """Get price for exact date or nearest prior date."""
-        row = self.conn.execute("""
-            SELECT * FROM price_history
-            WHERE date <= ? ORDER BY date DESC LIMIT 1
-        """, (str(target_date),)).fetchone()
-        return dict(row) if row else None
+        with self.reader() as conn:
+            row = conn.execute("""
+                SELECT * FROM price_history
+                WHERE date <= ? ORDER BY date DESC LIMIT 1
+            """, (str(target_date),)).fetchone()
+            return dict(row) if row else None
 
     def get_price_history_count(self):
-        row = self.conn.execute("SELECT COUNT(*) as cnt FROM price_history").fetchone()
-        return row["cnt"]
+        with self.reader() as conn:
+            row = conn.execute("SELECT COUNT(*) as cnt FROM price_history").fetchone()
+            return row["cnt"]
+
+    def _price_cache_token(self):
+        """Changes whenever price_history may have changed since the arrays were built.
+
+        Our own writes bump _price_generation; PRAGMA data_version on the writer
+        connection moves when another connection or process commits.
+        """
+        return self._price_generation, self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_price_arrays(self):
+        """Return (datetime64[D] dates, float64 prices), oldest first.
+
+        Built once and shared by every caller until price_history changes; the
+        arrays are read-only so no caller can corrupt another's view.
+        """
+        import numpy as np
+        token = self._price_cache_token()
+        cached = self._price_arrays
+        if cached is not None and cached[0] == token:
+            return cached[1], cached[2]
+
+        with self.reader() as conn:
+            rows = conn.execute("SELECT date, price_usd FROM price_history ORDER BY date ASC").fetchall()
+        dates = np.array([r[0] for r in rows], dtype="datetime64[D]")
+        prices = np.fromiter((r[1] for r in rows), dtype=np.float64, count=len(rows))
+        dates.flags.writeable = False
+        prices.flags.writeable = False
+        self._price_arrays = (token, dates, prices)
+        return dates, prices
+
+    def get_recent_prices(self, limit=200):
+        """Last `limit` daily closes as floats, oldest first."""
+        with self.reader() as conn:
+            cur = conn.execute("SELECT price_usd FROM price_history ORDER BY date DESC LIMIT ?", (limit,))
+            return [p for (p,) in cur][::-1]
+
+    def get_existing_price_dates(self):
+        """All price_history dates as a frozenset, read straight off the cursor."""
+        with self.reader() as conn:
+            return frozenset(d for (d,) in conn.execute("SELECT date FROM price_history"))
 
     def get_price_date_range(self):
-        row = self.conn.execute(
-            "SELECT MIN(date) as min_date, MAX(date) as max_date FROM price_history"
-        ).fetchone()
-        return dict(row) if row else {"min_date": None, "max_date": None}
+        with self.reader() as conn:
+            row = conn.execute(
+                "SELECT MIN(date) as min_date, MAX(date) as max_date FROM price_history"
+            ).fetchone()
+            return dict(row) if row else {"min_date": None, "max_date": None}
 
     def get_price_history_stats(self):
         """Get price history availability statistics for conditional UI rendering."""
-        try:
-            row = self.conn.execute("""
-                SELECT
-                    COUNT(DISTINCT date) as total_days,
-                    MIN(date) as earliest_date,
-                    MAX(date) as latest_date
-                FROM price_history
-            """).fetchone()
-
-            if not row or row["total_days"] == 0:
+        with self.reader() as conn:
+            try:
+                row = conn.execute("""
+                    SELECT
+                        COUNT(DISTINCT date) as total_days,
+                        MIN(date) as earliest_date,
+                        MAX(date) as latest_date
+                    FROM price_history
+                """).fetchone()
+
+                if not row or row["total_days"] == 0:
+                    return {
+                        "total_days": 0,
+                        "earliest_date": None,
+                        "latest_date": None,
+                        "has_sufficient_data": False
+                    }
+
+                return {
+                    "total_days": row["total_days"],
+                    "earliest_date": row["earliest_date"],
+                    "latest_date": row["latest_date"],
+                    "has_sufficient_data": row["total_days"] >= 365
+                }
+            except sqlite3.OperationalError:
+                # Table doesn't exist yet
                 return {
                     "total_days": 0,
                     "earliest_date": None,
@@ -232,38 +465,37 @@ class Database:
                     "has_sufficient_data": False
                 }
 
-            return {
-                "total_days": row["total_days"],
-                "earliest_date": row["earliest_date"],
-                "latest_date": row["latest_date"],
-                "has_sufficient_data": row["total_days"] >= 365
-            }
-        except sqlite3.OperationalError:
-            # Table doesn't exist yet
-            return {
-                "total_days": 0,
-                "earliest_date": None,
-                "latest_date": None,
-                "has_sufficient_data": False
-            }
-
     def has_data_for_range(self, start_date, end_date):
-        """Check if we have price data for a specific date range."""
-        try:
-            row = self.conn.execute("""
-                SELECT COUNT(*) as cnt FROM price_history
-                WHERE date >= ? AND date <= ?
-            """, (str(start_date), str(end_date))).fetchone()
-
-            # Consider "has data" if we have at least some coverage (50% of expected days)
-            from datetime import datetime
-            start = datetime.fromisoformat(str(start_date))
-            end = datetime.fromisoformat(str(end_date))
-            expected_days = (end - start).days
-
-            return row["cnt"] >= (expected_days * 0.5)
-        except (sqlite3.OperationalError, ValueError):
-            return False
+        """Check if we have price data for a specific date range.
+
+        The first/last dates present in the range are index seeks; the row
+        count is only taken when that span could reach 50% coverage.
+        """
+        with self.reader() as conn:
+            try:
+                start, end = str(start_date), str(end_date)
+                # Consider "has data" if we have at least some coverage (50% of expected days)
+                expected_days = (datetime.fromisoformat(end) - datetime.fromisoformat(start)).days
+
+                row = conn.execute("""
+                    SELECT MIN(date) as first_date, MAX(date) as last_date
+                    FROM price_history WHERE date >= ? AND date <= ?
+                """, (start, end)).fetchone()
+                if row["first_date"] is None:
+                    return expected_days <= 0
+
+                first = datetime.fromisoformat(row["first_date"])
+                last = datetime.fromisoformat(row["last_date"])
+                if (last - first).days + 1 < expected_days * 0.5:
+                    return False
+
+                row = conn.execute("""
+                    SELECT COUNT(*) as cnt FROM price_history
+                    WHERE date >= ? AND date <= ?
+                """, (row["first_date"], row["last_date"])).fetchone()
+                return row["cnt"] >= (expected_days * 0.5)
+            except (sqlite3.OperationalError, ValueError):
+                return False
 
     # --- Alert History ---
 
@@ -278,30 +510,55 @@ class Database:
             record.triggered_at.isoformat(), int(record.acknowledged),
         ))
         self.conn.commit()
+        # Compare as ISO strings, matching the ORDER BY triggered_at semantics
+        last = self._last_alert_cache.get(record.rule_id)
+        if last is None or record.triggered_at.isoformat() > last.isoformat():
+            self._last_alert_cache[record.rule_id] = record.triggered_at
 
-    def get_recent_alerts(self, limit=50):
+    def _prime_alert_cache(self):
         rows = self.conn.execute("""
-            SELECT * FROM alert_history ORDER BY triggered_at DESC LIMIT ?
-        """, (limit,)).fetchall()
-        return [dict(r) for r in rows]
+            SELECT rule_id, MAX(triggered_at) as triggered_at
+            FROM alert_history GROUP BY rule_id
+        """).fetchall()
+        self._last_alert_cache = {
+            r["rule_id"]: datetime.fromisoformat(r["triggered_at"]) for r in rows
+        }
+
+    def get_recent_alerts(self, limit=50):
+        with self.reader() as conn:
+            rows = conn.execute("""
+                SELECT * FROM alert_history ORDER BY triggered_at DESC LIMIT ?
+            """, (limit,)).fetchall()
+            return [dict(r) for r in rows]
+
+    def get_unacknowledged_alerts(self, limit=50):
+        """Newest unacknowledged alerts, served from the partial idx_alerts_unack index."""
+        with self.reader() as conn:
+            rows = conn.execute("""
+                SELECT * FROM alert_history WHERE acknowledged = 0
+                ORDER BY triggered_at DESC LIMIT ?
+            """, (limit,)).fetchall()
+            return [dict(r) for r in rows]
 
     def get_last_alert_time(self, rule_id):
-        row = self.conn.execute("""
-            SELECT triggered_at FROM alert_history
-            WHERE rule_id = ? ORDER BY triggered_at DESC LIMIT 1
-        """, (rule_id,)).fetchone()
-        if row:
-            return datetime.fromisoformat(row["triggered_at"])
-        return None
+        return self._last_alert_cache.get(rule_id)
 
     def get_alert_stats(self, days=30):
-        rows = self.conn.execute("""
-            SELECT severity, COUNT(*) as count
-            FROM alert_history
-            WHERE triggered_at >= datetime('now', ?)
-            GROUP BY severity
-        """, (f"-{days} days",)).fetchall()
-        return {r["severity"]: r["count"] for r in rows}
+        """Alert counts by severity over the last `days` days (all time if None).
+
+        Reads the trigger-maintained counter tables rather than alert_history.
+        """
+        with self.reader() as conn:
+            if days is None:
+                rows = conn.execute("SELECT severity, count FROM alert_counters").fetchall()
+            else:
+                rows = conn.execute("""
+                    SELECT severity, SUM(count) as count
+                    FROM alert_daily_counts
+                    WHERE day >= date('now', ?)
+                    GROUP BY severity
+                """, (f"-{days} days",)).fetchall()
+            return {r["severity"]: r["count"] for r in rows}
 
     def acknowledge_alert(self, alert_id):
         self.conn.execute(
@@ -327,71 +584,81 @@ class Database:
         self.conn.commit()
 
     def get_portfolio(self, portfolio_id):
-        port = self.conn.execute(
-            "SELECT * FROM dca_portfolios WHERE id = ?", (portfolio_id,)
-        ).fetchone()
-        if not port:
-            return None
-        purchases = self.conn.execute(
-            "SELECT * FROM dca_purchases WHERE portfolio_id = ? ORDER BY date ASC",
-            (portfolio_id,)
-        ).fetchall()
-        result = dict(port)
-        result["purchases"] = [dict(p) for p in purchases]
-        return result
+        with self.reader() as conn:
+            port = conn.execute(
+                "SELECT * FROM dca_portfolios WHERE id = ?", (portfolio_id,)
+            ).fetchone()
+            if not port:
+                return None
+            purchases = conn.execute(
+                "SELECT * FROM dca_purchases WHERE portfolio_id = ? ORDER BY date ASC",
+                (portfolio_id,)
+            ).fetchall()
+            result = dict(port)
+            result["purchases"] = [dict(p) for p in purchases]
+            return result
 
     def get_price_gaps(self, start_date: str, end_date: str, max_gap_days: int = 3) -> list[tuple[str, str]]:
-        """Find gaps in price_history where consecutive missing days exceed max_gap_days."""
-        from datetime import date as d, timedelta
-        rows = self.conn.execute(
-            "SELECT date FROM price_history WHERE date BETWEEN ? AND ? ORDER BY date",
-            (start_date, end_date)
-        ).fetchall()
-        existing = {r["date"] for r in rows}
-
-        gaps = []
-        start = d.fromisoformat(start_date)
-        end = d.fromisoformat(end_date)
-        gap_start = None
-        gap_len = 0
-        current = start
-
-        while current <= end:
-            ds = current.isoformat()
-            if ds not in existing:
-                if gap_start is None:
-                    gap_start = ds
-                gap_len += 1
-            else:
-                if gap_start and gap_len >= max_gap_days:
-                    gaps.append((gap_start, (current - timedelta(days=1)).isoformat()))
-                gap_start = None
-                gap_len = 0
-            current += timedelta(days=1)
-
-        if gap_start and gap_len >= max_gap_days:
-            gaps.append((gap_start, end_date))
-
-        return gaps
+        """Find gaps in price_history where consecutive missing days exceed max_gap_days.
+
+        Dates stay ISO-8601 strings throughout: they sort lexicographically in
+        chronological order, so SQLite can compare and step them without any
+        per-row parsing in Python.
+        """
+        max_gap_days = max(max_gap_days, 1)  # a gap is at least one missing day
+        with self.reader() as conn:
+            bounds = conn.execute(
+                "SELECT MIN(date) as first_date, MAX(date) as last_date "
+                "FROM price_history WHERE date BETWEEN ? AND ?",
+                (start_date, end_date)
+            ).fetchone()
+            if bounds["first_date"] is None:
+                span = conn.execute(
+                    "SELECT CAST(julianday(?) - julianday(?) AS INTEGER) + 1", (end_date, start_date)
+                ).fetchone()[0]
+                return [(start_date, end_date)] if span >= max_gap_days else []
+
+            # Leading gap, gaps between consecutive present dates, trailing gap
+            rows = conn.execute("""
+                SELECT ? as gap_start, date(?, '-1 day') as gap_end
+                WHERE julianday(?) - julianday(?) >= ?
+                UNION ALL
+                SELECT date(prev_date, '+1 day'), date(date, '-1 day') FROM (
+                    SELECT date, LAG(date) OVER (ORDER BY date) as prev_date
+                    FROM price_history WHERE date BETWEEN ? AND ?
+                )
+                WHERE julianday(date) - julianday(prev_date) - 1 >= ?
+                UNION ALL
+                SELECT date(?, '+1 day'), ?
+                WHERE julianday(?) - julianday(?) >= ?
+                ORDER BY gap_start
+            """, (
+                start_date, bounds["first_date"], bounds["first_date"], start_date, max_gap_days,
+                start_date, end_date, max_gap_days,
+                bounds["last_date"], end_date, end_date, bounds["last_date"], max_gap_days,
+            )).fetchall()
+        return [(r[0], r[1]) for r in rows]
 
     def get_nearest_snapshot(self, target_timestamp: str) -> dict | None:
         """Return the metrics_snapshot closest to target_timestamp (but not after)."""
-        row = self.conn.execute("""
-            SELECT * FROM metrics_snapshots
-            WHERE timestamp <= ?
-            ORDER BY timestamp DESC
-            LIMIT 1
-        """, (target_timestamp,)).fetchone()
-        return dict(row) if row else None
+        with self.reader() as conn:
+            row = conn.execute(f"""
+                SELECT * FROM {self._snapshot_table}
+                WHERE timestamp <= ?
+                ORDER BY timestamp DESC
+                LIMIT 1
+            """, (target_timestamp,)).fetchone()
+            return self._snapshot_row(row) if row else None
 
     def list_portfolios(self):
-        rows = self.conn.execute("""
-            SELECT p.*, COUNT(pu.id) as num_purchases,
-                   COALESCE(SUM(pu.usd_amount), 0) as total_invested,
-                   COALESCE(SUM(pu.btc_amount), 0) as total_btc
-            FROM dca_portfolios p
-            LEFT JOIN dca_purchases pu ON p.id = pu.portfolio_id
-            GROUP BY p.id
-            ORDER BY p.created_at DESC
-        """).fetchall()
-        return [dict(r) for r in rows]
+        with self.reader() as conn:
+            rows = conn.execute("""
+                SELECT p.*, COUNT(pu.id) as num_purchases,
+                       COALESCE(SUM(pu.usd_amount), 0) as total_invested,
+                       COALESCE(SUM(pu.btc_amount), 0) as total_btc
+                FROM dca_portfolios p
+                LEFT JOIN dca_purchases pu ON p.id = pu.portfolio_id
+                GROUP BY p.id
+                ORDER BY p.created_at DESC
+            """).fetchall()
+            return [dict(r) for r in rows]
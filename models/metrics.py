@@ -1,10 +1,42 @@
 """Dataclasses for Bitcoin metrics snapshots."""
+import math
+import struct
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from typing import Optional
 
+# Numeric snapshot columns in the order they are packed into a
+# metrics_snapshots_v2 payload. NULLs are stored as NaN.
+PACKED_FIELDS = (
+    "price_usd", "market_cap", "volume_24h", "change_24h_pct",
+    "hash_rate_th", "difficulty", "block_time_avg", "difficulty_change_pct",
+    "supply_circulating", "fear_greed_value", "btc_gold_ratio",
+    "btc_dominance_pct", "mvrv_ratio", "mvrv_z_score",
+)
+_PACKED = struct.Struct("<" + "d" * len(PACKED_FIELDS))
 
-@dataclass
+# Flat column order expected by CombinedSnapshot.from_row()
+SNAPSHOT_COLUMNS = (
+    "timestamp", "price_usd", "market_cap", "volume_24h", "change_24h_pct",
+    "hash_rate_th", "difficulty", "block_time_avg", "difficulty_change_pct",
+    "supply_circulating", "fear_greed_value", "fear_greed_label",
+    "btc_gold_ratio", "btc_dominance_pct", "mvrv_ratio", "mvrv_z_score", "source",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class PriceRecord:
+    """One daily price_history row as produced by the historical price sources."""
+    date: str
+    price_usd: float
+    market_cap: Optional[float] = 0
+    volume: float = 0
+
+    def as_row(self):
+        return (self.date, self.price_usd, self.market_cap, self.volume)
+
+
+@dataclass(slots=True)
 class PriceMetrics:
     price_usd: float = 0.0
     market_cap: float = 0.0
@@ -13,7 +45,7 @@ class PriceMetrics:
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class OnchainMetrics:
     hash_rate_th: float = 0.0
     difficulty: float = 0.0
@@ -23,7 +55,7 @@ class OnchainMetrics:
     supply_max: float = 21_000_000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentMetrics:
     fear_greed_value: int = 50
     fear_greed_label: str = "Neutral"
@@ -31,7 +63,7 @@ class SentimentMetrics:
     btc_dominance_pct: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ValuationMetrics:
     mvrv_ratio: Optional[float] = None
     mvrv_z_score: Optional[float] = None
@@ -39,7 +71,7 @@ class ValuationMetrics:
     mvrv_is_estimated: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CombinedSnapshot:
     price: PriceMetrics = field(default_factory=PriceMetrics)
     onchain: OnchainMetrics = field(default_factory=OnchainMetrics)
@@ -112,3 +144,39 @@ class CombinedSnapshot:
             timestamp=ts,
             source=d.get("source", "db"),
         )
+
+    @classmethod
+    def from_row(cls, row):
+        """Reconstruct from a positional tuple in SNAPSHOT_COLUMNS order (no dict round-trip)."""
+        (ts, price_usd, market_cap, volume_24h, change_24h_pct,
+         hash_rate_th, difficulty, block_time_avg, difficulty_change_pct,
+         supply_circulating, fear_greed_value, fear_greed_label,
+         btc_gold_ratio, btc_dominance_pct, mvrv_ratio, mvrv_z_score, source) = row
+        if isinstance(ts, str):
+            ts = datetime.fromisoformat(ts)
+        elif ts is None:
+            ts = datetime.now(timezone.utc)
+
+        return cls(
+            PriceMetrics(price_usd, market_cap, volume_24h, change_24h_pct, ts),
+            OnchainMetrics(hash_rate_th, difficulty, block_time_avg,
+                           difficulty_change_pct, supply_circulating),
+            SentimentMetrics(fear_greed_value, fear_greed_label, btc_gold_ratio, btc_dominance_pct),
+            ValuationMetrics(mvrv_ratio, mvrv_z_score),
+            ts,
+            source,
+        )
+
+    def pack(self):
+        """Encode the numeric fields as a fixed-width little-endian blob."""
+        d = self.to_dict()
+        return _PACKED.pack(*(math.nan if d[f] is None else d[f] for f in PACKED_FIELDS))
+
+    @staticmethod
+    def unpack_fields(payload):
+        """Decode a pack() blob into a flat dict of the numeric fields."""
+        d = {f: (None if math.isnan(v) else v)
+             for f, v in zip(PACKED_FIELDS, _PACKED.unpack(payload))}
+        if d["fear_greed_value"] is not None:
+            d["fear_greed_value"] = int(d["fear_greed_value"])
+        return d
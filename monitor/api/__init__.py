@@ -1,8 +1,9 @@
 """API client registry and orchestration."""
+import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from models.metrics import (
     PriceMetrics, OnchainMetrics, SentimentMetrics, ValuationMetrics, CombinedSnapshot
 )
@@ -11,6 +12,8 @@ from monitor.api.blockchain_info import BlockchainInfoClient
 from monitor.api.mempool import MempoolClient
 from monitor.api.fear_greed import FearGreedClient
 from monitor.api.coinmetrics import CoinMetricsClient
+from utils.http_client import HTTPClient
+from utils.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger("btcmonitor.api")
 
@@ -20,50 +23,85 @@ class APIRegistry:
         cfg = config or {}
         api_cfg = cfg.get("api", {})
 
+        # One session (TLS context, keep-alive pools) shared by every provider;
+        # rate limits and caches stay per provider.
+        self.session = HTTPClient.new_session()
+
         self.coingecko = CoinGeckoClient(
             rate_limit=api_cfg.get("coingecko", {}).get("rate_limit", 30),
             cache_ttl=api_cfg.get("coingecko", {}).get("cache_ttl", 300),
+            stale_ttl=api_cfg.get("coingecko", {}).get("stale_ttl", 600),
+            session=self.session,
+            history_cache_dir=api_cfg.get("coingecko", {}).get("history_cache_dir"),
         )
         self.blockchain = BlockchainInfoClient(
             rate_limit=api_cfg.get("blockchain_info", {}).get("rate_limit", 30),
             cache_ttl=api_cfg.get("blockchain_info", {}).get("cache_ttl", 300),
+            stale_ttl=api_cfg.get("blockchain_info", {}).get("stale_ttl", 1800),
+            session=self.session,
         )
         self.mempool = MempoolClient(
             rate_limit=api_cfg.get("mempool", {}).get("rate_limit", 60),
             cache_ttl=api_cfg.get("mempool", {}).get("cache_ttl", 120),
+            stale_ttl=api_cfg.get("mempool", {}).get("stale_ttl", 0),
+            session=self.session,
         )
         self.fear_greed = FearGreedClient(
             rate_limit=api_cfg.get("fear_greed", {}).get("rate_limit", 30),
             cache_ttl=api_cfg.get("fear_greed", {}).get("cache_ttl", 600),
+            stale_ttl=api_cfg.get("fear_greed", {}).get("stale_ttl", 3600),
+            session=self.session,
         )
         self.coinmetrics = CoinMetricsClient(
             rate_limit=api_cfg.get("coinmetrics", {}).get("rate_limit", 100),
             cache_ttl=api_cfg.get("coinmetrics", {}).get("cache_ttl", 600),
+            stale_ttl=api_cfg.get("coinmetrics", {}).get("stale_ttl", 0),
+            session=self.session,
         )
 
+        # One breaker per provider: after repeated failures its calls fail fast
+        # (CircuitOpenError) and the fetch_* fallbacks below apply immediately.
+        self.breakers = {}
+        for name, client, methods in [
+            ("coingecko", self.coingecko, ("get_current_price", "get_btc_gold_ratio",
+                                           "get_global_data", "get_coin_data")),
+            ("blockchain_info", self.blockchain, ("get_hash_rate", "get_difficulty")),
+            ("mempool", self.mempool, ("get_difficulty_adjustment",)),
+            ("fear_greed", self.fear_greed, ("get_current",)),
+            ("coinmetrics", self.coinmetrics, ("get_valuation", "get_mvrv", "get_realized_cap")),
+        ]:
+            breaker = CircuitBreaker(name)
+            self.breakers[name] = breaker
+            for method in methods:
+                setattr(client, method, breaker.wrap(getattr(client, method)))
+
+        # Shared pool for individual provider calls (bulkhead for blocking I/O)
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="api-io")
+
+    def _call_all(self, calls):
+        """Run (label, func, fallback) calls concurrently; a failed call yields its fallback."""
+        futures = [(label, self._io_pool.submit(func), fallback) for label, func, fallback in calls]
+        results = []
+        for label, future, fallback in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"{label} failed: {e}")
+                results.append(fallback)
+        return results
+
     def fetch_price_metrics(self):
         return self.coingecko.get_current_price()
 
     def fetch_onchain_metrics(self):
-        try:
-            hr = self.blockchain.get_hash_rate("30days")
-            diff = self.blockchain.get_difficulty("30days")
-        except Exception as e:
-            logger.warning(f"Blockchain.com failed: {e}")
-            hr = {"current": 0}
-            diff = {"current": 0}
-
-        try:
-            adj = self.mempool.get_difficulty_adjustment()
-        except Exception as e:
-            logger.warning(f"mempool.space failed: {e}")
-            adj = {"avg_block_time": 600, "estimated_change_pct": 0}
-
-        try:
-            coin = self.coingecko.get_coin_data()
-        except Exception as e:
-            logger.warning(f"CoinGecko coin data failed: {e}")
-            coin = {"circulating_supply": 0, "max_supply": 21000000}
+        hr, diff, adj, coin = self._call_all([
+            ("Blockchain.com hash rate", lambda: self.blockchain.get_hash_rate("30days"), {"current": 0}),
+            ("Blockchain.com difficulty", lambda: self.blockchain.get_difficulty("30days"), {"current": 0}),
+            ("mempool.space", self.mempool.get_difficulty_adjustment,
+             {"avg_block_time": 600, "estimated_change_pct": 0}),
+            ("CoinGecko coin data", self.coingecko.get_coin_data,
+             {"circulating_supply": 0, "max_supply": 21000000}),
+        ])
 
         return OnchainMetrics(
             hash_rate_th=hr.get("current", 0),
@@ -75,23 +113,11 @@ class APIRegistry:
         )
 
     def fetch_sentiment_metrics(self):
-        try:
-            fg = self.fear_greed.get_current()
-        except Exception as e:
-            logger.warning(f"Fear & Greed failed: {e}")
-            fg = {"value": 50, "label": "Neutral"}
-
-        try:
-            gold = self.coingecko.get_btc_gold_ratio()
-        except Exception as e:
-            logger.warning(f"BTC/Gold ratio failed: {e}")
-            gold = 0
-
-        try:
-            gd = self.coingecko.get_global_data()
-        except Exception as e:
-            logger.warning(f"Global data failed: {e}")
-            gd = {"btc_dominance_pct": 0}
+        fg, gold, gd = self._call_all([
+            ("Fear & Greed", self.fear_greed.get_current, {"value": 50, "label": "Neutral"}),
+            ("BTC/Gold ratio", self.coingecko.get_btc_gold_ratio, 0),
+            ("Global data", self.coingecko.get_global_data, {"btc_dominance_pct": 0}),
+        ])
 
         return SentimentMetrics(
             fear_greed_value=fg["value"],
@@ -106,8 +132,8 @@ class APIRegistry:
         is_estimated = False
 
         try:
-            mvrv = self.coinmetrics.get_mvrv()
-            realized_cap = self.coinmetrics.get_realized_cap()
+            valuation = self.coinmetrics.get_valuation()
+            mvrv, realized_cap = valuation["mvrv"], valuation["realized_cap"]
         except Exception as e:
             logger.warning(f"CoinMetrics failed: {e}")
 
@@ -123,43 +149,46 @@ class APIRegistry:
             mvrv_is_estimated=is_estimated,
         )
 
-    def fetch_all_current(self, price_history_prices=None):
-        """Fetch all metrics concurrently, assembling a CombinedSnapshot."""
-        results = {}
+    async def fetch_all_current_async(self, price_history_prices=None):
+        """Fetch all metrics concurrently on one event loop, assembling a CombinedSnapshot.
 
-        def _fetch(name, func, kwargs=None):
+        Provider clients are blocking, so each group runs via asyncio.to_thread
+        and the groups are awaited together; wall-clock is the slowest group.
+        """
+        async def _fetch(name, func):
             try:
-                return name, func(**(kwargs or {}))
+                return await asyncio.to_thread(func)
             except Exception as e:
                 logger.error(f"Failed to fetch {name}: {e}")
-                return name, None
-
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [
-                executor.submit(_fetch, "price", self.fetch_price_metrics),
-                executor.submit(_fetch, "onchain", self.fetch_onchain_metrics),
-                executor.submit(_fetch, "sentiment", self.fetch_sentiment_metrics),
-            ]
-            for future in as_completed(futures):
-                name, data = future.result()
-                results[name] = data
+                return None
+
+        price, onchain, sentiment = await asyncio.gather(
+            _fetch("price", self.fetch_price_metrics),
+            _fetch("onchain", self.fetch_onchain_metrics),
+            _fetch("sentiment", self.fetch_sentiment_metrics),
+        )
 
         # Valuation depends on price result for fallback
-        price = results.get("price") or PriceMetrics()
-        results["valuation"] = self.fetch_valuation_metrics(
+        price = price or PriceMetrics()
+        valuation = await asyncio.to_thread(
+            self.fetch_valuation_metrics,
             market_cap=price.market_cap,
             price_history_prices=price_history_prices,
         )
 
         return CombinedSnapshot(
-            price=results.get("price") or PriceMetrics(),
-            onchain=results.get("onchain") or OnchainMetrics(),
-            sentiment=results.get("sentiment") or SentimentMetrics(),
-            valuation=results.get("valuation") or ValuationMetrics(),
+            price=price,
+            onchain=onchain or OnchainMetrics(),
+            sentiment=sentiment or SentimentMetrics(),
+            valuation=valuation or ValuationMetrics(),
             timestamp=datetime.now(timezone.utc),
             source="api",
         )
 
+    def fetch_all_current(self, price_history_prices=None):
+        """Blocking wrapper around fetch_all_current_async."""
+        return asyncio.run(self.fetch_all_current_async(price_history_prices=price_history_prices))
+
     def health_check(self):
         """Test connectivity to each API."""
         checks = {}
@@ -181,8 +210,10 @@ class APIRegistry:
             ("Fear & Greed", lambda: self.fear_greed.get_current()),
         ]
 
-        for name, func in apis:
-            _, reachable, latency = _check(name, func)
+        # Probe concurrently; latency is timed inside each worker
+        futures = [self._io_pool.submit(_check, name, func) for name, func in apis]
+        for future in futures:
+            name, reachable, latency = future.result()
             checks[name] = {"reachable": reachable, "latency_ms": latency}
 
         return checks
@@ -203,5 +234,7 @@ class APIRegistry:
         return age < max_age_seconds
 
     def close(self):
+        self._io_pool.shutdown(wait=False)
         for client in [self.coingecko, self.blockchain, self.mempool, self.fear_greed, self.coinmetrics]:
             client.close()
+        self.session.close()
@@ -7,14 +7,16 @@ logger = logging.getLogger("btcmonitor.blockchain")
 
 
 class BlockchainInfoClient:
-    def __init__(self, rate_limit=30, cache_ttl=300):
+    def __init__(self, rate_limit=30, cache_ttl=300, stale_ttl=0, session=None):
         self.client = HTTPClient(
             base_url="https://api.blockchain.info",
             rate_limiter=RateLimiter(rate_limit),
             cache_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            session=session,
         )
 
-    def get_hash_rate(self, timespan="30days"):
+    def get_hash_rate(self, timespan="30days", include_history=False):
         data = self.client.get("/charts/hash-rate", params={
             "timespan": timespan,
             "format": "json",
@@ -22,6 +24,8 @@ class BlockchainInfoClient:
         values = data.get("values", [])
         if not values:
             return {"current": 0, "history": []}
+        if not include_history:
+            return {"current": float(values[-1].get("y", 0)), "history": []}
 
         # Values are in TH/s (scientific notation)
         history = []
@@ -35,7 +39,7 @@ class BlockchainInfoClient:
         current = history[-1]["hash_rate_th"] if history else 0
         return {"current": current, "history": history}
 
-    def get_difficulty(self, timespan="30days"):
+    def get_difficulty(self, timespan="30days", include_history=False):
         data = self.client.get("/charts/difficulty", params={
             "timespan": timespan,
             "format": "json",
@@ -43,6 +47,8 @@ class BlockchainInfoClient:
         values = data.get("values", [])
         if not values:
             return {"current": 0, "history": []}
+        if not include_history:
+            return {"current": float(values[-1].get("y", 0)), "history": []}
 
         history = [{"timestamp": v.get("x", 0), "difficulty": float(v.get("y", 0))}
                    for v in values]
@@ -50,7 +56,7 @@ class BlockchainInfoClient:
         return {"current": current, "history": history}
 
     def get_hash_rate_change(self, period_days=30):
-        result = self.get_hash_rate(timespan=f"{period_days}days")
+        result = self.get_hash_rate(timespan=f"{period_days}days", include_history=True)
         history = result.get("history", [])
         if len(history) < 2:
             return 0.0
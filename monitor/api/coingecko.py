@@ -1,45 +1,70 @@
 """CoinGecko API client for price, market, supply, and historical data."""
+import json
 import logging
+import os
+import tempfile
 import time
 from datetime import datetime, timezone
+from pathlib import Path
 from utils.http_client import HTTPClient
 from utils.rate_limiter import RateLimiter
-from models.metrics import PriceMetrics
+from models.metrics import PriceMetrics, PriceRecord
 
 logger = logging.getLogger("btcmonitor.coingecko")
 
 
 class CoinGeckoClient:
-    def __init__(self, rate_limit=30, cache_ttl=300):
+    def __init__(self, rate_limit=30, cache_ttl=300, stale_ttl=0, session=None, history_cache_dir=None):
         self.client = HTTPClient(
             base_url="https://api.coingecko.com/api/v3",
             rate_limiter=RateLimiter(rate_limit),
             cache_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            session=session,
         )
+        # Daily history persisted per (days, UTC date) so same-day backfills and
+        # restarts don't re-download it. None disables the disk cache.
+        self.history_cache_dir = Path(history_cache_dir) if history_cache_dir else None
+
+    # /coins/bitcoin market_data covers price, supply, ATH and the XAU quote;
+    # every method below reads it, so HTTPClient's cache and single-flight
+    # collapse them into one upstream request per cache window.
+    COIN_PARAMS = {
+        "localization": "false",
+        "tickers": "false",
+        "market_data": "true",
+        "community_data": "false",
+        "developer_data": "false",
+    }
+
+    def get_snapshot_bundle(self):
+        """Price, supply and ATH fields from a single /coins/bitcoin request."""
+        data = self.client.get("/coins/bitcoin", params=self.COIN_PARAMS)
+        md = data.get("market_data", {})
+        return {
+            "price_usd": md.get("current_price", {}).get("usd", 0),
+            "market_cap": md.get("market_cap", {}).get("usd", 0),
+            "volume_24h": md.get("total_volume", {}).get("usd", 0),
+            "change_24h_pct": md.get("price_change_percentage_24h") or 0,
+            "btc_gold_ratio": md.get("current_price", {}).get("xau", 0),
+            "circulating_supply": md.get("circulating_supply", 0),
+            "max_supply": md.get("max_supply", 21000000),
+            "ath": md.get("ath", {}).get("usd", 0),
+            "ath_date": md.get("ath_date", {}).get("usd", ""),
+        }
 
     def get_current_price(self):
-        data = self.client.get("/simple/price", params={
-            "ids": "bitcoin",
-            "vs_currencies": "usd",
-            "include_market_cap": "true",
-            "include_24hr_vol": "true",
-            "include_24hr_change": "true",
-        })
-        btc = data.get("bitcoin", {})
+        bundle = self.get_snapshot_bundle()
         return PriceMetrics(
-            price_usd=btc.get("usd", 0),
-            market_cap=btc.get("usd_market_cap", 0),
-            volume_24h=btc.get("usd_24h_vol", 0),
-            change_24h_pct=btc.get("usd_24h_change", 0),
+            price_usd=bundle["price_usd"],
+            market_cap=bundle["market_cap"],
+            volume_24h=bundle["volume_24h"],
+            change_24h_pct=bundle["change_24h_pct"],
             timestamp=datetime.now(timezone.utc),
         )
 
     def get_btc_gold_ratio(self):
-        data = self.client.get("/simple/price", params={
-            "ids": "bitcoin",
-            "vs_currencies": "xau",
-        })
-        return data.get("bitcoin", {}).get("xau", 0)
+        return self.get_snapshot_bundle()["btc_gold_ratio"]
 
     def get_global_data(self):
         data = self.client.get("/global")
@@ -50,48 +75,86 @@ class CoinGeckoClient:
         }
 
     def get_coin_data(self):
-        data = self.client.get("/coins/bitcoin", params={
-            "localization": "false",
-            "tickers": "false",
-            "community_data": "false",
-            "developer_data": "false",
-        })
-        md = data.get("market_data", {})
+        bundle = self.get_snapshot_bundle()
         return {
-            "circulating_supply": md.get("circulating_supply", 0),
-            "max_supply": md.get("max_supply", 21000000),
-            "ath": md.get("ath", {}).get("usd", 0),
-            "ath_date": md.get("ath_date", {}).get("usd", ""),
+            "circulating_supply": bundle["circulating_supply"],
+            "max_supply": bundle["max_supply"],
+            "ath": bundle["ath"],
+            "ath_date": bundle["ath_date"],
         }
 
     def get_historical_prices(self, days=365):
+        return list(self._history_by_date(days).values())
+
+    def _history_by_date(self, days):
+        """Daily records from /market_chart keyed by date (last sample per day wins)."""
+        cached = self._load_history(days)
+        if cached is not None:
+            return cached
+
         data = self.client.get("/coins/bitcoin/market_chart", params={
             "vs_currency": "usd",
             "days": str(days),
             "interval": "daily",
         })
-        records = []
-        prices = data.get("prices", [])
-        market_caps = data.get("market_caps", [])
-        volumes = data.get("total_volumes", [])
-
-        for i, (ts, price) in enumerate(prices):
-            dt = datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
-            date_str = dt.strftime("%Y-%m-%d")
-            mc = market_caps[i][1] if i < len(market_caps) else 0
-            vol = volumes[i][1] if i < len(volumes) else 0
-            records.append({
-                "date": date_str,
-                "price_usd": price,
-                "market_cap": mc,
-                "volume": vol,
-            })
-
-        # Deduplicate by date (keep last)
+        market_caps = data.get("market_caps") or []
+        volumes = data.get("total_volumes") or []
+        n_mc, n_vol = len(market_caps), len(volumes)
+
+        # Single pass; later samples for the same date overwrite earlier ones
         seen = {}
-        for r in records:
-            seen[r["date"]] = r
-        return list(seen.values())
+        for i, (ts, price) in enumerate(data.get("prices", [])):
+            y, m, d = time.gmtime(ts // 1000)[:3]
+            date_str = f"{y:04d}-{m:02d}-{d:02d}"
+            seen[date_str] = PriceRecord(
+                date_str,
+                price,
+                market_caps[i][1] if i < n_mc else 0,
+                volumes[i][1] if i < n_vol else 0,
+            )
+        self._store_history(days, seen)
+        return seen
+
+    def _history_file(self, days):
+        today = time.strftime("%Y-%m-%d", time.gmtime())
+        return self.history_cache_dir / f"market_chart_{days}d_{today}.json"
+
+    def _load_history(self, days):
+        if self.history_cache_dir is None:
+            return None
+        path = self._history_file(days)
+        try:
+            with open(path) as f:
+                rows = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable history cache {path}: {e}")
+            return None
+        logger.debug(f"History cache hit: {path}")
+        return {row[0]: PriceRecord(*row) for row in rows}
+
+    def _store_history(self, days, records):
+        if self.history_cache_dir is None or not records:
+            return
+        path = self._history_file(days)
+        try:
+            self.history_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Unique temp name: concurrent workers must not share one partial file
+            with tempfile.NamedTemporaryFile("w", dir=self.history_cache_dir, prefix=f".{path.stem}.",
+                                             suffix=".tmp", delete=False) as tmp:
+                json.dump([r.as_row() for r in records.values()], tmp)
+            try:
+                os.replace(tmp.name, path)
+            except OSError:
+                os.unlink(tmp.name)
+                raise
+            # Earlier days' files for this window are superseded
+            for old in self.history_cache_dir.glob(f"market_chart_{days}d_*.json"):
+                if old != path:
+                    old.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not write history cache {path}: {e}")
 
     def get_historical_prices_range(self, start_ts, end_ts):
         data = self.client.get("/coins/bitcoin/market_chart/range", params={
@@ -99,18 +162,12 @@ class CoinGeckoClient:
             "from": str(int(start_ts)),
             "to": str(int(end_ts)),
         })
-        records = []
-        for ts, price in data.get("prices", []):
-            dt = datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
-            records.append({
-                "date": dt.strftime("%Y-%m-%d"),
-                "price_usd": price,
-                "market_cap": 0,
-                "volume": 0,
-            })
+        # Write straight into the per-date dict (keep last) — no interim list
         seen = {}
-        for r in records:
-            seen[r["date"]] = r
+        for ts, price in data.get("prices", []):
+            y, m, d = time.gmtime(ts // 1000)[:3]
+            date_str = f"{y:04d}-{m:02d}-{d:02d}"
+            seen[date_str] = PriceRecord(date_str, price)
         return list(seen.values())
 
     def get_full_history(self, start_year=2015):
@@ -134,10 +191,8 @@ class CoinGeckoClient:
         logger.info(f"Fetching last {days_to_fetch} days of price history (free tier max: 365)...")
 
         try:
-            records = self.get_historical_prices(days=days_to_fetch)
-            for r in records:
-                all_records[r["date"]] = r
-            logger.info(f"Got {len(records)} daily price records")
+            all_records = self._history_by_date(days_to_fetch)
+            logger.info(f"Got {len(all_records)} daily price records")
         except Exception as e:
             logger.warning(f"Failed to fetch history: {e}")
 
@@ -145,7 +200,7 @@ class CoinGeckoClient:
             logger.info(f"Note: Free tier limits to 365 days. Requested {total_days} days from {start_year}. "
                        f"Upgrade to CoinGecko Pro for full history, or data will cover last ~1 year only.")
 
-        result = sorted(all_records.values(), key=lambda r: r["date"])
+        result = sorted(all_records.values(), key=lambda r: r.date)
         logger.info(f"Total historical records: {len(result)}")
         return result
 
@@ -1,6 +1,9 @@
 """CoinMetrics Community API client for MVRV and realized cap."""
 import logging
+import random
+import time
 from datetime import datetime, timezone, timedelta
+import numpy as np
 from utils.http_client import HTTPClient, APIError
 from utils.rate_limiter import RateLimiter
 
@@ -8,62 +11,90 @@ logger = logging.getLogger("btcmonitor.coinmetrics")
 
 
 class CoinMetricsClient:
-    def __init__(self, rate_limit=100, cache_ttl=600):
+    # Backoff between free-tier 403s: min(cap, base * 2**i) + uniform(0, jitter)
+    BACKOFF_BASE = 0.2
+    BACKOFF_CAP = 2.0
+    BACKOFF_JITTER = 0.2
+
+    def __init__(self, rate_limit=100, cache_ttl=600, stale_ttl=0, session=None):
         self.client = HTTPClient(
             base_url="https://community-api.coinmetrics.io",
             rate_limiter=RateLimiter(rate_limit),
             cache_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            session=session,
         )
+        self.cache_ttl = cache_ttl
+        # metric -> monotonic deadline until which it is known to be unavailable
+        self._unavailable_until = {}
+
+    def get_valuation(self, lookback_days=7):
+        """Get MVRV and realized cap from one asset-metrics series (one request per probe date)."""
+        values = self._try_with_backoff(("CapMVRVCur", "CapRealUSD"), lookback_days)
+        if values["CapMVRVCur"] is None:
+            logger.warning("CoinMetrics MVRV unavailable on free tier, using fallback")
+        return {"mvrv": values["CapMVRVCur"], "realized_cap": values["CapRealUSD"]}
 
     def get_mvrv(self, lookback_days=7):
         """Get MVRV ratio. Free tier may lag recent dates, so try progressively older."""
-        for days_back in range(0, lookback_days + 30, 7):
-            target = datetime.now(timezone.utc) - timedelta(days=days_back)
-            date_str = target.strftime("%Y-%m-%d")
-            try:
-                data = self.client.get("/v4/timeseries/asset-metrics", params={
-                    "assets": "btc",
-                    "metrics": "CapMVRVCur",
-                    "frequency": "1d",
-                    "start_time": date_str,
-                    "limit_per_asset": "1",
-                })
-                series = data.get("data", [])
-                if series:
-                    val = series[-1].get("CapMVRVCur")
-                    if val is not None:
-                        return float(val)
-            except APIError as e:
-                if e.status_code == 403:
-                    logger.debug(f"CoinMetrics 403 for {date_str}, trying older date")
-                    continue
-                raise
-        logger.warning("CoinMetrics MVRV unavailable on free tier, using fallback")
-        return None
+        val = self._try_with_backoff(("CapMVRVCur",), lookback_days)["CapMVRVCur"]
+        if val is None:
+            logger.warning("CoinMetrics MVRV unavailable on free tier, using fallback")
+        return val
 
     def get_realized_cap(self, lookback_days=7):
         """Get realized cap. Same fallback strategy as MVRV."""
-        for days_back in range(0, lookback_days + 30, 7):
-            target = datetime.now(timezone.utc) - timedelta(days=days_back)
-            date_str = target.strftime("%Y-%m-%d")
+        return self._try_with_backoff(("CapRealUSD",), lookback_days)["CapRealUSD"]
+
+    def _try_with_backoff(self, metrics, lookback_days=7):
+        """Fetch the latest value of each metric, stepping back a week per incomplete or 403 response.
+
+        All metrics are requested together; a value found at a newer date is
+        kept while older dates are probed for the rest. Sleeps with capped
+        exponential backoff plus jitter after each 403 instead of retrying
+        immediately. If the probe ends on a 403, the metric set is marked
+        unavailable for cache_ttl so later snapshots skip the probe.
+        """
+        found = dict.fromkeys(metrics)
+        key = ",".join(metrics)
+        if time.monotonic() < self._unavailable_until.get(key, 0):
+            return found
+
+        today = datetime.now(timezone.utc).date()
+        probe_dates = [(today - timedelta(days=d)).isoformat() for d in range(0, lookback_days + 21, 7)]
+
+        denied = 0
+        for date_str in probe_dates:
+            if denied:
+                time.sleep(min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** (denied - 1))
+                           + random.uniform(0, self.BACKOFF_JITTER))
             try:
                 data = self.client.get("/v4/timeseries/asset-metrics", params={
                     "assets": "btc",
-                    "metrics": "CapRealUSD",
+                    "metrics": key,
                     "frequency": "1d",
                     "start_time": date_str,
                     "limit_per_asset": "1",
                 })
-                series = data.get("data", [])
-                if series:
-                    val = series[-1].get("CapRealUSD")
-                    if val is not None:
-                        return float(val)
             except APIError as e:
                 if e.status_code == 403:
+                    logger.debug(f"CoinMetrics 403 for {key} at {date_str}, trying older date")
+                    denied += 1
                     continue
                 raise
-        return None
+            denied = 0
+            series = data.get("data", [])
+            if series:
+                row = series[-1]
+                for metric, val in found.items():
+                    if val is None and row.get(metric) is not None:
+                        found[metric] = float(row[metric])
+                if None not in found.values():
+                    return found
+
+        if denied:
+            self._unavailable_until[key] = time.monotonic() + self.cache_ttl
+        return found
 
     @staticmethod
     def estimate_mvrv(market_cap, price_history_prices):
@@ -72,12 +103,12 @@ class CoinMetricsClient:
         Uses 200-day SMA of market cap as rough realized cap proxy.
         This is an approximation - clearly flagged in output.
         """
-        if not price_history_prices or market_cap <= 0:
+        if price_history_prices is None or len(price_history_prices) == 0 or market_cap <= 0:
             return None
-        recent = price_history_prices[-200:] if len(price_history_prices) >= 200 else price_history_prices
-        avg_price = sum(recent) / len(recent)
+        recent = np.asarray(price_history_prices[-200:], dtype=np.float64)
+        avg_price = float(recent.mean())
         # Rough realized cap = avg price * circulating supply (embedded in market_cap/current_price ratio)
-        current_price = price_history_prices[-1] if price_history_prices else 1
+        current_price = float(recent[-1])
         if current_price <= 0:
             return None
         supply_est = market_cap / current_price
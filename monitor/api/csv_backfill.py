@@ -5,8 +5,11 @@ Yahoo Finance data begins (2014-09-17).
 """
 import csv
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import date
+from operator import attrgetter
 from pathlib import Path
+from models.metrics import PriceRecord
 
 logger = logging.getLogger("btcmonitor.csv_backfill")
 
@@ -16,40 +19,58 @@ DEFAULT_CSV_PATH = Path(__file__).parent.parent.parent / "data" / "seed_prices.c
 class CSVBackfill:
     def __init__(self, csv_path=None):
         self.csv_path = Path(csv_path) if csv_path else DEFAULT_CSV_PATH
+        self._records = None  # every valid row, sorted by date; parsed on first query
+        self._dates = None
 
-    def get_daily_prices(self, start_date: date, end_date: date) -> list[dict]:
+    def _load(self):
+        """Parse the whole seed file once; later queries only bisect the cached rows."""
+        records = []
+        with open(self.csv_path, "r", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            date_i, price_i = header.index("date"), header.index("price_usd")
+            vol_i = header.index("volume") if "volume" in header else None
+
+            for row in reader:
+                try:
+                    day = row[date_i]
+                    price = float(row[price_i])
+                    volume = float(row[vol_i] or 0) if vol_i is not None else 0.0
+                except (ValueError, IndexError):
+                    logger.warning(f"Skipping malformed seed row {reader.line_num}: {row}")
+                    continue
+                if price <= 0:
+                    continue
+
+                records.append(PriceRecord(day, price, None, volume))
+
+        records.sort(key=attrgetter("date"))
+        self._records = records
+        self._dates = [r.date for r in records]
+
+    def get_daily_prices(self, start_date: date, end_date: date) -> list[PriceRecord]:
         """Read seed CSV filtered to requested date range.
 
         Returns same format as YFinanceClient:
-        [{"date": "YYYY-MM-DD", "price_usd": float, "market_cap": None, "volume": float}]
+        [PriceRecord(date="YYYY-MM-DD", price_usd, market_cap=None, volume)]
         """
         if not self.csv_path.exists():
             logger.warning(f"Seed CSV not found: {self.csv_path}")
             return []
 
-        records = []
         try:
-            with open(self.csv_path, "r") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    row_date = row["date"]
-                    if row_date < str(start_date) or row_date > str(end_date):
-                        continue
-
-                    price = float(row["price_usd"])
-                    if price <= 0:
-                        continue
-
-                    records.append({
-                        "date": row_date,
-                        "price_usd": price,
-                        "market_cap": None,
-                        "volume": float(row.get("volume", 0)),
-                    })
+            if self._records is None:
+                self._load()
+            lo = bisect_left(self._dates, start_date.isoformat())
+            hi = bisect_right(self._dates, end_date.isoformat())
+            records = self._records[lo:hi]
 
             logger.info(f"CSV backfill: read {len(records)} records from seed file")
             return records
 
         except Exception as e:
             logger.warning(f"CSV backfill failed: {e}")
+            if self._records is None:
+                # Unreadable file: remember that instead of re-parsing on every query
+                self._records, self._dates = [], []
             return []
@@ -1,6 +1,6 @@
 """Alternative.me Fear & Greed Index client."""
 import logging
-from datetime import datetime, timezone
+import time
 from utils.http_client import HTTPClient
 from utils.rate_limiter import RateLimiter
 
@@ -8,11 +8,13 @@ logger = logging.getLogger("btcmonitor.feargreed")
 
 
 class FearGreedClient:
-    def __init__(self, rate_limit=30, cache_ttl=600):
+    def __init__(self, rate_limit=30, cache_ttl=600, stale_ttl=0, session=None):
         self.client = HTTPClient(
             base_url="https://api.alternative.me/fng",
             rate_limiter=RateLimiter(rate_limit),
             cache_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            session=session,
         )
 
     def get_current(self):
@@ -31,10 +33,9 @@ class FearGreedClient:
         entries = data.get("data", [])
         result = []
         for entry in entries:
-            ts = int(entry.get("timestamp", 0))
-            dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+            y, m, d = time.gmtime(int(entry.get("timestamp", 0)))[:3]
             result.append({
-                "date": dt.strftime("%Y-%m-%d"),
+                "date": f"{y:04d}-{m:02d}-{d:02d}",
                 "value": int(entry.get("value", 50)),
                 "label": entry.get("value_classification", "Neutral"),
             })
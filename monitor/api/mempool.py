@@ -7,11 +7,13 @@ logger = logging.getLogger("btcmonitor.mempool")
 
 
 class MempoolClient:
-    def __init__(self, rate_limit=60, cache_ttl=120):
+    def __init__(self, rate_limit=60, cache_ttl=120, stale_ttl=0, session=None):
         self.client = HTTPClient(
             base_url="https://mempool.space/api",
             rate_limiter=RateLimiter(rate_limit),
             cache_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            session=session,
         )
 
     def get_difficulty_adjustment(self):
@@ -5,6 +5,7 @@ No API key required. Rate limiting is handled by the library.
 """
 import logging
 from datetime import date, timedelta
+from models.metrics import PriceRecord
 
 logger = logging.getLogger("btcmonitor.yfinance")
 
@@ -13,21 +14,21 @@ class YFinanceClient:
     TICKER = "BTC-USD"
     EARLIEST_DATE = date(2014, 9, 17)
 
-    def get_daily_prices(self, start_date: date, end_date: date) -> list[dict]:
+    def get_daily_prices(self, start_date: date, end_date: date) -> list[PriceRecord]:
         """Fetch daily close prices for BTC-USD.
 
-        Returns list of {"date": "YYYY-MM-DD", "price_usd": float, "market_cap": None, "volume": float}
+        Returns list of PriceRecord(date="YYYY-MM-DD", price_usd, market_cap=None, volume)
         """
-        try:
-            import yfinance as yf
-        except ImportError:
-            logger.warning("yfinance not installed. Run: pip install yfinance")
-            return []
-
         if start_date < self.EARLIEST_DATE:
             start_date = self.EARLIEST_DATE
 
         if end_date <= start_date:
+            return []  # nothing to fetch; skip importing yfinance/pandas at all
+
+        try:
+            import yfinance as yf
+        except ImportError:
+            logger.warning("yfinance not installed. Run: pip install yfinance")
             return []
 
         try:
@@ -43,21 +44,18 @@ class YFinanceClient:
                 logger.warning("yfinance returned empty DataFrame")
                 return []
 
-            records = []
-            for idx, row in df.iterrows():
-                dt = idx.date() if hasattr(idx, 'date') else idx
-                price = float(row["Close"])
-                volume = float(row["Volume"]) if "Volume" in row else 0
-
-                if price <= 0:
-                    continue
+            dates = df.index.strftime("%Y-%m-%d").tolist()
+            closes = df["Close"].to_numpy(dtype=float).tolist()
+            if "Volume" in df.columns:
+                volumes = df["Volume"].to_numpy(dtype=float).tolist()
+            else:
+                volumes = [0] * len(closes)
 
-                records.append({
-                    "date": str(dt),
-                    "price_usd": price,
-                    "market_cap": None,
-                    "volume": volume,
-                })
+            records = [
+                PriceRecord(d, price, None, volume)
+                for d, price, volume in zip(dates, closes, volumes)
+                if price > 0
+            ]
 
             logger.info(f"yfinance: fetched {len(records)} days ({start_date} to {end_date})")
             return records
@@ -77,7 +75,7 @@ class YFinanceClient:
             latency = int((time.monotonic() - start) * 1000)
             return {
                 "status": "ok" if records else "empty",
-                "latest_date": records[-1]["date"] if records else None,
+                "latest_date": records[-1].date if records else None,
                 "latency_ms": latency,
             }
         except Exception as e:
@@ -10,11 +10,20 @@ Usage:
   result = orchestrator.run(start_year=2013, progress_callback=fn)
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import date, timedelta
+import numpy as np
+from models.metrics import PriceRecord
+from monitor.api.csv_backfill import CSVBackfill
+from monitor.api.yfinance_client import YFinanceClient
 
 logger = logging.getLogger("btcmonitor.backfill")
 
+MAX_PRICE_USD = 10_000_000  # sanity cap for fetched daily prices
+SOURCE_ORDER = ("yfinance", "csv")  # order reported in BackfillResult.sources_used
+YF_FETCH_WORKERS = 4  # concurrent gap downloads; kept small to stay under Yahoo's rate limits
+
 
 @dataclass
 class BackfillResult:
@@ -30,10 +39,9 @@ class BackfillOrchestrator:
         self.db = db
         self.config = config or {}
 
-    def get_existing_dates(self) -> set[str]:
+    def get_existing_dates(self) -> frozenset[str]:
         """Return set of all dates already in price_history."""
-        rows = self.db.get_price_history()
-        return {r["date"] for r in rows}
+        return self.db.get_existing_price_dates()
 
     def get_gaps(self, start_date: date, end_date: date, existing: set[str]) -> list[tuple[date, date]]:
         """Find date ranges with missing data.
@@ -41,31 +49,23 @@ class BackfillOrchestrator:
         Only flags gaps of 3+ consecutive missing days (weekends/holidays
         may have no trading data and that's normal).
         """
-        gaps = []
-        gap_start = None
-        gap_len = 0
-        current = start_date
-
-        while current <= end_date:
-            date_str = current.isoformat()
-            if date_str not in existing:
-                if gap_start is None:
-                    gap_start = current
-                gap_len += 1
-            else:
-                if gap_start and gap_len >= 3:
-                    gaps.append((gap_start, current - timedelta(days=1)))
-                gap_start = None
-                gap_len = 0
-            current += timedelta(days=1)
-
-        # Handle trailing gap
-        if gap_start and gap_len >= 3:
-            gaps.append((gap_start, end_date))
-
-        return gaps
-
-    def validate(self, records: list[dict]) -> list[dict]:
+        days = np.arange(np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1)
+        if days.size == 0:
+            return []
+        # Scatter existing dates into a day-indexed mask; no sort or search needed
+        offsets = (np.array(list(existing), dtype="datetime64[D]") - days[0]).astype(np.int64)
+        missing = np.ones(days.size, dtype=bool)
+        missing[offsets[(offsets >= 0) & (offsets < days.size)]] = False
+
+        # Run boundaries: +1 where a missing run starts, -1 one past where it ends
+        edges = np.diff(np.concatenate(([0], missing.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        keep = (ends - starts) >= 3
+
+        return [(days[s].item(), days[e - 1].item()) for s, e in zip(starts[keep], ends[keep])]
+
+    def validate(self, records: list[PriceRecord]) -> list[PriceRecord]:
         """Validate fetched price records.
 
         Rules:
@@ -74,17 +74,22 @@ class BackfillOrchestrator:
           - No duplicate dates (keep last)
           - Date must be a valid string
         """
-        seen = {}
-        for r in records:
-            price = r.get("price_usd", 0)
-            if price <= 0 or price >= 10_000_000:
-                logger.warning(f"Skipping invalid price: {r.get('date')} = ${price}")
-                continue
-            if not r.get("date"):
-                continue
-            seen[r["date"]] = r
-
-        return list(seen.values())
+        valid = [r for r in records if 0 < r.price_usd < MAX_PRICE_USD and r.date]
+        if len(valid) < len(records) and logger.isEnabledFor(logging.WARNING):
+            for r in records:
+                if not 0 < r.price_usd < MAX_PRICE_USD:
+                    logger.warning("Skipping invalid price: %s = $%s", r.date, r.price_usd)
+
+        return list({r.date: r for r in valid}.values())
+
+    def _save_batch(self, pending: dict, source: str, used: set[str], added: set[str]) -> int:
+        """Write one source's validated records in a single transaction."""
+        if not pending:
+            return 0
+        self.db.save_price_history(list(pending.values()))
+        added.update(pending)
+        used.add(source)
+        return len(pending)
 
     def run(self, start_year: int = 2013, progress_callback=None) -> BackfillResult:
         """Main backfill entry point.
@@ -98,7 +103,7 @@ class BackfillOrchestrator:
 
         existing = self.get_existing_dates()
         initial_count = len(existing)
-        logger.info(f"Existing price records: {initial_count}")
+        logger.info("Existing price records: %d", initial_count)
 
         gaps = self.get_gaps(target_start, target_end, existing)
         if not gaps:
@@ -107,8 +112,10 @@ class BackfillOrchestrator:
             result.date_range = (date_range["min_date"], date_range["max_date"])
             return result
 
-        logger.info(f"Found {len(gaps)} gaps to fill")
+        logger.info("Found %d gaps to fill", len(gaps))
         dates_added = 0
+        added = set()  # dates saved during this run; `existing` is the frozen DB snapshot
+        used = set()
 
         # Source 1: CoinGecko (recent 365 days — likely already in DB)
         # We don't re-fetch from CoinGecko here since routine fetches handle it.
@@ -116,28 +123,34 @@ class BackfillOrchestrator:
 
         # Source 2: yfinance (2014-09-17 onward)
         try:
-            from monitor.api.yfinance_client import YFinanceClient
             yf_client = YFinanceClient()
-
-            for gap_start, gap_end in gaps:
-                if gap_end < YFinanceClient.EARLIEST_DATE:
-                    continue  # Too old for yfinance, CSV will handle it
-
-                fetch_start = max(gap_start, YFinanceClient.EARLIEST_DATE)
-                logger.info(f"yfinance: fetching {fetch_start} to {gap_end}")
-
-                records = yf_client.get_daily_prices(fetch_start, gap_end)
-                if records:
-                    valid = self.validate(records)
-                    if valid:
-                        self.db.save_price_history(valid)
-                        dates_added += len(valid)
-                        existing.update(r["date"] for r in valid)
-                        if "yfinance" not in result.sources_used:
-                            result.sources_used.append("yfinance")
-
-                if progress_callback:
-                    progress_callback(dates_added, total_days)
+            pending = {}
+
+            # Gaps entirely before EARLIEST_DATE are left for the CSV source
+            yf_gaps = [(max(gap_start, YFinanceClient.EARLIEST_DATE), gap_end)
+                       for gap_start, gap_end in gaps if gap_end >= YFinanceClient.EARLIEST_DATE]
+
+            try:
+                with ThreadPoolExecutor(max_workers=YF_FETCH_WORKERS, thread_name_prefix="backfill-yf") as ex:
+                    futures = []
+                    for fetch_start, gap_end in yf_gaps:
+                        logger.info("yfinance: fetching %s to %s", fetch_start, gap_end)
+                        futures.append(ex.submit(yf_client.get_daily_prices, fetch_start, gap_end))
+
+                    try:
+                        for future in as_completed(futures):
+                            records = future.result()
+                            if records:
+                                for r in self.validate(records):
+                                    pending[r.date] = r
+
+                            if progress_callback:
+                                progress_callback(dates_added + len(pending), total_days)
+                    except BaseException:
+                        ex.shutdown(cancel_futures=True)  # drop queued gaps, like the old loop did
+                        raise
+            finally:
+                dates_added += self._save_batch(pending, "yfinance", used, added)
 
         except Exception as e:
             err = f"yfinance backfill failed: {e}"
@@ -146,47 +159,44 @@ class BackfillOrchestrator:
 
         # Source 3: CSV seed data (2013-01 to 2014-09)
         try:
-            from monitor.api.csv_backfill import CSVBackfill
             csv_client = CSVBackfill()
+            pending = {}
 
-            for gap_start, gap_end in gaps:
-                if gap_start >= YFinanceClient.EARLIEST_DATE:
-                    continue  # Already handled by yfinance
+            try:
+                for gap_start, gap_end in gaps:
+                    if gap_start >= YFinanceClient.EARLIEST_DATE:
+                        continue  # Already handled by yfinance
 
-                csv_end = min(gap_end, YFinanceClient.EARLIEST_DATE - timedelta(days=1))
-                logger.info(f"CSV: reading {gap_start} to {csv_end}")
+                    csv_end = min(gap_end, YFinanceClient.EARLIEST_DATE - timedelta(days=1))
+                    logger.info("CSV: reading %s to %s", gap_start, csv_end)
 
-                records = csv_client.get_daily_prices(gap_start, csv_end)
-                if records:
-                    # Only save records we don't already have
-                    new_records = [r for r in records if r["date"] not in existing]
-                    valid = self.validate(new_records)
-                    if valid:
-                        self.db.save_price_history(valid)
-                        dates_added += len(valid)
-                        existing.update(r["date"] for r in valid)
-                        if "csv" not in result.sources_used:
-                            result.sources_used.append("csv")
+                    records = csv_client.get_daily_prices(gap_start, csv_end)
+                    if records:
+                        # Only save records we don't already have
+                        new_records = [r for r in records if r.date not in existing and r.date not in added]
+                        for r in self.validate(new_records):
+                            pending[r.date] = r
 
-                if progress_callback:
-                    progress_callback(dates_added, total_days)
+                    if progress_callback:
+                        progress_callback(dates_added + len(pending), total_days)
+            finally:
+                dates_added += self._save_batch(pending, "csv", used, added)
 
         except Exception as e:
             err = f"CSV backfill failed: {e}"
             logger.warning(err)
             result.errors.append(err)
 
-        # Re-check for remaining gaps
-        existing = self.get_existing_dates()
-        remaining_gaps = self.get_gaps(target_start, target_end, existing)
+        # Re-check for remaining gaps against the snapshot plus what this run saved
+        remaining_gaps = self.get_gaps(target_start, target_end, existing | added)
 
         date_range = self.db.get_price_date_range()
         result.dates_added = dates_added
+        result.sources_used = [s for s in SOURCE_ORDER if s in used]
         result.date_range = (date_range["min_date"], date_range["max_date"])
         result.gaps_remaining = [(str(s), str(e)) for s, e in remaining_gaps]
 
-        logger.info(f"Backfill complete: {dates_added} records added. "
-                    f"Range: {result.date_range[0]} to {result.date_range[1]}. "
-                    f"Gaps remaining: {len(remaining_gaps)}")
+        logger.info("Backfill complete: %d records added. Range: %s to %s. Gaps remaining: %d",
+                    dates_added, result.date_range[0], result.date_range[1], len(remaining_gaps))
 
         return result
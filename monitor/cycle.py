@@ -1,6 +1,6 @@
 """CycleAnalyzer - Bitcoin cycle analysis based on Nadeau's framework."""
 import logging
-from datetime import date
+from datetime import timedelta
 from models.enums import CyclePhase, SignalStatus
 from utils.constants import (
     HALVING_DATES, HALVING_PRICES, CYCLE_ATH, BLOCK_REWARDS,
@@ -9,6 +9,63 @@ from utils.constants import (
 
 logger = logging.getLogger("btcmonitor.cycle")
 
+# Ordered (predicate, phase, confidence) rules for get_cycle_phase; the first
+# match wins. Predicates and callable confidences take
+# (drawdown_pct, fear_greed, mvrv, days_since_halving); mvrv may be None.
+PHASE_RULES = (
+    (lambda d, fg, mvrv, since: d > 70 or (mvrv is not None and mvrv < 0.5),
+     CyclePhase.CAPITULATION, lambda d, fg, mvrv, since: "high" if d > 70 and fg < 15 else "medium"),
+    (lambda d, fg, mvrv, since: d > 50 or (mvrv is not None and mvrv < 1.0),
+     CyclePhase.MID_BEAR, lambda d, fg, mvrv, since: "high" if fg < 25 else "medium"),
+    (lambda d, fg, mvrv, since: d > 30 and since < 365, CyclePhase.DISTRIBUTION, "medium"),
+    (lambda d, fg, mvrv, since: d > 30, CyclePhase.EARLY_BEAR, "medium"),
+    (lambda d, fg, mvrv, since: d > 15 and fg > 60, CyclePhase.LATE_BULL, "medium"),
+    (lambda d, fg, mvrv, since: d > 15, CyclePhase.DISTRIBUTION, "low"),
+    (lambda d, fg, mvrv, since: d < 5 and since < 180, CyclePhase.EARLY_BULL, "medium"),
+    (lambda d, fg, mvrv, since: d < 5 and fg > 75, CyclePhase.LATE_BULL, "high"),
+    (lambda d, fg, mvrv, since: d < 5, CyclePhase.MID_BULL, "medium"),
+    (lambda d, fg, mvrv, since: True, CyclePhase.MID_BULL, "low"),
+)
+
+# Ordered (predicate, status, interpretation template) tiers for
+# get_nadeau_signals; the first tier whose predicate accepts the value wins and
+# only its template is formatted. Each table ends in a catch-all.
+MVRV_TIERS = (
+    (lambda v: v < 1.0, SignalStatus.BULLISH, "MVRV {:.2f} - below realized value, historically undervalued"),
+    (lambda v: v > 3.0, SignalStatus.BEARISH, "MVRV {:.2f} - historically overvalued zone"),
+    (lambda v: True, SignalStatus.NEUTRAL, "MVRV {:.2f} - fair value range"),
+)
+FEAR_GREED_TIERS = (
+    (lambda v: v < 20, SignalStatus.BULLISH, "Extreme Fear ({}) - contrarian bullish, capitulation zone"),
+    (lambda v: v < 40, SignalStatus.BULLISH, "Fear ({}) - sentiment sour, opportunity per Nadeau"),
+    (lambda v: v > 80, SignalStatus.BEARISH, "Extreme Greed ({}) - distribution risk"),
+    (lambda v: v > 60, SignalStatus.BEARISH, "Greed ({}) - elevated risk"),
+    (lambda v: True, SignalStatus.NEUTRAL, "Neutral ({})"),
+)
+DRAWDOWN_TIERS = (
+    (lambda v: v > 50, SignalStatus.BULLISH, "{:.1f}% from ATH - historically strong entry zone"),
+    (lambda v: v > 30, SignalStatus.NEUTRAL, "{:.1f}% from ATH - mid-cycle correction territory"),
+    (lambda v: v < 10, SignalStatus.BEARISH, "{:.1f}% from ATH - near top, distribution risk"),
+    (lambda v: True, SignalStatus.NEUTRAL, "{:.1f}% from ATH"),
+)
+DIFFICULTY_TIERS = (
+    (lambda v: v < -10, SignalStatus.BEARISH, "Difficulty dropping {:.1f}% - miner stress"),
+    (lambda v: v > 5, SignalStatus.BULLISH, "Difficulty rising {:.1f}% - network strength"),
+    (lambda v: True, SignalStatus.NEUTRAL, "Difficulty change {:.1f}% - stable"),
+)
+DOMINANCE_TIERS = (
+    (lambda v: v > 60, SignalStatus.BULLISH, "BTC dominance {:.1f}% - flight to quality"),
+    (lambda v: v < 40, SignalStatus.BEARISH, "BTC dominance {:.1f}% - alt rotation"),
+    (lambda v: True, SignalStatus.NEUTRAL, "BTC dominance {:.1f}%"),
+)
+
+
+def _tier(value, tiers):
+    """Return (status, interpretation) from the first tier matching value."""
+    for test, status, template in tiers:
+        if test(value):
+            return status, template.format(value)
+
 
 class CycleAnalyzer:
     def __init__(self, db):
@@ -40,39 +97,12 @@ class CycleAnalyzer:
         mvrv = snapshot.valuation.mvrv_ratio if snapshot else None
 
         # Phase determination logic based on Nadeau's framework
-        if drawdown > 70 or (mvrv is not None and mvrv < 0.5):
-            phase = CyclePhase.CAPITULATION
-            confidence = "high" if (drawdown > 70 and fear_greed < 15) else "medium"
-        elif drawdown > 50 or (mvrv is not None and mvrv < 1.0):
-            phase = CyclePhase.MID_BEAR
-            confidence = "high" if fear_greed < 25 else "medium"
-        elif drawdown > 30:
-            if since < 365:
-                phase = CyclePhase.DISTRIBUTION
-                confidence = "medium"
-            else:
-                phase = CyclePhase.EARLY_BEAR
-                confidence = "medium"
-        elif drawdown > 15:
-            if fear_greed > 60:
-                phase = CyclePhase.LATE_BULL
-                confidence = "medium"
-            else:
-                phase = CyclePhase.DISTRIBUTION
-                confidence = "low"
-        elif drawdown < 5:
-            if since < 180:
-                phase = CyclePhase.EARLY_BULL
-                confidence = "medium"
-            elif fear_greed > 75:
-                phase = CyclePhase.LATE_BULL
-                confidence = "high"
-            else:
-                phase = CyclePhase.MID_BULL
-                confidence = "medium"
-        else:
-            phase = CyclePhase.MID_BULL
-            confidence = "low"
+        args = (drawdown, fear_greed, mvrv, since)
+        for matches, phase, confidence in PHASE_RULES:
+            if matches(*args):
+                if callable(confidence):
+                    confidence = confidence(*args)
+                break
 
         # Override: if very far into cycle (>3 years) and drawdown significant
         if since > 1095 and drawdown < 30 and fear_greed < 40:
@@ -91,14 +121,10 @@ class CycleAnalyzer:
         for era in [2, 3]:
             halving_date = HALVING_DATES[era]
             h_price = HALVING_PRICES.get(era, 0)
-            target_date = date(
-                halving_date.year + since // 365,
-                min(12, halving_date.month + (since % 365) // 30),
-                min(28, halving_date.day),
-            )
             ath = CYCLE_ATH.get(era, {})
             comparisons.append({
                 "cycle": f"Cycle {era} ({halving_date.year})",
+                "same_point_date": str(halving_date + timedelta(days=since)),
                 "halving_price": h_price,
                 "ath_price": ath.get("price", 0),
                 "ath_date": str(ath.get("date", "N/A")),
@@ -140,96 +166,46 @@ class CycleAnalyzer:
     def get_nadeau_signals(self, snapshot=None):
         """Evaluate Nadeau-style indicators."""
         signals = []
+        bullish = bearish = 0
         drawdown = self._get_drawdown_pct()
 
+        def emit(name, value, status, interp):
+            nonlocal bullish, bearish
+            signals.append((name, status, value, interp))
+            bullish += status == SignalStatus.BULLISH
+            bearish += status == SignalStatus.BEARISH
+
         # MVRV
         mvrv = snapshot.valuation.mvrv_ratio if snapshot else None
         if mvrv is not None:
-            if mvrv < 1.0:
-                status = SignalStatus.BULLISH
-                interp = f"MVRV {mvrv:.2f} - below realized value, historically undervalued"
-            elif mvrv > 3.0:
-                status = SignalStatus.BEARISH
-                interp = f"MVRV {mvrv:.2f} - historically overvalued zone"
-            else:
-                status = SignalStatus.NEUTRAL
-                interp = f"MVRV {mvrv:.2f} - fair value range"
-            signals.append(("MVRV Ratio", status, mvrv, interp))
+            emit("MVRV Ratio", mvrv, *_tier(mvrv, MVRV_TIERS))
         else:
-            signals.append(("MVRV Ratio", SignalStatus.NEUTRAL, None, "Data unavailable"))
+            emit("MVRV Ratio", None, SignalStatus.NEUTRAL, "Data unavailable")
 
         # Fear & Greed
         fg = snapshot.sentiment.fear_greed_value if snapshot else 50
-        if fg < 20:
-            status = SignalStatus.BULLISH
-            interp = f"Extreme Fear ({fg}) - contrarian bullish, capitulation zone"
-        elif fg < 40:
-            status = SignalStatus.BULLISH
-            interp = f"Fear ({fg}) - sentiment sour, opportunity per Nadeau"
-        elif fg > 80:
-            status = SignalStatus.BEARISH
-            interp = f"Extreme Greed ({fg}) - distribution risk"
-        elif fg > 60:
-            status = SignalStatus.BEARISH
-            interp = f"Greed ({fg}) - elevated risk"
-        else:
-            status = SignalStatus.NEUTRAL
-            interp = f"Neutral ({fg})"
-        signals.append(("Fear & Greed", status, fg, interp))
+        emit("Fear & Greed", fg, *_tier(fg, FEAR_GREED_TIERS))
 
         # Drawdown
-        if drawdown > 50:
-            status = SignalStatus.BULLISH
-            interp = f"{drawdown:.1f}% from ATH - historically strong entry zone"
-        elif drawdown > 30:
-            status = SignalStatus.NEUTRAL
-            interp = f"{drawdown:.1f}% from ATH - mid-cycle correction territory"
-        elif drawdown < 10:
-            status = SignalStatus.BEARISH
-            interp = f"{drawdown:.1f}% from ATH - near top, distribution risk"
-        else:
-            status = SignalStatus.NEUTRAL
-            interp = f"{drawdown:.1f}% from ATH"
-        signals.append(("Drawdown", status, drawdown, interp))
+        emit("Drawdown", drawdown, *_tier(drawdown, DRAWDOWN_TIERS))
 
         # Network HR trend
         hr = snapshot.onchain.hash_rate_th if snapshot else 0
         if hr > 0:
             # We'd need historical network HR for trend; use difficulty_change as proxy
             diff_change = snapshot.onchain.difficulty_change_pct if snapshot else 0
-            if diff_change < -10:
-                status = SignalStatus.BEARISH
-                interp = f"Difficulty dropping {diff_change:.1f}% - miner stress"
-            elif diff_change > 5:
-                status = SignalStatus.BULLISH
-                interp = f"Difficulty rising {diff_change:.1f}% - network strength"
-            else:
-                status = SignalStatus.NEUTRAL
-                interp = f"Difficulty change {diff_change:.1f}% - stable"
-            signals.append(("Network HR / Mining", status, diff_change, interp))
+            emit("Network HR / Mining", diff_change, *_tier(diff_change, DIFFICULTY_TIERS))
 
         # BTC/Gold ratio
         gold = snapshot.sentiment.btc_gold_ratio if snapshot else 0
         if gold > 0:
-            signals.append(("BTC/Gold Ratio", SignalStatus.NEUTRAL, gold,
-                          f"BTC = {gold:.1f} oz gold"))
+            emit("BTC/Gold Ratio", gold, SignalStatus.NEUTRAL, f"BTC = {gold:.1f} oz gold")
 
         # Dominance
         dom = snapshot.sentiment.btc_dominance_pct if snapshot else 0
-        if dom > 60:
-            status = SignalStatus.BULLISH
-            interp = f"BTC dominance {dom:.1f}% - flight to quality"
-        elif dom < 40:
-            status = SignalStatus.BEARISH
-            interp = f"BTC dominance {dom:.1f}% - alt rotation"
-        else:
-            status = SignalStatus.NEUTRAL
-            interp = f"BTC dominance {dom:.1f}%"
-        signals.append(("Dominance", status, dom, interp))
+        emit("Dominance", dom, *_tier(dom, DOMINANCE_TIERS))
 
         # Overall bias
-        bullish = sum(1 for _, s, _, _ in signals if s == SignalStatus.BULLISH)
-        bearish = sum(1 for _, s, _, _ in signals if s == SignalStatus.BEARISH)
         if bullish > bearish + 1:
             overall = SignalStatus.BULLISH
         elif bearish > bullish + 1:
@@ -246,13 +222,12 @@ class CycleAnalyzer:
 
     def get_supply_dynamics(self, current_price=None):
         """Estimate % of supply in profit using price history."""
-        history = self.db.get_price_history()
-        if not history or current_price is None:
+        _, prices = self.db.get_price_arrays()
+        if not prices.size or current_price is None:
             return {"pct_in_profit": None, "note": "Insufficient data"}
 
-        prices = [r["price_usd"] for r in history]
-        in_profit = sum(1 for p in prices if p <= current_price)
-        total = len(prices)
+        in_profit = int((prices <= current_price).sum())
+        total = int(prices.size)
 
         return {
             "pct_in_profit": round(in_profit / total * 100, 1) if total > 0 else None,
@@ -261,17 +236,12 @@ class CycleAnalyzer:
         }
 
     def _get_drawdown_pct(self):
-        history = self.db.get_price_history()
-        if not history:
-            return 0
-        ath = max(r["price_usd"] for r in history)
-        current = history[-1]["price_usd"]
+        _, prices = self.db.get_price_arrays()
+        ath = float(prices.max()) if prices.size else 0
         if ath == 0:
             return 0
-        return ((ath - current) / ath) * 100
+        return ((ath - float(prices[-1])) / ath) * 100
 
     def _get_current_price(self):
-        history = self.db.get_price_history()
-        if not history:
-            return 0
-        return history[-1]["price_usd"]
+        _, prices = self.db.get_price_arrays()
+        return float(prices[-1]) if prices.size else 0
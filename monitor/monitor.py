@@ -6,6 +6,8 @@ from monitor.api import APIRegistry
 
 logger = logging.getLogger("btcmonitor.monitor")
 
+MVRV_FALLBACK_DAYS = 200  # window of the SMA CoinMetricsClient.estimate_mvrv uses
+
 
 class BitcoinMonitor:
     def __init__(self, db, api, config=None):
@@ -16,8 +18,7 @@ class BitcoinMonitor:
     def fetch_and_store(self):
         """Fetch current metrics from all APIs and save to DB."""
         # Get recent prices for MVRV fallback
-        price_history = self.db.get_price_history()
-        prices = [r["price_usd"] for r in price_history[-200:]] if price_history else None
+        prices = self.db.get_recent_prices(MVRV_FALLBACK_DAYS) or None
 
         snapshot = self.api.fetch_all_current(price_history_prices=prices)
         self.db.save_snapshot(snapshot)
@@ -40,32 +41,45 @@ class BitcoinMonitor:
         """Get historical values for a metric from snapshots table."""
         return self.db.get_metric_history(metric_name, days)
 
-    def get_price_change(self, period_days):
-        """Calculate price change over a period from price_history."""
-        history = self.db.get_price_history()
-        if len(history) < 2:
+    def get_price_change(self, period_days, history=None):
+        """Calculate price change over a period from price_history.
+
+        Pass `history` (from db.get_price_history()) to reuse an existing read;
+        otherwise the shared price arrays are used.
+        """
+        if history is None:
+            _, prices = self.db.get_price_arrays()
+        else:
+            prices = [r["price_usd"] for r in history]
+        if len(prices) < 2:
             return None
-        target_idx = max(0, len(history) - period_days)
-        old_price = history[target_idx]["price_usd"]
-        new_price = history[-1]["price_usd"]
+        old_price = float(prices[max(0, len(prices) - period_days)])
+        new_price = float(prices[-1])
         if old_price == 0:
             return None
         return ((new_price - old_price) / old_price) * 100
 
-    def get_drawdown_from_ath(self):
-        """Find ATH and compute current drawdown."""
-        history = self.db.get_price_history()
-        if not history:
+    def get_drawdown_from_ath(self, history=None):
+        """Find ATH and compute current drawdown (optionally from an already-read history)."""
+        import numpy as np
+
+        if history is None:
+            dates, prices = self.db.get_price_arrays()
+        else:
+            dates = np.array([r["date"] for r in history], dtype="datetime64[D]")
+            prices = np.fromiter((r["price_usd"] for r in history), dtype=np.float64, count=len(history))
+        if not prices.size:
             return {"ath_price": 0, "ath_date": "N/A", "current_price": 0, "drawdown_pct": 0}
 
-        ath_record = max(history, key=lambda r: r["price_usd"])
-        current = history[-1]
+        ath_idx = int(prices.argmax())
+        ath_price = float(prices[ath_idx])
+        current_price = float(prices[-1])
 
-        drawdown = ((ath_record["price_usd"] - current["price_usd"]) / ath_record["price_usd"]) * 100
+        drawdown = ((ath_price - current_price) / ath_price) * 100
         return {
-            "ath_price": ath_record["price_usd"],
-            "ath_date": ath_record["date"],
-            "current_price": current["price_usd"],
+            "ath_price": ath_price,
+            "ath_date": str(dates[ath_idx]),
+            "current_price": current_price,
             "drawdown_pct": drawdown,
         }
 
@@ -111,7 +125,7 @@ class BitcoinMonitor:
             progress_callback: fn(dates_added, total_needed) or fn(count)
         """
         existing = self.db.get_price_date_range()
-        logger.info(f"Existing data: {existing['min_date']} to {existing['max_date']}")
+        logger.info("Existing data: %s to %s", existing["min_date"], existing["max_date"])
 
         if full:
             from monitor.backfill import BackfillOrchestrator
@@ -1,18 +1,21 @@
 """Background scheduler for periodic metric fetching."""
 import logging
 import threading
-import schedule
 import time
 
 logger = logging.getLogger("btcmonitor.scheduler")
 
 
 class MonitorScheduler:
+    # Longest idle wait between loop passes, so the Sunday check still runs
+    MAX_WAIT = 60
+
     def __init__(self, monitor, interval_seconds=900):
         self.monitor = monitor
         self.interval = interval_seconds
         self._thread = None
         self._running = False
+        self._stop_event = threading.Event()
         self._callbacks = []
         self._weekly_callbacks = []
         self._last_weekly_send = None
@@ -31,29 +34,31 @@ class MonitorScheduler:
         if self._running:
             return
         self._running = True
-
-        schedule.every(self.interval).seconds.do(self._fetch_job)
+        self._stop_event.clear()
 
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
-        logger.info(f"Scheduler started (every {self.interval}s)")
+        logger.info("Scheduler started (every %ss)", self.interval)
 
     def stop(self):
         """Stop background fetching."""
         self._running = False
-        schedule.clear()
+        self._stop_event.set()  # wakes the loop immediately
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
         logger.info("Scheduler stopped")
 
     def _run_loop(self):
-        # Do an initial fetch immediately
-        self._fetch_job()
+        # First fetch runs immediately, then every `interval` seconds
+        next_fetch = time.monotonic()
         while self._running:
-            schedule.run_pending()
+            now = time.monotonic()
+            if now >= next_fetch:
+                self._fetch_job()
+                next_fetch = now + self.interval
             self._check_weekly()
-            time.sleep(1)
+            self._stop_event.wait(timeout=min(next_fetch - time.monotonic(), self.MAX_WAIT))
 
     def _check_weekly(self):
         """Fire weekly callbacks once on Sundays."""
@@ -65,7 +70,7 @@ class MonitorScheduler:
                 try:
                     cb()
                 except Exception as e:
-                    logger.warning(f"Weekly callback error: {e}")
+                    logger.warning("Weekly callback error: %s", e)
 
     def _fetch_job(self):
         try:
@@ -75,9 +80,9 @@ class MonitorScheduler:
                 try:
                     cb(snapshot)
                 except Exception as e:
-                    logger.warning(f"Callback error: {e}")
+                    logger.warning("Callback error: %s", e)
         except Exception as e:
             self._consecutive_failures += 1
-            logger.error(f"Fetch failed ({self._consecutive_failures} consecutive): {e}")
+            logger.error("Fetch failed (%d consecutive): %s", self._consecutive_failures, e)
             if self._consecutive_failures >= 5:
                 logger.critical("5+ consecutive fetch failures!")
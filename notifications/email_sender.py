@@ -2,7 +2,7 @@
 SMTP email sender for Bitcoin Cycle Monitor.
 
 Handles:
-  - SMTP connection with TLS
+  - SMTP connection with TLS, kept open and reused across sends
   - MIME multipart construction (HTML + plaintext fallback)
   - Base64 image embedding for charts
   - Credential management (env vars > config file)
@@ -11,8 +11,13 @@ No external dependencies beyond Python stdlib (email, smtplib, ssl).
 """
 import os
 import ssl
+import base64
+import time
 import smtplib
 import logging
+import threading
+from functools import lru_cache
+from email import encoders
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.image import MIMEImage
@@ -20,6 +25,42 @@ from email.utils import formataddr, formatdate
 
 logger = logging.getLogger("btcmonitor.notifications.email_sender")
 
+# A reused connection idle longer than this is checked with NOOP before sending
+SMTP_KEEPALIVE_CHECK = 60
+
+# Alert email bodies, filled with str.format by EmailSender.send_alert
+ALERT_HTML_TEMPLATE = """
+        <div style="font-family: system-ui, sans-serif; max-width: 500px; margin: 0 auto;
+                    padding: 20px; background: #FFFFFF; color: #1E272E; border-radius: 12px;">
+            <h2 style="color: #F7931A; margin-top: 0;">Bitcoin Alert</h2>
+            <div style="background: #F0F1F6; padding: 16px; border-radius: 8px;
+                        border-left: 4px solid {severity_color};">
+                <h3 style="margin-top: 0; color: {severity_color};">
+                    {severity}: {rule_name}
+                </h3>
+                <p>{message}</p>
+                {metric_html}
+            </div>
+            <p style="color: #636E72; font-size: 12px; margin-top: 16px;">
+                Bitcoin Cycle Monitor &mdash; automated alert
+            </p>
+        </div>
+        """
+ALERT_TEXT_TEMPLATE = "{severity}: {rule_name}\n{message}"
+ALERT_METRIC_HTML = '<p style="color: #888;">Metric value: {}</p>'
+# severity -> (subject prefix, accent color)
+ALERT_SEVERITY_STYLE = {
+    "CRITICAL": ("[CRITICAL]", "#FF1744"),
+    "WARNING": ("[WARNING]", "#FFC107"),
+}
+ALERT_DEFAULT_STYLE = ("[INFO]", "#FFC107")
+
+
+@lru_cache(maxsize=8)
+def _base64_payload(png_bytes: bytes) -> str:
+    """MIME base64 body for an inline image; identical charts are encoded once."""
+    return base64.encodebytes(png_bytes).decode("ascii")
+
 
 class EmailSender:
     """
@@ -28,6 +69,9 @@ class EmailSender:
     Credential resolution order:
       1. Environment variables: BTC_MONITOR_SMTP_USER, BTC_MONITOR_SMTP_PASS
       2. Config file: config.email.smtp_username, config.email.smtp_password
+
+    The authenticated SMTP connection is opened on first send and reused;
+    use the sender as a context manager (or call close()) to end it.
     """
 
     def __init__(self, config: dict):
@@ -35,6 +79,7 @@ class EmailSender:
         self.smtp_host = email_config.get("smtp_host", "smtp.gmail.com")
         self.smtp_port = email_config.get("smtp_port", 587)
         self.use_tls = email_config.get("use_tls", True)
+        self.max_messages_per_conn = email_config.get("max_messages_per_conn", 100)
         self.from_address = email_config.get("from_address", "")
         self.to_address = email_config.get("to_address", "")
         self.from_name = email_config.get("from_name", "Bitcoin Monitor")
@@ -48,11 +93,30 @@ class EmailSender:
             "BTC_MONITOR_SMTP_PASS",
             email_config.get("smtp_password", ""),
         )
+        # Settings are fixed after construction, so the check is done once
+        self._is_configured = all((self.smtp_host, self.from_address, self.to_address,
+                                   self.username, self.password))
+
+        self._ssl_context = None  # built on first STARTTLS, then reused for every reconnect
+        self._smtp = None
+        self._smtp_last_used = 0.0
+        self._smtp_sent = 0  # messages sent on the current connection
+        self._smtp_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """QUIT the persistent SMTP connection, if one is open."""
+        with self._smtp_lock:
+            self._drop_server()
 
     def is_configured(self) -> bool:
         """Check if all required SMTP fields are present."""
-        return all([self.smtp_host, self.from_address, self.to_address,
-                    self.username, self.password])
+        return self._is_configured
 
     def send_digest(
         self,
@@ -90,7 +154,9 @@ class EmailSender:
         # Inline chart images
         if chart_images:
             for cid_name, png_bytes in chart_images:
-                img = MIMEImage(png_bytes, _subtype="png")
+                img = MIMEImage(png_bytes, _subtype="png", _encoder=encoders.encode_noop)
+                img.set_payload(_base64_payload(png_bytes))
+                img["Content-Transfer-Encoding"] = "base64"
                 img.add_header("Content-ID", f"<{cid_name}>")
                 img.add_header("Content-Disposition", "inline", filename=f"{cid_name}.png")
                 msg.attach(img)
@@ -107,53 +173,73 @@ class EmailSender:
         """Send a single alert email (for CRITICAL alerts)."""
         if not self.is_configured():
             return False
+        return self._send(self.build_alert(rule_name, severity, message, metric_value))
 
-        severity_prefix = {"CRITICAL": "[CRITICAL]", "WARNING": "[WARNING]"}.get(severity, "[INFO]")
+    def build_alert(
+        self,
+        rule_name: str,
+        severity: str,
+        message: str,
+        metric_value: float = None,
+    ) -> MIMEMultipart:
+        """Construct an alert email without sending it (see send_batch)."""
+        severity_prefix, severity_color = ALERT_SEVERITY_STYLE.get(severity, ALERT_DEFAULT_STYLE)
         subject = f"{severity_prefix} BTC Monitor: {rule_name}"
 
-        metric_html = f'<p style="color: #888;">Metric value: {metric_value}</p>' if metric_value is not None else ""
-        severity_color = "#FF1744" if severity == "CRITICAL" else "#FFC107"
+        metric_html = ALERT_METRIC_HTML.format(metric_value) if metric_value is not None else ""
 
-        html = f"""
-        <div style="font-family: system-ui, sans-serif; max-width: 500px; margin: 0 auto;
-                    padding: 20px; background: #FFFFFF; color: #1E272E; border-radius: 12px;">
-            <h2 style="color: #F7931A; margin-top: 0;">Bitcoin Alert</h2>
-            <div style="background: #F0F1F6; padding: 16px; border-radius: 8px;
-                        border-left: 4px solid {severity_color};">
-                <h3 style="margin-top: 0; color: {severity_color};">
-                    {severity}: {rule_name}
-                </h3>
-                <p>{message}</p>
-                {metric_html}
-            </div>
-            <p style="color: #636E72; font-size: 12px; margin-top: 16px;">
-                Bitcoin Cycle Monitor &mdash; automated alert
-            </p>
-        </div>
-        """
+        html = ALERT_HTML_TEMPLATE.format(
+            severity_color=severity_color, severity=severity, rule_name=rule_name,
+            message=message, metric_html=metric_html,
+        )
 
         msg = MIMEMultipart("alternative")
         msg["From"] = formataddr((self.from_name, self.from_address))
         msg["To"] = self.to_address
         msg["Subject"] = subject
         msg["Date"] = formatdate(localtime=True)
-        msg.attach(MIMEText(f"{severity}: {rule_name}\n{message}", "plain"))
+        msg.attach(MIMEText(ALERT_TEXT_TEMPLATE.format(severity=severity, rule_name=rule_name, message=message),
+                            "plain"))
         msg.attach(MIMEText(html, "html", "utf-8"))
+        return msg
 
-        return self._send(msg)
+    def send_batch(self, msgs: list) -> list:
+        """Send several constructed messages back to back over one SMTP session.
+
+        The connection lock is held for the whole batch. Once a third of the
+        batch has failed the rest is abandoned, so a broken server is not
+        retried for every queued message.
+
+        Returns:
+            One bool per message; abandoned messages are reported False.
+        """
+        if not self.is_configured():
+            logger.warning("Email not configured - skipping batch send")
+            return [False] * len(msgs)
+
+        max_failures = max(1, -(-len(msgs) // 3))
+        results = []
+        failures = 0
+        with self._smtp_lock:
+            for msg in msgs:
+                ok = self._send_locked(msg)
+                results.append(ok)
+                failures += not ok
+                if failures >= max_failures and len(results) < len(msgs):
+                    logger.error(f"Email batch aborted after {failures} failures; "
+                                 f"{len(msgs) - len(results)} messages not sent")
+                    break
+        return results + [False] * (len(msgs) - len(results))
 
     def test_connection(self) -> dict:
         """Test SMTP connectivity without sending an email."""
         try:
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10) as server:
-                server.ehlo()
-                if self.use_tls:
-                    server.starttls(context=context)
-                    server.ehlo()
-                server.login(self.username, self.password)
+            server = self._connect(timeout=10)
+            try:
                 return {"status": "ok", "message": "SMTP connection successful",
                         "server_response": str(server.noop())}
+            finally:
+                server.quit()
         except smtplib.SMTPAuthenticationError as e:
             return {"status": "error", "message": f"Authentication failed: {e}"}
         except smtplib.SMTPConnectError as e:
@@ -161,17 +247,66 @@ class EmailSender:
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
-    def _send(self, msg: MIMEMultipart) -> bool:
-        """Internal: send a constructed MIME message via SMTP."""
+    def _connect(self, timeout: int = 30) -> smtplib.SMTP:
+        """Open a new connection: EHLO, optional STARTTLS, LOGIN."""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=timeout)
         try:
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
+            server.ehlo()
+            if self.use_tls:
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                server.starttls(context=self._ssl_context)
                 server.ehlo()
-                if self.use_tls:
-                    server.starttls(context=context)
-                    server.ehlo()
-                server.login(self.username, self.password)
-                server.send_message(msg)
+            server.login(self.username, self.password)
+        except BaseException:
+            server.close()
+            raise
+        return server
+
+    def _get_server(self) -> smtplib.SMTP:
+        """Return the live connection, reconnecting if dropped, stale, or at its message cap."""
+        if self._smtp is not None and self._smtp_sent >= self.max_messages_per_conn:
+            self._drop_server()
+        if self._smtp is not None and time.monotonic() - self._smtp_last_used > SMTP_KEEPALIVE_CHECK:
+            try:
+                code, _ = self._smtp.noop()
+                if code != 250:
+                    self._drop_server()
+            except (smtplib.SMTPException, OSError):
+                self._drop_server()
+        if self._smtp is None:
+            self._smtp = self._connect()
+            self._smtp_sent = 0
+        return self._smtp
+
+    def _drop_server(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def _send(self, msg: MIMEMultipart) -> bool:
+        """Internal: send a constructed MIME message over the shared SMTP connection."""
+        with self._smtp_lock:
+            return self._send_locked(msg)
+
+    def _send_locked(self, msg: MIMEMultipart) -> bool:
+        """_send body; caller holds _smtp_lock."""
+        try:
+            reused = self._smtp is not None
+            try:
+                self._get_server().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                if not reused:
+                    raise
+                # Server closed the idle connection under us; reconnect once
+                self._smtp = None
+                self._get_server().send_message(msg)
+            self._smtp_last_used = time.monotonic()
+            self._smtp_sent += 1
             logger.info(f"Email sent to {self.to_address}: {msg['Subject']}")
             return True
         except smtplib.SMTPAuthenticationError:
@@ -182,4 +317,5 @@ class EmailSender:
             return False
         except Exception as e:
             logger.error(f"Email send failed: {e}")
+            self._drop_server()  # connection state unknown; start fresh next time
             return False
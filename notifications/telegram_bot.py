@@ -1,22 +1,65 @@
 """Telegram Bot API client for Bitcoin Cycle Monitor.
 
-Uses raw HTTP POST via requests — no extra dependency needed.
+Uses raw HTTP POST via requests — no extra dependency needed. Calls go over
+one keep-alive session, so a run of messages pays for a single TLS handshake.
 """
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
+from utils.action_engine import format_action_markdown
+from utils.http_client import HTTPClient
+from utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger("btcmonitor.telegram")
 
 TELEGRAM_API = "https://api.telegram.org/bot{token}"
 
+# Bot API limits: ~30 messages/s overall and 1 message/s into any one chat
+GLOBAL_MESSAGES_PER_SEC = 30
+CHAT_MESSAGES_PER_SEC = 1
+
 
 class TelegramBot:
     """Thin wrapper around Telegram Bot API."""
 
-    def __init__(self, bot_token: str, chat_id: str):
+    def __init__(self, bot_token: str, chat_id: str, session=None):
         self.bot_token = bot_token
         self.chat_id = str(chat_id)
         self.base_url = TELEGRAM_API.format(token=bot_token)
+        # A session passed in is shared with other clients and closed by its owner
+        self._owns_session = session is None
+        self.session = session or HTTPClient.new_session()
+
+        # Client-side pacing so sends stay under the limits instead of drawing 429s
+        self._global_limiter = RateLimiter(GLOBAL_MESSAGES_PER_SEC * 60, burst=GLOBAL_MESSAGES_PER_SEC)
+        self._chat_limiters = {}
+        self._limiter_lock = threading.Lock()
+        self._resume_at = 0.0  # monotonic time a 429 retry_after told us to wait until
+        # Single background worker for send_message_async, created on first use
+        self._sender = None
+
+    def _pace(self, chat_id: str):
+        """Block until a message to chat_id is within the Bot API rate limits."""
+        with self._limiter_lock:
+            limiter = self._chat_limiters.get(chat_id)
+            if limiter is None:
+                limiter = self._chat_limiters[chat_id] = RateLimiter(CHAT_MESSAGES_PER_SEC * 60,
+                                                                     burst=CHAT_MESSAGES_PER_SEC)
+        limiter.wait()
+        self._global_limiter.wait()
+        pause = self._resume_at - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+
+    def close(self):
+        """Flush queued async sends, then release the keep-alive connection."""
+        if self._sender is not None:
+            self._sender.shutdown(wait=True)
+            self._sender = None
+        if self._owns_session:
+            self.session.close()
 
     # ── core API ─────────────────────────────────────
 
@@ -30,7 +73,18 @@ class TelegramBot:
             "parse_mode": parse_mode,
         }
         try:
-            resp = requests.post(url, json=payload, timeout=30)
+            for attempt in range(2):
+                self._pace(payload["chat_id"])
+                resp = self.session.post(url, json=payload, timeout=30)
+                if resp.status_code != 429 or attempt:
+                    break
+                # Flood control: hold every send from this bot for retry_after, then retry once
+                try:
+                    retry_after = resp.json()["parameters"]["retry_after"]
+                except (ValueError, KeyError, TypeError):
+                    retry_after = 1
+                logger.warning("Telegram rate limited, retrying in %ss", retry_after)
+                self._resume_at = time.monotonic() + retry_after
             resp.raise_for_status()
             data = resp.json()
             if not data.get("ok"):
@@ -40,10 +94,22 @@ class TelegramBot:
             logger.error("Telegram send failed: %s", e)
             raise
 
+    def send_message_async(self, text: str, chat_id: str = None,
+                           parse_mode: str = "Markdown") -> Future:
+        """Queue a message for the background sender and return its Future.
+
+        One worker drains the queue, so messages keep their order and the
+        caller never waits on pacing or the HTTP round-trip.
+        """
+        with self._limiter_lock:
+            if self._sender is None:
+                self._sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telegram-send")
+        return self._sender.submit(self.send_message, text, chat_id, parse_mode)
+
     def verify_token(self) -> dict:
         """Verify bot token via getMe endpoint."""
         url = f"{self.base_url}/getMe"
-        resp = requests.get(url, timeout=10)
+        resp = self.session.get(url, timeout=10)
         resp.raise_for_status()
         return resp.json()
 
@@ -56,10 +122,7 @@ class TelegramBot:
 
     def send_action(self, action_rec) -> dict:
         """Send an ActionRecommendation."""
-        from utils.action_engine import ActionEngine
-        engine = ActionEngine.__new__(ActionEngine)
-        text = engine.format_markdown(action_rec)
-        return self.send_message(text)
+        return self.send_message(format_action_markdown(action_rec))
 
     def send_alert(self, alert_text: str) -> dict:
         """Send a pre-formatted alert message."""
@@ -95,10 +158,13 @@ class TelegramBot:
             ]
 
         if edu:
+            content = edu.get("content", "") or ""
+            # First paragraph, capped at 200 chars; only the first 201 chars are scanned
+            cut = content.find("\n\n", 0, 201)
             lines += [
                 "",
                 f"_{edu.get('title', '')}_",
-                (edu.get("content", "") or "").split("\n\n")[0][:200],
+                content[:cut if cut >= 0 else 200],
             ]
 
         return "\n".join(lines)
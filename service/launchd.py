@@ -7,17 +7,47 @@ Manages two launchd user agents:
 
 Plist files are installed to ~/Library/LaunchAgents/
 Log files go to ~/Library/Logs/bitcoin-monitor/
+Log rotation is handed to newsyslog when /etc/newsyslog.d is writable;
+otherwise rotate_logs() trims the logs in-process.
 """
 
+import grp
 import os
 import plistlib
+import pwd
+import re
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 
 FETCH_LABEL = "com.bitcoin-monitor.fetch"
 DIGEST_LABEL = "com.bitcoin-monitor.digest"
 PLIST_DIR = Path.home() / "Library" / "LaunchAgents"
 LOG_DIR = Path.home() / "Library" / "Logs" / "bitcoin-monitor"
+NEWSYSLOG_CONF = Path("/etc/newsyslog.d") / "bitcoin-monitor.conf"
+LOG_NAMES = ("fetch.log", "digest.log")
+
+# The two fields status() reads from `launchctl list <label>` output
+_LAUNCHCTL_FIELDS = re.compile(rb'"(PID|LastExitStatus)"\s*=\s*(-?\d+);')
+
+
+def _tail_lines(path: Path, n_lines: int, block: int = 8192) -> list:
+    """Last n_lines of a log, as read_text().strip().split("\n") would give them.
+
+    Reads backward from the end in `block`-sized chunks and stops once enough
+    newlines are buffered, so only the tail of a large log is ever read.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        while pos > 0 and data.rstrip().count(b"\n") < n_lines:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.decode("utf-8", errors="replace").strip().split("\n")[-n_lines:]
 
 
 class LaunchdManager:
@@ -43,7 +73,7 @@ class LaunchdManager:
             "StartInterval": interval_minutes * 60,
             "RunAtLoad": True,
             "WorkingDirectory": str(self.project_dir),
-            "EnvironmentVariables": self._get_env_vars(),
+            "EnvironmentVariables": dict(self._env_vars),
             "StandardOutPath": str(LOG_DIR / "fetch.log"),
             "StandardErrorPath": str(LOG_DIR / "fetch.log"),
             "Nice": 10,
@@ -66,15 +96,39 @@ class LaunchdManager:
                 "Minute": 0,
             },
             "WorkingDirectory": str(self.project_dir),
-            "EnvironmentVariables": self._get_env_vars(),
+            "EnvironmentVariables": dict(self._env_vars),
             "StandardOutPath": str(LOG_DIR / "digest.log"),
             "StandardErrorPath": str(LOG_DIR / "digest.log"),
             "Nice": 10,
             "ProcessType": "Background",
         }
 
-    def _get_env_vars(self) -> dict:
-        """Collect environment variables to pass to launchd jobs."""
+    def generate_newsyslog_conf(self, max_size_mb: int = 10, keep: int = 5) -> str:
+        """newsyslog.d entries rotating both logs at max_size_mb, keeping `keep` bzip2'd copies.
+
+        Logs are recreated owned by the installing user so the agents can keep
+        writing to them; N because there is no daemon to signal, launchd
+        reopens the path on each job run.
+        """
+        owner = f"{pwd.getpwuid(os.getuid()).pw_name}:{grp.getgrgid(os.getgid()).gr_name}"
+        lines = ["# logfilename\t[owner:group]\tmode\tcount\tsize(KB)\twhen\tflags"]
+        for log_name in LOG_NAMES:
+            lines.append(f"{LOG_DIR / log_name}\t{owner}\t644\t{keep}\t{max_size_mb * 1024}\t*\tNJ")
+        return "\n".join(lines) + "\n"
+
+    def _install_newsyslog(self) -> str:
+        conf_dir = NEWSYSLOG_CONF.parent
+        if not conf_dir.is_dir() or not os.access(conf_dir, os.W_OK):
+            return f"skipped: {conf_dir} not writable; using built-in rotation"
+        try:
+            NEWSYSLOG_CONF.write_text(self.generate_newsyslog_conf())
+            return "installed"
+        except OSError as e:
+            return f"error: {e}"
+
+    @cached_property
+    def _env_vars(self) -> dict:
+        """Environment variables to pass to launchd jobs, read once per manager."""
         env = {
             "PATH": os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin"),
             "HOME": str(Path.home()),
@@ -95,36 +149,61 @@ class LaunchdManager:
         Install both launchd jobs.
 
         Returns:
-            {"fetch": "installed"|"error: ...", "digest": "installed"|"error: ..."}
+            {"fetch": "installed"|"unchanged"|"error: ...",
+             "digest": "installed"|"unchanged"|"error: ..."}
         """
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         PLIST_DIR.mkdir(parents=True, exist_ok=True)
 
-        results = {}
+        jobs = {
+            "fetch": (FETCH_LABEL, self.generate_fetch_plist(fetch_interval)),
+            "digest": (DIGEST_LABEL, self.generate_digest_plist(digest_day, digest_hour)),
+        }
+        # Each job waits on its own launchctl fork, so load both at once
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = {name: ex.submit(self._install_job, label, plist)
+                       for name, (label, plist) in jobs.items()}
+        results = {name: f.result() for name, f in futures.items()}
+
+        results["log_rotation"] = self._install_newsyslog()
+        return results
 
-        # Fetch job
-        fetch_plist_path = PLIST_DIR / f"{FETCH_LABEL}.plist"
-        fetch_plist = self.generate_fetch_plist(fetch_interval)
+    def _install_job(self, label: str, plist: dict) -> str:
+        """Write and load one job, leaving it alone if its plist is already current.
+
+        Reloading re-registers the job and can interrupt a run in progress, so
+        an identical plist is neither rewritten nor reloaded while the job is
+        loaded; one left on disk but unloaded is just loaded. Changed plists are
+        written to a temp file and renamed into place, so launchd never sees a
+        partial write.
+        """
+        plist_path = PLIST_DIR / f"{label}.plist"
+        data = plistlib.dumps(plist)
         try:
-            with open(fetch_plist_path, "wb") as f:
-                plistlib.dump(fetch_plist, f)
-            self._launchctl("load", str(fetch_plist_path))
-            results["fetch"] = "installed"
-        except Exception as e:
-            results["fetch"] = f"error: {e}"
+            current = plist_path.read_bytes() == data
+        except OSError:
+            current = False
 
-        # Digest job
-        digest_plist_path = PLIST_DIR / f"{DIGEST_LABEL}.plist"
-        digest_plist = self.generate_digest_plist(digest_day, digest_hour)
         try:
-            with open(digest_plist_path, "wb") as f:
-                plistlib.dump(digest_plist, f)
-            self._launchctl("load", str(digest_plist_path))
-            results["digest"] = "installed"
+            if current:
+                if self._is_loaded(label):
+                    return "unchanged"
+                self._launchctl("load", str(plist_path))
+                return "installed"
+
+            with tempfile.NamedTemporaryFile(dir=plist_path.parent, prefix=f".{label}.",
+                                             suffix=".tmp", delete=False) as tmp:
+                tmp.write(data)
+            try:
+                os.chmod(tmp.name, 0o644)  # mkstemp creates 0600; match a plain open()
+                os.replace(tmp.name, plist_path)
+            except OSError:
+                os.unlink(tmp.name)
+                raise
+            self._launchctl("load", str(plist_path))
+            return "installed"
         except Exception as e:
-            results["digest"] = f"error: {e}"
-
-        return results
+            return f"error: {e}"
 
     def uninstall(self) -> dict:
         """
@@ -134,65 +213,71 @@ class LaunchdManager:
             {"fetch": "removed"|"not installed"|"error: ...",
              "digest": "removed"|"not installed"|"error: ..."}
         """
-        results = {}
-
-        for label in [FETCH_LABEL, DIGEST_LABEL]:
-            name = label.split(".")[-1]
-            plist_path = PLIST_DIR / f"{label}.plist"
-
-            if not plist_path.exists():
-                results[name] = "not installed"
-                continue
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = {label.split(".")[-1]: ex.submit(self._uninstall_job, label)
+                       for label in [FETCH_LABEL, DIGEST_LABEL]}
+        results = {name: f.result() for name, f in futures.items()}
 
+        if NEWSYSLOG_CONF.exists():
             try:
-                self._launchctl("unload", str(plist_path))
-                plist_path.unlink()
-                results[name] = "removed"
-            except Exception as e:
-                results[name] = f"error: {e}"
+                NEWSYSLOG_CONF.unlink()
+                results["log_rotation"] = "removed"
+            except OSError as e:
+                results["log_rotation"] = f"error: {e}"
 
         return results
 
+    def _uninstall_job(self, label: str) -> str:
+        plist_path = PLIST_DIR / f"{label}.plist"
+        if not plist_path.exists():
+            return "not installed"
+        try:
+            self._launchctl("unload", str(plist_path))
+            plist_path.unlink()
+            return "removed"
+        except Exception as e:
+            return f"error: {e}"
+
     def status(self) -> dict:
         """Check if jobs are loaded and running."""
-        results = {}
+        # Start both `launchctl list` processes before waiting on either
+        procs = {}
         for label in [FETCH_LABEL, DIGEST_LABEL]:
-            name = label.split(".")[-1]
             try:
-                output = subprocess.run(
-                    ["launchctl", "list", label],
-                    capture_output=True, text=True, timeout=5
-                )
-                if output.returncode == 0:
-                    lines = output.stdout.strip().split("\n")
-                    info = {}
-                    for line in lines:
-                        if "=" in line:
-                            key, val = line.split("=", 1)
-                            info[key.strip().strip('"')] = val.strip().strip('";')
-
-                    pid = info.get("PID")
-                    last_exit = info.get("LastExitStatus")
-
-                    results[name] = {
-                        "loaded": True,
-                        "running": pid is not None and pid != "0",
-                        "pid": int(pid) if pid and pid != "0" else None,
-                        "last_exit": int(last_exit) if last_exit else None,
-                    }
-                else:
-                    results[name] = {"loaded": False, "running": False,
-                                     "pid": None, "last_exit": None}
+                procs[label] = subprocess.Popen(["launchctl", "list", label],
+                                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             except Exception:
-                results[name] = {"loaded": False, "running": False,
-                                 "pid": None, "last_exit": None}
+                procs[label] = None
+
+        results = {}
+        for label, proc in procs.items():
+            name = label.split(".")[-1]
+            results[name] = {"loaded": False, "running": False,
+                             "pid": None, "last_exit": None}
+            if proc is not None:
+                try:
+                    stdout, _ = proc.communicate(timeout=5)
+                    if proc.returncode == 0:
+                        info = {key: int(val) for key, val in _LAUNCHCTL_FIELDS.findall(stdout)}
+                        pid = info.get(b"PID")
+
+                        results[name] = {
+                            "loaded": True,
+                            "running": bool(pid),
+                            "pid": pid or None,
+                            "last_exit": info.get(b"LastExitStatus"),
+                        }
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                except Exception:
+                    pass
 
             # Check log for last run time
             log_path = LOG_DIR / f"{name}.log"
             if log_path.exists():
                 try:
-                    content = log_path.read_text()
-                    lines = content.strip().split("\n")
+                    lines = _tail_lines(log_path, 1)
                     if lines:
                         results[name]["last_log_line"] = lines[-1][:100]
                 except Exception:
@@ -208,9 +293,7 @@ class LaunchdManager:
         for j in jobs:
             log_path = LOG_DIR / f"{j}.log"
             if log_path.exists():
-                content = log_path.read_text()
-                log_lines = content.strip().split("\n")
-                recent = log_lines[-lines:]
+                recent = _tail_lines(log_path, lines)
                 output.append(f"=== {j.upper()} LOG (last {len(recent)} lines) ===")
                 output.extend(recent)
                 output.append("")
@@ -221,6 +304,14 @@ class LaunchdManager:
 
         return "\n".join(output)
 
+    def _is_loaded(self, label: str) -> bool:
+        """Whether launchd currently has the job registered (`launchctl list <label>`)."""
+        try:
+            result = subprocess.run(["launchctl", "list", label], capture_output=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0
+
     def _launchctl(self, action: str, plist_path: str):
         """Run launchctl load/unload."""
         result = subprocess.run(
@@ -235,14 +326,16 @@ def rotate_logs(max_size_mb: int = 10):
     """Rotate log files if they exceed max_size_mb.
 
     Truncates to last 1000 lines if file exceeds size limit.
-    Called at the start of each fetch/digest cycle.
+    Called at the start of each fetch/digest cycle; a no-op once newsyslog
+    owns rotation (see LaunchdManager.generate_newsyslog_conf).
     """
-    for log_name in ["fetch.log", "digest.log"]:
+    if NEWSYSLOG_CONF.exists():
+        return
+    for log_name in LOG_NAMES:
         log_path = LOG_DIR / log_name
         if not log_path.exists():
             continue
         size_mb = log_path.stat().st_size / (1024 * 1024)
         if size_mb > max_size_mb:
-            lines = log_path.read_text().strip().split("\n")
-            recent = lines[-1000:]
+            recent = _tail_lines(log_path, 1000)
             log_path.write_text("\n".join(recent) + "\n")
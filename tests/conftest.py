@@ -1,12 +1,8 @@
 """Shared test fixtures."""
 import os
-import sys
 import pytest
 import tempfile
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from models.database import Database
 from models.metrics import PriceMetrics, OnchainMetrics, SentimentMetrics, ValuationMetrics, CombinedSnapshot
 from datetime import datetime, timezone
@@ -14,7 +10,16 @@ from datetime import datetime, timezone
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database for testing."""
+    """Create a fresh in-memory database for testing."""
+    db = Database(":memory:")
+    db.connect()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def temp_db_disk():
+    """Create a temporary on-disk database, for tests needing the reader pool or a second connection."""
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
         db_path = f.name
     db = Database(db_path)
@@ -55,23 +60,19 @@ def sample_snapshot():
     )
 
 
+@pytest.fixture(scope="session")
+def _sample_price_columns():
+    """Column arrays behind sample_price_data, built once per session."""
+    import numpy as np
+    i = np.arange(365)
+    # Simulate a decline then recovery
+    price = np.where(i < 180, 100000 - i * 200, 64000 + (i - 180) * 100)
+    dates = (np.datetime64("2024-01-01") + i).astype(str)
+    return dates.tolist(), price.tolist(), (price * 19_500_000).tolist()
+
+
 @pytest.fixture
-def sample_price_data():
-    """Sample daily price records for testing."""
-    from datetime import date, timedelta
-    records = []
-    base_price = 100000
-    d = date(2024, 1, 1)
-    for i in range(365):
-        # Simulate a decline then recovery
-        if i < 180:
-            price = base_price - (i * 200)
-        else:
-            price = 64000 + ((i - 180) * 100)
-        records.append({
-            "date": str(d + timedelta(days=i)),
-            "price_usd": price,
-            "market_cap": price * 19_500_000,
-            "volume": 20_000_000_000,
-        })
-    return records
+def sample_price_data(_sample_price_columns):
+    """Sample daily price records for testing (fresh dicts per test)."""
+    return [{"date": d, "price_usd": p, "market_cap": m, "volume": 20_000_000_000}
+            for d, p, m in zip(*_sample_price_columns)]
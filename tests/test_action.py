@@ -171,6 +171,9 @@ def test_format_markdown():
     assert "*" in output  # Has Markdown bold
     assert rec.action in output
 
+    from utils.action_engine import format_action_markdown
+    assert format_action_markdown(rec) == output
+
 
 def test_to_dict():
     engine = _make_engine()
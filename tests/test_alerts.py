@@ -1,11 +1,9 @@
 """Tests for alerts engine, rules manager, channels, and Nadeau signals."""
 import pytest
-import sys
-import os
-import tempfile
 import json
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import patch
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from models.alerts import AlertRule, AlertRecord, CompositeSignal
 from models.metrics import (
@@ -17,20 +15,41 @@ from alerts.channels import ConsoleChannel, FileChannel
 from alerts.nadeau_signals import NadeauSignalEvaluator
 
 
-def _make_snapshot(price=67500, fear=18, mvrv=0.59, difficulty_change=-3.5,
-                   dominance=56.7, btc_gold=22.5, hash_rate=9.13e17):
-    """Create a test snapshot with configurable values."""
-    return CombinedSnapshot(
-        price=PriceMetrics(price_usd=price, market_cap=price * 19_800_000,
-                          volume_24h=25e9, change_24h_pct=-2.3),
-        onchain=OnchainMetrics(hash_rate_th=hash_rate, difficulty=1.1e14,
-                              block_time_avg=605, difficulty_change_pct=difficulty_change,
-                              supply_circulating=19_800_000),
-        sentiment=SentimentMetrics(fear_greed_value=fear, fear_greed_label="Extreme Fear",
-                                  btc_gold_ratio=btc_gold, btc_dominance_pct=dominance),
-        valuation=ValuationMetrics(mvrv_ratio=mvrv, mvrv_z_score=-0.3),
-        timestamp=datetime.now(timezone.utc),
-    )
+_BASE_SNAPSHOT = CombinedSnapshot(
+    price=PriceMetrics(price_usd=67500, market_cap=67500 * 19_800_000,
+                       volume_24h=25e9, change_24h_pct=-2.3),
+    onchain=OnchainMetrics(hash_rate_th=9.13e17, difficulty=1.1e14,
+                           block_time_avg=605, difficulty_change_pct=-3.5,
+                           supply_circulating=19_800_000),
+    sentiment=SentimentMetrics(fear_greed_value=18, fear_greed_label="Extreme Fear",
+                               btc_gold_ratio=22.5, btc_dominance_pct=56.7),
+    valuation=ValuationMetrics(mvrv_ratio=0.59, mvrv_z_score=-0.3),
+    timestamp=datetime.now(timezone.utc),
+)
+
+# _make_snapshot keyword -> (metrics group, field)
+_SNAPSHOT_FIELDS = {
+    "price": ("price", "price_usd"),
+    "fear": ("sentiment", "fear_greed_value"),
+    "mvrv": ("valuation", "mvrv_ratio"),
+    "difficulty_change": ("onchain", "difficulty_change_pct"),
+    "dominance": ("sentiment", "btc_dominance_pct"),
+    "btc_gold": ("sentiment", "btc_gold_ratio"),
+    "hash_rate": ("onchain", "hash_rate_th"),
+}
+
+
+def _make_snapshot(**overrides):
+    """Test snapshot: the shared base with only the overridden metric groups rebuilt."""
+    groups = {}
+    for key, value in overrides.items():
+        group, name = _SNAPSHOT_FIELDS[key]
+        groups.setdefault(group, {})[name] = value
+    if "price" in overrides:
+        groups["price"]["market_cap"] = overrides["price"] * 19_800_000
+    return replace(_BASE_SNAPSHOT, **{
+        group: replace(getattr(_BASE_SNAPSHOT, group), **changes) for group, changes in groups.items()
+    })
 
 
 class MockRulesManager:
@@ -76,21 +95,28 @@ def test_rule_does_not_trigger(temp_db):
     assert len(triggered) == 0
 
 
-def test_all_operators(temp_db):
-    """Test each operator type."""
-    ops = [("<", 100, 50, True), ("<", 100, 150, False),
-           (">", 100, 150, True), (">", 100, 50, False),
-           ("<=", 100, 100, True), (">=", 100, 100, True),
-           ("==", 100, 100, True), ("!=", 100, 50, True)]
+@pytest.fixture(scope="module")
+def operator_engine():
+    """One engine shared by the operator cases; each case swaps in its own rule."""
+    from models.database import Database
+    with Database(":memory:") as db:
+        yield AlertEngine(MockRulesManager(), db)
 
-    for op, threshold, price, expected in ops:
-        rule = AlertRule(id=f"t_{op}", name="test", metric="PRICE",
-                         operator=op, threshold=threshold, severity="INFO")
-        rm = MockRulesManager(rules=[rule])
-        engine = AlertEngine(rm, temp_db)
-        snapshot = _make_snapshot(price=price)
-        triggered = engine.evaluate_rules(snapshot, ignore_cooldowns=True)
-        assert (len(triggered) > 0) == expected, f"Failed for {op} {threshold} with price {price}"
+
+@pytest.mark.parametrize("op,threshold,price,expected", [
+    ("<", 100, 50, True), ("<", 100, 150, False),
+    (">", 100, 150, True), (">", 100, 50, False),
+    ("<=", 100, 100, True), (">=", 100, 100, True),
+    ("==", 100, 100, True), ("!=", 100, 50, True),
+])
+def test_all_operators(operator_engine, op, threshold, price, expected):
+    """Test each operator type."""
+    operator_engine.rules_manager._rules = [
+        AlertRule(id=f"t_{op}", name="test", metric="PRICE",
+                  operator=op, threshold=threshold, severity="INFO"),
+    ]
+    triggered = operator_engine.evaluate_rules(_make_snapshot(price=price), ignore_cooldowns=True)
+    assert (len(triggered) > 0) == expected
 
 
 def test_rule_none_value(temp_db):
@@ -186,26 +212,61 @@ def test_test_rules(temp_db):
 
 def test_file_channel():
     """FileChannel should write JSONL."""
-    with tempfile.NamedTemporaryFile(suffix=".jsonl", mode="w", delete=False) as f:
-        path = f.name
-
-    try:
-        channel = FileChannel(log_path=path)
-        record = AlertRecord(
-            rule_id="test", rule_name="Test",
-            metric_value=15.0, threshold=20.0,
-            severity="WARNING", message="Test alert",
-            triggered_at=datetime.now(timezone.utc),
-        )
-        channel.send(record)
-
-        with open(path) as f:
-            line = f.readline()
-            data = json.loads(line)
-            assert data["rule_id"] == "test"
-            assert data["severity"] == "WARNING"
-    finally:
-        os.unlink(path)
+    import io
+    buf = io.StringIO()
+    channel = FileChannel(log_file=buf)
+    record = AlertRecord(
+        rule_id="test", rule_name="Test",
+        metric_value=15.0, threshold=20.0,
+        severity="WARNING", message="Test alert",
+        triggered_at=datetime.now(timezone.utc),
+    )
+    channel.send(record)
+
+    buf.seek(0)
+    data = json.loads(buf.readline())
+    assert data["rule_id"] == "test"
+    assert data["severity"] == "WARNING"
+
+
+def test_alert_record_to_dict():
+    from dataclasses import asdict, fields
+    record = AlertRecord(rule_id="r", rule_name="R", metric_value=1.5, threshold=2.0,
+                         severity="WARNING", message="m", triggered_at=datetime.now(timezone.utc))
+    assert record.to_dict() == {**asdict(record), "triggered_at": record.triggered_at.isoformat()}
+    assert list(record.to_dict()) == [f.name for f in fields(AlertRecord)]
+
+
+def test_engine_dispatches_pass_as_one_batch(temp_db):
+    import io
+
+    class PlainChannel:
+        def __init__(self):
+            self.sent = []
+
+        def send(self, alert):
+            self.sent.append(alert.rule_id)
+
+    buf, plain = io.StringIO(), PlainChannel()
+    file_channel = FileChannel(log_file=buf)
+    rules = [AlertRule(id=f"r{i}", name="Low", metric="PRICE", operator="<", threshold=70000)
+             for i in range(3)]
+    engine = AlertEngine(MockRulesManager(rules=rules), temp_db, channels=[file_channel, plain])
+
+    with patch.object(file_channel, "send_batch", wraps=file_channel.send_batch) as batch:
+        engine.evaluate_rules(_make_snapshot(price=60000))
+    batch.assert_called_once()
+    assert len(buf.getvalue().splitlines()) == 3
+    assert plain.sent == ["r0", "r1", "r2"]
+
+
+def test_file_channel_appends_to_path(tmp_path):
+    path = tmp_path / "alerts.jsonl"
+    channel = FileChannel(log_path=str(path))
+    for rule_id in ("a", "b"):
+        channel.send(AlertRecord(rule_id=rule_id, rule_name=rule_id, severity="INFO", message="m",
+                                 triggered_at=datetime.now(timezone.utc)))
+    assert [json.loads(l)["rule_id"] for l in path.read_text().splitlines()] == ["a", "b"]
 
 
 # ── Format Alert Summary ───────────────────────────────
@@ -230,13 +291,18 @@ def test_format_alert_summary_with_alerts(temp_db):
 
 # ── Rules Manager YAML loading ─────────────────────────
 
-def test_rules_yaml_loading():
+@pytest.fixture(scope="module")
+def rules_manager():
+    """Default alerts_rules.yaml, parsed once for the module."""
+    return RulesManager("config/alerts_rules.yaml")
+
+
+def test_rules_yaml_loading(rules_manager):
     """Default alerts_rules.yaml should load without errors."""
-    rm = RulesManager("config/alerts_rules.yaml")
-    rules = rm.get_all_rules()
+    rules = rules_manager.get_all_rules()
     assert len(rules) > 0
 
-    composites = rm.get_composites()
+    composites = rules_manager.get_composites()
     assert len(composites) > 0
 
     for rule in rules:
@@ -245,10 +311,9 @@ def test_rules_yaml_loading():
         assert isinstance(rule.threshold, float)
 
 
-def test_rules_enabled_filter():
-    rm = RulesManager("config/alerts_rules.yaml")
-    enabled = rm.get_enabled_rules()
-    all_rules = rm.get_all_rules()
+def test_rules_enabled_filter(rules_manager):
+    enabled = rules_manager.get_enabled_rules()
+    all_rules = rules_manager.get_all_rules()
     assert len(enabled) <= len(all_rules)
     assert all(r.enabled for r in enabled)
 
@@ -284,6 +349,19 @@ def test_nadeau_cycle_position(temp_db):
     assert "phase_description" in result
 
 
+@pytest.mark.parametrize("since,year", [(0, 0), (364, 0), (365, 1), (800, 2), (1200, 3), (1600, 3)])
+def test_nadeau_cycle_phase_by_day(temp_db, since, year):
+    from unittest.mock import patch
+    from alerts.nadeau_signals import CYCLE_PHASES
+    evaluator = NadeauSignalEvaluator(temp_db)
+    with patch("alerts.nadeau_signals.days_since_last_halving", return_value=since):
+        result = evaluator.evaluate_cycle_position(_make_snapshot())
+        result["phase_description"] = "mutated"
+        again = evaluator.evaluate_cycle_position(_make_snapshot())
+    assert (again["days_since_halving"], again["years_into_cycle"]) == (since, round(since / 365, 1))
+    assert (again["phase_description"], again["expected_behavior"]) == CYCLE_PHASES[year]
+
+
 def test_nadeau_reflexivity(temp_db):
     evaluator = NadeauSignalEvaluator(temp_db)
     snapshot = _make_snapshot(fear=10)
@@ -305,3 +383,17 @@ def test_nadeau_full_assessment(temp_db, sample_price_data):
     assert "overall_bias" in assessment
     assert "narrative" in assessment
     assert len(assessment["narrative"]) > 0
+
+
+def test_nadeau_reflexivity_ignores_null_fear_readings(temp_db):
+    """A NULL fear & greed row must not turn the 7-day average into NaN."""
+    evaluator = NadeauSignalEvaluator(temp_db)
+    for _ in range(7):
+        temp_db.save_snapshot(_make_snapshot(fear=12))
+    result = evaluator.evaluate_reflexivity_signals(_make_snapshot(fear=10))
+    assert result["detail"].startswith("Sustained extreme fear (avg 12)")
+
+    temp_db.save_snapshot(_make_snapshot(fear=None))
+    result = evaluator.evaluate_reflexivity_signals(_make_snapshot(fear=10))
+    assert result["signal"].value == "BULLISH"
+    assert "avg 10" in result["detail"]  # six readings left; falls back to the current value
@@ -0,0 +1,202 @@
+"""Tests for API client orchestration."""
+import json
+from unittest.mock import MagicMock
+from monitor.api import APIRegistry
+from monitor.api.coingecko import CoinGeckoClient
+from models.metrics import PriceMetrics, SentimentMetrics, ValuationMetrics
+
+
+class TestAPIRegistry:
+    def setup_method(self):
+        self.api = APIRegistry()
+
+    def test_fetch_all_current_falls_back_per_group(self):
+        self.api.fetch_price_metrics = MagicMock(return_value=PriceMetrics(price_usd=50000, market_cap=1e12))
+        self.api.fetch_onchain_metrics = MagicMock(side_effect=RuntimeError("down"))
+        self.api.fetch_sentiment_metrics = MagicMock(return_value=SentimentMetrics(fear_greed_value=20))
+        self.api.fetch_valuation_metrics = MagicMock(return_value=ValuationMetrics(mvrv_ratio=1.5))
+
+        snap = self.api.fetch_all_current(price_history_prices=[1.0, 2.0])
+
+        assert snap.price.price_usd == 50000
+        assert snap.onchain.block_time_avg == 600.0
+        assert snap.sentiment.fear_greed_value == 20
+        assert snap.valuation.mvrv_ratio == 1.5
+        self.api.fetch_valuation_metrics.assert_called_once_with(
+            market_cap=1e12, price_history_prices=[1.0, 2.0],
+        )
+
+    def test_providers_share_one_session(self):
+        sessions = {c.client.session for c in (self.api.coingecko, self.api.blockchain, self.api.mempool,
+                                               self.api.fear_greed, self.api.coinmetrics)}
+        assert sessions == {self.api.session}
+        assert not self.api.coingecko.client._owns_session
+
+
+class TestCoinMetricsClient:
+    def test_backoff_then_caches_unavailable_verdict(self):
+        from unittest.mock import patch
+        from monitor.api.coinmetrics import CoinMetricsClient
+        from utils.http_client import APIError
+        client = CoinMetricsClient()
+        client.client.get = MagicMock(side_effect=APIError("denied", status_code=403))
+
+        with patch("monitor.api.coinmetrics.time.sleep") as sleep:
+            assert client.get_mvrv() is None
+            assert client.client.get.call_count == 4
+            waits = [c.args[0] for c in sleep.call_args_list]
+            assert len(waits) == 3
+            assert waits[0] < waits[-1] <= client.BACKOFF_CAP + client.BACKOFF_JITTER
+
+            assert client.get_mvrv() is None
+            assert client.client.get.call_count == 4  # verdict cached, no re-probe
+
+    def test_returns_first_available_value(self):
+        from monitor.api.coinmetrics import CoinMetricsClient
+        client = CoinMetricsClient()
+        client.client.get = MagicMock(side_effect=[{"data": []}, {"data": [{"CapMVRVCur": "1.7"}]}])
+        assert client.get_mvrv() == 1.7
+
+    def test_valuation_fetches_both_metrics_together(self):
+        from monitor.api.coinmetrics import CoinMetricsClient
+        client = CoinMetricsClient()
+        client.client.get = MagicMock(side_effect=[
+            {"data": [{"CapMVRVCur": "1.7", "CapRealUSD": None}]},
+            {"data": [{"CapMVRVCur": "1.6", "CapRealUSD": "6.0e11"}]},
+        ])
+        assert client.get_valuation() == {"mvrv": 1.7, "realized_cap": 6.0e11}
+        assert client.client.get.call_args.kwargs["params"]["metrics"] == "CapMVRVCur,CapRealUSD"
+
+    def test_estimate_mvrv_uses_200_day_average(self):
+        from monitor.api.coinmetrics import CoinMetricsClient
+        prices = [1.0] * 100 + [2.0] * 200
+        assert CoinMetricsClient.estimate_mvrv(2e6, prices) == 1.0
+        assert CoinMetricsClient.estimate_mvrv(1e6, [1.0, 3.0]) == 1.5
+        assert CoinMetricsClient.estimate_mvrv(1e6, []) is None
+
+
+class TestProviderFanOut:
+    def setup_method(self):
+        self.api = APIRegistry()
+
+    def teardown_method(self):
+        self.api.close()
+
+    def test_onchain_subcalls_fall_back_independently(self):
+        self.api.blockchain.get_hash_rate = MagicMock(return_value={"current": 7e8})
+        self.api.blockchain.get_difficulty = MagicMock(side_effect=RuntimeError("down"))
+        self.api.mempool.get_difficulty_adjustment = MagicMock(
+            return_value={"avg_block_time": 590, "estimated_change_pct": 1.5})
+        self.api.coingecko.get_coin_data = MagicMock(
+            return_value={"circulating_supply": 19.8e6, "max_supply": 21e6})
+
+        onchain = self.api.fetch_onchain_metrics()
+        assert onchain.hash_rate_th == 7e8
+        assert onchain.difficulty == 0
+        assert onchain.block_time_avg == 590
+        assert onchain.supply_circulating == 19.8e6
+
+    def test_sentiment_subcalls_run_concurrently(self):
+        import threading
+        barrier = threading.Barrier(3, timeout=2)
+
+        def _at_barrier(value):
+            barrier.wait()  # only passes if all three calls are in flight together
+            return value
+
+        self.api.fear_greed.get_current = lambda: _at_barrier({"value": 30, "label": "Fear"})
+        self.api.coingecko.get_btc_gold_ratio = lambda: _at_barrier(25.0)
+        self.api.coingecko.get_global_data = lambda: _at_barrier({"btc_dominance_pct": 57.0})
+
+        sentiment = self.api.fetch_sentiment_metrics()
+        assert (sentiment.fear_greed_value, sentiment.btc_gold_ratio, sentiment.btc_dominance_pct) == (30, 25.0, 57.0)
+
+    def test_health_check_probes_concurrently(self):
+        import threading
+        barrier = threading.Barrier(4, timeout=2)
+
+        def _probe(*_):
+            barrier.wait()
+
+        def _failing_probe():
+            barrier.wait()
+            raise RuntimeError("down")
+
+        self.api.coingecko.get_current_price = _probe
+        self.api.blockchain.get_hash_rate = _probe
+        self.api.mempool.get_difficulty_adjustment = _failing_probe
+        self.api.fear_greed.get_current = _probe
+
+        checks = self.api.health_check()
+        assert list(checks) == ["CoinGecko", "Blockchain.com", "mempool.space", "Fear & Greed"]
+        assert [c["reachable"] for c in checks.values()] == [True, True, False, True]
+
+
+class TestCoinGeckoSnapshot:
+    def setup_method(self):
+        self.cg = CoinGeckoClient()
+
+    def test_snapshot_fields_share_one_request(self):
+        resp = MagicMock(status_code=200, headers={})
+        resp.content = json.dumps({"market_data": {
+            "current_price": {"usd": 65000.0, "xau": 27.5},
+            "market_cap": {"usd": 1.28e12},
+            "total_volume": {"usd": 3.1e10},
+            "price_change_percentage_24h": -1.2,
+            "circulating_supply": 19.7e6,
+            "max_supply": 21e6,
+        }}).encode()
+        self.cg.client.session.request = MagicMock(return_value=resp)
+
+        price = self.cg.get_current_price()
+        coin = self.cg.get_coin_data()
+        assert (price.price_usd, price.change_24h_pct) == (65000.0, -1.2)
+        assert coin["circulating_supply"] == 19.7e6
+        assert self.cg.get_btc_gold_ratio() == 27.5
+        assert self.cg.client.session.request.call_count == 1
+
+
+class TestCoinGeckoHistory:
+    DAY_MS = 86_400_000
+
+    def setup_method(self):
+        self.cg = CoinGeckoClient()
+
+    def test_full_history_keeps_last_sample_per_day(self):
+        base = 1_700_000_000_000 - 1_700_000_000_000 % self.DAY_MS
+        self.cg.client.get = MagicMock(return_value={
+            "prices": [[base, 100.0], [base + self.DAY_MS, 110.0], [base + self.DAY_MS + 60_000, 111.0]],
+            "market_caps": [[base, 1.0], [base + self.DAY_MS, 2.0], [base + self.DAY_MS + 60_000, 3.0]],
+            "total_volumes": [[base, 5.0]],
+        })
+
+        records = self.cg.get_full_history(start_year=2023)
+        assert [r.price_usd for r in records] == [100.0, 111.0]
+        assert records[1].market_cap == 3.0
+        assert records[1].volume == 0
+
+    def test_history_disk_cache_survives_new_client(self, tmp_path):
+        self.cg = CoinGeckoClient(history_cache_dir=tmp_path)
+        self.cg.client.get = MagicMock(return_value={"prices": [[1_700_000_000_000, 100.0]]})
+        first = self.cg.get_historical_prices(days=30)
+        assert [p.suffix for p in tmp_path.iterdir()] == [".json"]  # temp file renamed away
+
+        fresh = CoinGeckoClient(history_cache_dir=tmp_path)
+        fresh.client.get = MagicMock()
+        assert fresh.get_historical_prices(days=30) == first
+        fresh.client.get.assert_not_called()
+
+
+class TestBlockchainInfoClient:
+    def setup_method(self):
+        from monitor.api.blockchain_info import BlockchainInfoClient
+        self.bc = BlockchainInfoClient()
+        self.bc.client.get = MagicMock(return_value={"values": [{"x": 1, "y": "5e8"}, {"x": 2, "y": "6e8"}]})
+
+    def test_current_only_by_default(self):
+        assert self.bc.get_hash_rate() == {"current": 6e8, "history": []}
+        assert self.bc.get_difficulty()["current"] == 6e8
+
+    def test_hash_rate_change_uses_history(self):
+        assert self.bc.get_hash_rate(include_history=True)["history"][0] == {"timestamp": 1, "hash_rate_th": 5e8}
+        assert self.bc.get_hash_rate_change() == 20.0
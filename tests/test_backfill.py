@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 from monitor.backfill import BackfillOrchestrator, BackfillResult
 from monitor.api.yfinance_client import YFinanceClient
 from monitor.api.csv_backfill import CSVBackfill
+from models.metrics import PriceRecord
 
 
 class TestBackfillOrchestrator:
@@ -39,26 +40,60 @@ class TestBackfillOrchestrator:
 
     def test_validate_filters_bad_prices(self):
         records = [
-            {"date": "2024-01-01", "price_usd": 50000},
-            {"date": "2024-01-02", "price_usd": -100},      # negative
-            {"date": "2024-01-03", "price_usd": 0},          # zero
-            {"date": "2024-01-04", "price_usd": 20000000},   # too high
-            {"date": "2024-01-05", "price_usd": 51000},
+            PriceRecord("2024-01-01", 50000),
+            PriceRecord("2024-01-02", -100),      # negative
+            PriceRecord("2024-01-03", 0),          # zero
+            PriceRecord("2024-01-04", 20000000),   # too high
+            PriceRecord("2024-01-05", 51000),
         ]
         valid = self.orchestrator.validate(records)
         assert len(valid) == 2
-        dates = [r["date"] for r in valid]
+        dates = [r.date for r in valid]
         assert "2024-01-01" in dates
         assert "2024-01-05" in dates
 
     def test_validate_deduplicates(self):
         records = [
-            {"date": "2024-01-01", "price_usd": 50000},
-            {"date": "2024-01-01", "price_usd": 50100},  # duplicate, keep last
+            PriceRecord("2024-01-01", 50000),
+            PriceRecord("2024-01-01", 50100),  # duplicate, keep last
         ]
         valid = self.orchestrator.validate(records)
         assert len(valid) == 1
-        assert valid[0]["price_usd"] == 50100
+        assert valid[0].price_usd == 50100
+
+    def test_run_saves_each_source_in_one_batch(self):
+        self.db.get_existing_price_dates.return_value = frozenset({"2024-03-01", "2024-06-01"})
+        self.db.get_price_date_range.return_value = {"min_date": "2024-01-01", "max_date": "2024-06-01"}
+
+        def fake_prices(start, end):
+            return [PriceRecord(start.isoformat(), 100.0), PriceRecord(end.isoformat(), 101.0)]
+
+        with patch.object(YFinanceClient, "get_daily_prices", side_effect=fake_prices) as fetch:
+            result = self.orchestrator.run(start_year=2024)
+
+        assert fetch.call_count == 3  # three gaps around the two existing dates
+        self.db.save_price_history.assert_called_once()
+        assert len(self.db.save_price_history.call_args.args[0]) == 6
+        assert result.dates_added == 6
+        assert result.sources_used == ["yfinance"]
+        self.db.get_existing_price_dates.assert_called_once()  # remaining gaps reuse the in-memory set
+        assert result.gaps_remaining  # fake_prices only filled each gap's endpoints
+
+    def test_yfinance_gaps_fetched_concurrently(self):
+        import threading
+        self.db.get_existing_price_dates.return_value = frozenset({"2024-03-01", "2024-06-01"})
+        self.db.get_price_date_range.return_value = {"min_date": "2024-01-01", "max_date": "2024-06-01"}
+        barrier = threading.Barrier(3, timeout=2)
+
+        def fake_prices(start, end):
+            barrier.wait()  # only passes if all three gap fetches are in flight together
+            return [PriceRecord(start.isoformat(), 100.0)]
+
+        with patch.object(YFinanceClient, "get_daily_prices", side_effect=fake_prices):
+            result = self.orchestrator.run(start_year=2024)
+
+        assert result.errors == []
+        assert result.dates_added == 3
 
     def test_result_dataclass(self):
         result = BackfillResult()
@@ -76,8 +111,11 @@ class TestYFinanceClient:
     def test_empty_range(self):
         client = YFinanceClient()
         # end <= start should return empty
-        result = client.get_daily_prices(date(2024, 1, 5), date(2024, 1, 1))
+        with patch.dict("sys.modules", {"yfinance": None}), \
+                patch("monitor.api.yfinance_client.logger") as log:
+            result = client.get_daily_prices(date(2024, 1, 5), date(2024, 1, 1))
         assert result == []
+        log.warning.assert_not_called()  # returned before trying to import yfinance
 
     def test_clamps_start_to_earliest(self):
         """Requesting data before EARLIEST_DATE should be clamped."""
@@ -87,6 +125,21 @@ class TestYFinanceClient:
         assert hasattr(client, 'get_daily_prices')
         assert hasattr(client, 'health_check')
 
+    def test_frame_to_records_skips_non_positive_closes(self):
+        import pandas as pd
+        df = pd.DataFrame(
+            {"Close": [100.0, 0.0, 102.5], "Volume": [10, 11, 12]},
+            index=pd.date_range("2024-01-01", periods=3, freq="D", tz="America/New_York"),
+        )
+        ticker = MagicMock()
+        ticker.history.return_value = df
+        with patch("yfinance.Ticker", return_value=ticker):
+            records = YFinanceClient().get_daily_prices(date(2024, 1, 1), date(2024, 1, 3))
+        assert records == [
+            PriceRecord("2024-01-01", 100.0, None, 10.0),
+            PriceRecord("2024-01-03", 102.5, None, 12.0),
+        ]
+
 
 class TestCSVBackfill:
     def test_missing_csv_returns_empty(self):
@@ -104,8 +157,47 @@ class TestCSVBackfill:
         client = CSVBackfill(csv_path=csv_path)
         result = client.get_daily_prices(date(2013, 1, 1), date(2013, 1, 31))
         assert len(result) > 0
-        assert all(r["price_usd"] > 0 for r in result)
-        assert all("date" in r for r in result)
+        assert all(r.price_usd > 0 for r in result)
+        assert all(r.date for r in result)
+
+    def test_reads_by_header_position(self, tmp_path):
+        csv_file = tmp_path / "seed.csv"
+        csv_file.write_text(
+            "volume,price_usd,date\n"
+            "5,10.5,2013-05-31\n"
+            ",11.0,2013-06-01\n"
+            "7,0,2013-06-02\n"
+            "8,12.0,2013-06-03\n"
+        )
+        result = CSVBackfill(csv_path=csv_file).get_daily_prices(date(2013, 6, 1), date(2013, 6, 30))
+        assert result == [
+            PriceRecord("2013-06-01", 11.0, None, 0.0),
+            PriceRecord("2013-06-03", 12.0, None, 8.0),
+        ]
+
+    def test_parses_file_once_across_queries(self, tmp_path):
+        csv_file = tmp_path / "seed.csv"
+        csv_file.write_text("date,price_usd\n2013-01-02,2.0\n2013-01-01,1.0\n2013-01-03,3.0\n")
+        client = CSVBackfill(csv_path=csv_file)
+        with patch("builtins.open", wraps=open) as opened:
+            assert [r.price_usd for r in client.get_daily_prices(date(2013, 1, 1), date(2013, 1, 2))] == [1.0, 2.0]
+            assert [r.price_usd for r in client.get_daily_prices(date(2013, 1, 3), date(2013, 2, 1))] == [3.0]
+        assert opened.call_count == 1
+
+    def test_malformed_rows_skipped_not_fatal(self, tmp_path):
+        csv_file = tmp_path / "seed.csv"
+        csv_file.write_text("date,price_usd\n2013-01-01,1.0\n2013-01-02,n/a\n2013-01-03\n2013-01-04,4.0\n")
+        result = CSVBackfill(csv_path=csv_file).get_daily_prices(date(2013, 1, 1), date(2013, 1, 31))
+        assert [r.price_usd for r in result] == [1.0, 4.0]
+
+    def test_unreadable_file_not_reparsed(self, tmp_path):
+        csv_file = tmp_path / "seed.csv"
+        csv_file.write_text("day,close\n2013-01-01,1.0\n")  # no date/price_usd columns
+        client = CSVBackfill(csv_path=csv_file)
+        with patch("builtins.open", wraps=open) as opened:
+            assert client.get_daily_prices(date(2013, 1, 1), date(2013, 1, 31)) == []
+            assert client.get_daily_prices(date(2013, 1, 1), date(2013, 1, 31)) == []
+        assert opened.call_count == 1
 
     def test_date_filtering(self):
         """CSV should only return records within the requested range."""
@@ -117,5 +209,5 @@ class TestCSVBackfill:
         client = CSVBackfill(csv_path=csv_path)
         result = client.get_daily_prices(date(2013, 6, 1), date(2013, 6, 30))
         for r in result:
-            assert r["date"] >= "2013-06-01"
-            assert r["date"] <= "2013-06-30"
+            assert r.date >= "2013-06-01"
+            assert r.date <= "2013-06-30"
@@ -1,34 +1,40 @@
 """Tests for new visual timeline charts."""
 import pytest
 import os
-import tempfile
 from datetime import date, datetime
 
 
-def _make_chart_gen():
-    """Create a DCAChartGenerator with temp output dir."""
+@pytest.fixture(scope="module")
+def _chart_generator(tmp_path_factory):
+    """One generator shared by the module; chart_gen points it at a per-test dir."""
     from dca.charts import DCAChartGenerator
-    tmpdir = tempfile.mkdtemp()
-    return DCAChartGenerator(output_dir=tmpdir), tmpdir
+    return DCAChartGenerator(output_dir=str(tmp_path_factory.mktemp("dca_charts")))
 
 
-def test_generate_price_path():
-    gen, _ = _make_chart_gen()
+@pytest.fixture
+def chart_gen(_chart_generator, tmp_path):
+    """Shared generator writing into this test's own tmp_path, so files come from this test."""
+    _chart_generator.output_dir = tmp_path
+    return _chart_generator, tmp_path
+
+
+def test_generate_price_path(chart_gen):
+    gen, _ = chart_gen
     path = gen._generate_price_path(70000, 100000, 12)
     assert len(path) == 13  # 0 to 12 inclusive
     assert path[0] == 70000
     assert abs(path[-1] - 100000) < 1
 
 
-def test_generate_price_path_zero_months():
-    gen, _ = _make_chart_gen()
+def test_generate_price_path_zero_months(chart_gen):
+    gen, _ = chart_gen
     path = gen._generate_price_path(70000, 100000, 0)
     assert len(path) == 1
     assert path[0] == 70000
 
 
-def test_scenario_fan_generates_png():
-    gen, tmpdir = _make_chart_gen()
+def test_scenario_fan_generates_png(chart_gen):
+    gen, tmpdir = chart_gen
     from dca.projections import DCAProjector
     proj = DCAProjector(70000)
     projections = proj.compare_projections(200)
@@ -42,8 +48,8 @@ def test_scenario_fan_generates_png():
     assert os.path.getsize(path) > 1000  # Non-trivial PNG
 
 
-def test_scenario_fan_no_key_levels():
-    gen, tmpdir = _make_chart_gen()
+def test_scenario_fan_no_key_levels(chart_gen):
+    gen, tmpdir = chart_gen
     from dca.projections import DCAProjector
     proj = DCAProjector(70000)
     projections = proj.compare_projections(200)
@@ -53,8 +59,8 @@ def test_scenario_fan_no_key_levels():
     assert os.path.exists(path)
 
 
-def test_cycle_overlay_generates_png():
-    gen, tmpdir = _make_chart_gen()
+def test_cycle_overlay_generates_png(chart_gen):
+    gen, tmpdir = chart_gen
 
     # Simulate price history
     price_history = []
@@ -75,8 +81,8 @@ def test_cycle_overlay_generates_png():
     assert os.path.getsize(path) > 1000
 
 
-def test_cycle_overlay_no_history():
-    gen, tmpdir = _make_chart_gen()
+def test_cycle_overlay_no_history(chart_gen):
+    gen, tmpdir = chart_gen
     halving_info = {"days_since": 659, "cycle_pct_elapsed": 45.2}
 
     # Should still work with minimal path
@@ -85,8 +91,8 @@ def test_cycle_overlay_no_history():
     assert os.path.exists(path)
 
 
-def test_goal_timeline_generates_png():
-    gen, tmpdir = _make_chart_gen()
+def test_goal_timeline_generates_png(chart_gen):
+    gen, tmpdir = chart_gen
 
     goal_projections = {
         "status": "in_progress",
@@ -122,20 +128,14 @@ def test_goal_timeline_generates_png():
     assert os.path.getsize(path) > 1000
 
 
-def test_goal_timeline_complete_returns_none():
-    gen, tmpdir = _make_chart_gen()
-    path = gen.plot_goal_timeline({"status": "complete"})
-    assert path is None
-
-
-def test_goal_timeline_none_returns_none():
-    gen, tmpdir = _make_chart_gen()
-    path = gen.plot_goal_timeline(None)
-    assert path is None
+@pytest.mark.parametrize("goal_projections", [{"status": "complete"}, None])
+def test_goal_timeline_without_projection_returns_none(chart_gen, goal_projections):
+    gen, tmpdir = chart_gen
+    assert gen.plot_goal_timeline(goal_projections) is None
 
 
-def test_price_with_levels_generates_png():
-    gen, tmpdir = _make_chart_gen()
+def test_price_with_levels_generates_png(chart_gen):
+    gen, tmpdir = chart_gen
 
     price_history = []
     for i in range(365):
@@ -155,14 +155,14 @@ def test_price_with_levels_generates_png():
     assert os.path.getsize(path) > 1000
 
 
-def test_price_with_levels_no_history():
-    gen, tmpdir = _make_chart_gen()
+def test_price_with_levels_no_history(chart_gen):
+    gen, tmpdir = chart_gen
     path = gen.plot_price_with_levels([], 70000)
     assert path is None
 
 
-def test_price_with_levels_no_extras():
-    gen, tmpdir = _make_chart_gen()
+def test_price_with_levels_no_extras(chart_gen):
+    gen, tmpdir = chart_gen
     price_history = [
         {"date": "2025-06-01", "price_usd": 68000},
         {"date": "2025-07-01", "price_usd": 70000},
@@ -175,8 +175,6 @@ def test_price_with_levels_no_extras():
 
 def test_cli_charts_help():
     from click.testing import CliRunner
-    import sys
-    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     import main as m
     runner = CliRunner()
     result = runner.invoke(m.cli, ["charts", "--help"])
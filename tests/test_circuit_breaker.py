@@ -0,0 +1,106 @@
+"""Tests for the provider circuit breaker."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from unittest.mock import MagicMock, patch
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def test_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker("test", fail_threshold=2, reset_timeout=60)
+    func = MagicMock(side_effect=IOError("down"))
+    guarded = breaker.wrap(func)
+
+    for _ in range(2):
+        with pytest.raises(IOError):
+            guarded()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        guarded()
+    assert func.call_count == 2
+
+
+def test_half_open_probe_closes_on_success():
+    breaker = CircuitBreaker("test", fail_threshold=1, reset_timeout=10)
+    func = MagicMock(side_effect=[IOError("down"), "ok"])
+    guarded = breaker.wrap(func)
+
+    with patch("utils.circuit_breaker.time.monotonic", return_value=100.0):
+        with pytest.raises(IOError):
+            guarded()
+    with patch("utils.circuit_breaker.time.monotonic", return_value=111.0):
+        assert guarded() == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker("test", fail_threshold=3, reset_timeout=10)
+    breaker.state = CircuitBreaker.OPEN
+    breaker.opened_at = 0.0
+    with patch("utils.circuit_breaker.time.monotonic", return_value=50.0):
+        with pytest.raises(IOError):
+            breaker.call(MagicMock(side_effect=IOError("still down")))
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.call(MagicMock())
+
+
+def _open_breaker(fail_threshold=1):
+    breaker = CircuitBreaker("test", fail_threshold=fail_threshold, reset_timeout=10)
+    breaker.state = CircuitBreaker.OPEN
+    breaker.opened_at = time.monotonic() - 11  # reset_timeout already elapsed
+    return breaker
+
+
+def test_concurrent_calls_wait_for_half_open_probe():
+    breaker = _open_breaker()
+    release = threading.Event()
+
+    def slow_ok():
+        release.wait(2)
+        return "ok"
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [ex.submit(breaker.call, slow_ok) for _ in range(4)]
+        time.sleep(0.05)  # let the probe start and the others queue behind it
+        release.set()
+        assert [f.result(timeout=2) for f in futures] == ["ok"] * 4
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_concurrent_callers_fail_fast_when_probe_fails():
+    breaker = _open_breaker()
+    release = threading.Event()
+
+    def still_down():
+        release.wait(2)
+        raise IOError("still down")
+
+    func = MagicMock(side_effect=still_down)
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [ex.submit(breaker.call, func) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        errors = [type(f.exception(timeout=2)) for f in futures]
+    assert sorted(e.__name__ for e in errors) == ["CircuitOpenError"] * 3 + ["OSError"]
+    assert func.call_count == 1
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_overlapping_failures_count_once():
+    breaker = CircuitBreaker("test", fail_threshold=2, reset_timeout=60)
+    barrier = threading.Barrier(4, timeout=2)
+
+    def failing():
+        barrier.wait()  # all four in flight before any fails
+        raise IOError("bad response")
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [ex.submit(breaker.call, failing) for _ in range(4)]
+        assert all(isinstance(f.exception(timeout=2), IOError) for f in futures)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 1
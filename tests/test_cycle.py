@@ -1,10 +1,7 @@
 """Tests for CycleAnalyzer."""
 import pytest
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from monitor.cycle import CycleAnalyzer
 from models.enums import CyclePhase, SignalStatus
 from models.metrics import (
@@ -55,6 +52,16 @@ def test_days_until_halving():
     assert until > 0
 
 
+def test_halving_days_memoized_per_day():
+    from utils import constants
+    ordinal = date(2024, 4, 25).toordinal()
+    assert constants._days_since_halving(ordinal) == 5
+    assert constants._days_until_halving(ordinal) == (HALVING_DATES[5] - date(2024, 4, 25)).days
+    hits = constants._days_since_halving.cache_info().hits
+    constants._days_since_halving(ordinal)
+    assert constants._days_since_halving.cache_info().hits == hits + 1
+
+
 # ── Cycle Phase ─────────────────────────────────────────
 
 def test_cycle_phase_mid_bear(temp_db, sample_price_data):
@@ -69,6 +76,33 @@ def test_cycle_phase_mid_bear(temp_db, sample_price_data):
     assert phase_info["confidence"] in ("high", "medium", "low")
 
 
+def test_phase_rules_first_match_wins():
+    from monitor.cycle import PHASE_RULES
+
+    def first(d, fg, mvrv, since):
+        for matches, phase, conf in PHASE_RULES:
+            if matches(d, fg, mvrv, since):
+                return phase, conf(d, fg, mvrv, since) if callable(conf) else conf
+
+    assert first(75, 10, None, 600) == (CyclePhase.CAPITULATION, "high")
+    assert first(20, 50, 0.8, 600) == (CyclePhase.MID_BEAR, "medium")
+    assert first(35, 50, None, 200) == (CyclePhase.DISTRIBUTION, "medium")
+    assert first(2, 80, None, 400) == (CyclePhase.LATE_BULL, "high")
+    assert first(8, 50, None, 400) == (CyclePhase.MID_BULL, "low")
+
+
+def test_signal_tier_boundaries():
+    from monitor.cycle import _tier, FEAR_GREED_TIERS, MVRV_TIERS, DRAWDOWN_TIERS
+
+    assert _tier(39, FEAR_GREED_TIERS) == (SignalStatus.BULLISH, "Fear (39) - sentiment sour, opportunity per Nadeau")
+    assert _tier(40, FEAR_GREED_TIERS) == (SignalStatus.NEUTRAL, "Neutral (40)")
+    assert _tier(60, FEAR_GREED_TIERS)[0] == SignalStatus.NEUTRAL
+    assert _tier(81, FEAR_GREED_TIERS)[1].startswith("Extreme Greed")
+    assert _tier(1.0, MVRV_TIERS) == (SignalStatus.NEUTRAL, "MVRV 1.00 - fair value range")
+    assert _tier(3.0, MVRV_TIERS)[0] == SignalStatus.NEUTRAL
+    assert _tier(9.5, DRAWDOWN_TIERS) == (SignalStatus.BEARISH, "9.5% from ATH - near top, distribution risk")
+
+
 def test_cycle_phase_returns_dict(temp_db):
     analyzer = CycleAnalyzer(temp_db)
     snapshot = _make_snapshot()
@@ -86,6 +120,8 @@ def test_cycle_comparison(temp_db, sample_price_data):
     comparisons = analyzer.get_cycle_comparison()
 
     assert len(comparisons) >= 3  # Cycle 2, 3, current
+    since = days_since_last_halving()
+    assert comparisons[0]["same_point_date"] == str(HALVING_DATES[2] + timedelta(days=since))
     current = comparisons[-1]
     assert "Current" in current["cycle"]
     assert "halving_price" in current
@@ -152,6 +188,39 @@ def test_supply_dynamics(temp_db, sample_price_data):
     assert result["total_days_analyzed"] == 365
 
 
+def test_drawdown_values(temp_db):
+    from monitor.monitor import BitcoinMonitor
+    temp_db.save_price_history([
+        {"date": "2024-01-01", "price_usd": 100, "market_cap": 0, "volume": 0},
+        {"date": "2024-01-02", "price_usd": 200, "market_cap": 0, "volume": 0},
+        {"date": "2024-01-03", "price_usd": 150, "market_cap": 0, "volume": 0},
+    ])
+    assert CycleAnalyzer(temp_db)._get_drawdown_pct() == 25.0
+    assert CycleAnalyzer(temp_db).get_supply_dynamics(current_price=150)["pct_in_profit"] == 66.7
+
+    monitor = BitcoinMonitor(temp_db, api=None)
+    dd = monitor.get_drawdown_from_ath()
+    assert (dd["ath_date"], dd["ath_price"], dd["current_price"]) == ("2024-01-02", 200.0, 150.0)
+
+    history = temp_db.get_price_history()
+    assert monitor.get_drawdown_from_ath(history) == dd
+    assert monitor.get_price_change(2, history) == -25.0
+
+
+def test_analysis_pass_reads_history_once(temp_db, sample_price_data):
+    temp_db.save_price_history(sample_price_data)
+    analyzer = CycleAnalyzer(temp_db)
+    snapshot = _make_snapshot()
+
+    analyzer.get_cycle_phase(snapshot)
+    _, prices = temp_db.get_price_arrays()
+    analyzer.get_drawdown_analysis()
+    analyzer.get_nadeau_signals(snapshot)
+    analyzer.get_cycle_comparison()
+    analyzer.get_supply_dynamics(current_price=80000)
+    assert temp_db.get_price_arrays()[1] is prices  # every method shared the one cached read
+
+
 def test_supply_dynamics_no_data(temp_db):
     analyzer = CycleAnalyzer(temp_db)
     result = analyzer.get_supply_dynamics(current_price=80000)
@@ -46,6 +46,53 @@ def test_price_history_dedup(temp_db, sample_price_data):
     assert temp_db.get_price_history_count() == 365  # No duplicates
 
 
+def test_save_price_records(temp_db):
+    from models.metrics import PriceRecord
+    temp_db.save_price_history([PriceRecord("2024-01-01", 100.0, None, 5.0), PriceRecord("2024-01-02", 101.0)])
+    history = temp_db.get_price_history()
+    assert [(r["date"], r["market_cap"], r["volume"]) for r in history] == [
+        ("2024-01-01", None, 5.0), ("2024-01-02", 0, 0)]
+
+
+def test_price_arrays_cached_until_write(temp_db, sample_price_data):
+    temp_db.save_price_history(sample_price_data)
+    dates, prices = temp_db.get_price_arrays()
+    assert dates.size == prices.size == 365
+    assert str(dates[0]) == "2024-01-01" and prices.dtype.name == "float64"
+    assert not prices.flags.writeable
+    assert temp_db.get_price_arrays()[1] is prices
+
+    temp_db.save_price_history([{"date": "2025-01-01", "price_usd": 1.0}])
+    dates, refreshed = temp_db.get_price_arrays()
+    assert refreshed is not prices
+    assert refreshed.size == 366 and refreshed[-1] == 1.0
+
+
+def test_price_arrays_see_other_connections(temp_db_disk):
+    import sqlite3
+    temp_db_disk.save_price_history([{"date": "2024-01-01", "price_usd": 100.0}])
+    assert temp_db_disk.get_price_arrays()[1].tolist() == [100.0]
+    other = sqlite3.connect(temp_db_disk.db_path)
+    other.execute("INSERT INTO price_history (date, price_usd) VALUES ('2024-01-02', 101.0)")
+    other.commit()
+    other.close()
+    assert temp_db_disk.get_price_arrays()[1].tolist() == [100.0, 101.0]
+
+
+def test_recent_prices(temp_db, sample_price_data):
+    assert temp_db.get_recent_prices() == []
+    temp_db.save_price_history(sample_price_data)
+    recent = temp_db.get_recent_prices(limit=200)
+    assert recent == [r["price_usd"] for r in temp_db.get_price_history()[-200:]]
+
+
+def test_existing_price_dates(temp_db, sample_price_data):
+    temp_db.save_price_history(sample_price_data)
+    dates = temp_db.get_existing_price_dates()
+    assert isinstance(dates, frozenset)
+    assert len(dates) == 365 and "2024-01-01" in dates
+
+
 def test_price_for_date(temp_db, sample_price_data):
     temp_db.save_price_history(sample_price_data)
     record = temp_db.get_price_for_date("2024-06-15")
@@ -96,3 +143,132 @@ def test_alert_save_and_query(temp_db):
 
     last = temp_db.get_last_alert_time("test_rule")
     assert last is not None
+
+
+def test_has_data_for_range(temp_db, sample_price_data):
+    assert temp_db.has_data_for_range("2024-01-01", "2024-12-30") is False
+    temp_db.save_price_history(sample_price_data)
+    assert temp_db.has_data_for_range("2024-01-01", "2024-12-30") is True
+    assert temp_db.has_data_for_range("2024-06-01", "2025-12-31") is False
+    assert temp_db.has_data_for_range("2023-01-01", "2023-12-31") is False
+
+
+def test_reader_pool_sees_committed_writes(temp_db_disk, sample_price_data):
+    from concurrent.futures import ThreadPoolExecutor
+    temp_db_disk.save_price_history(sample_price_data)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        counts = list(ex.map(lambda _: temp_db_disk.get_price_history_count(), range(16)))
+    assert counts == [365] * 16
+    with temp_db_disk.reader() as conn:
+        with pytest.raises(Exception):
+            conn.execute("DELETE FROM price_history")
+
+
+def test_memory_db_reader_falls_back_to_writer():
+    from models.database import Database
+    with Database(":memory:") as db:
+        with db.reader() as conn:
+            assert conn is db.conn
+
+
+def test_snapshot_columns_and_iter(temp_db, sample_snapshot):
+    temp_db.save_snapshot(sample_snapshot)
+    temp_db.save_snapshot(sample_snapshot)
+    snaps = list(temp_db.iter_snapshots(limit=10))
+    assert len(snaps) == 2
+    cols = temp_db.get_snapshot_columns(["price_usd", "mvrv_ratio"])
+    assert cols["price_usd"].tolist() == [67500.0, 67500.0]
+    assert cols["mvrv_ratio"].shape == (2,)
+    with pytest.raises(ValueError):
+        temp_db.get_snapshot_columns(["price_usd; DROP TABLE x"])
+
+
+def test_packed_snapshot_roundtrip(sample_snapshot):
+    import os
+    import tempfile
+    from models.database import Database
+    with tempfile.TemporaryDirectory() as d:
+        with Database(os.path.join(d, "packed.db"), packed_snapshots=True) as db:
+            db.save_snapshot(sample_snapshot)
+            latest = db.get_latest_snapshot()
+            assert latest.price.price_usd == 67500.0
+            assert latest.sentiment.fear_greed_value == 18
+            assert latest.sentiment.fear_greed_label == "Extreme Fear"
+            assert latest.valuation.mvrv_ratio == 0.59
+            assert db.get_metric_history("mvrv_ratio")[0][1] == 0.59
+            assert db.get_snapshot_columns(["fear_greed_value"])["fear_greed_value"].tolist() == [18.0]
+            assert db.get_nearest_snapshot("9999")["price_usd"] == 67500.0
+
+
+def test_last_alert_time_cache_primed_on_connect(temp_db_disk):
+    from datetime import timedelta
+    from models.alerts import AlertRecord
+    from models.database import Database
+    now = datetime.now(timezone.utc)
+    for ts in (now, now - timedelta(hours=2)):
+        temp_db_disk.save_alert(AlertRecord(
+            rule_id="r1", rule_name="R1", metric_value=1.0, threshold=2.0,
+            severity="INFO", message="m", triggered_at=ts,
+        ))
+    assert temp_db_disk.get_last_alert_time("r1") == now
+
+    reopened = Database(temp_db_disk.db_path).connect()
+    try:
+        assert reopened.get_last_alert_time("r1") == now
+        assert reopened.get_last_alert_time("missing") is None
+    finally:
+        reopened.close()
+
+
+def test_price_gaps(temp_db):
+    assert temp_db.get_price_gaps("2024-01-01", "2024-01-10") == [("2024-01-01", "2024-01-10")]
+    temp_db.save_price_history([
+        {"date": d, "price_usd": 100, "market_cap": 0, "volume": 0}
+        for d in ("2024-01-05", "2024-01-06", "2024-01-08", "2024-01-12", "2024-01-14")
+    ])
+    assert temp_db.get_price_gaps("2024-01-01", "2024-01-20") == [
+        ("2024-01-01", "2024-01-04"),
+        ("2024-01-09", "2024-01-11"),
+        ("2024-01-15", "2024-01-20"),
+    ]
+    assert temp_db.get_price_gaps("2024-01-05", "2024-01-14", max_gap_days=4) == []
+
+
+def test_unacknowledged_alerts(temp_db):
+    from models.alerts import AlertRecord
+    for rule_id in ("a", "b"):
+        temp_db.save_alert(AlertRecord(
+            rule_id=rule_id, rule_name=rule_id, metric_value=1.0, threshold=2.0,
+            severity="INFO", message="m", triggered_at=datetime.now(timezone.utc),
+        ))
+    first = temp_db.get_recent_alerts()[-1]
+    temp_db.acknowledge_alert(first["id"])
+    unack = temp_db.get_unacknowledged_alerts()
+    assert [a["rule_id"] for a in unack] == ["b"]
+
+    plan = temp_db.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM alert_history WHERE acknowledged = 0 "
+        "ORDER BY triggered_at DESC LIMIT 50"
+    ).fetchall()
+    assert any("idx_alerts_unack" in r["detail"] for r in plan)
+
+
+def test_alert_stats_from_counters(temp_db):
+    from datetime import timedelta
+    from models.alerts import AlertRecord
+    now = datetime.now(timezone.utc)
+    for severity, ts in [("WARNING", now), ("WARNING", now), ("CRITICAL", now),
+                         ("INFO", now - timedelta(days=60))]:
+        temp_db.save_alert(AlertRecord(
+            rule_id="r", rule_name="R", metric_value=1.0, threshold=2.0,
+            severity=severity, message="m", triggered_at=ts,
+        ))
+    assert temp_db.get_alert_stats(days=30) == {"WARNING": 2, "CRITICAL": 1}
+    assert temp_db.get_alert_stats(days=None) == {"WARNING": 2, "CRITICAL": 1, "INFO": 1}
+
+
+def test_snapshot_row_factory_matches_from_dict(temp_db, sample_snapshot):
+    from models.metrics import CombinedSnapshot
+    temp_db.save_snapshot(sample_snapshot)
+    row = temp_db.conn.execute("SELECT * FROM metrics_snapshots").fetchone()
+    assert temp_db.get_latest_snapshot() == CombinedSnapshot.from_dict(dict(row))
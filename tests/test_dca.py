@@ -1,11 +1,9 @@
 """Tests for DCA engine, projections, and portfolio tracker."""
 import pytest
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from datetime import date
 from dca.engine import DCAEngine
+from models.enums import Frequency
 from dca.projections import DCAProjector
 from dca.portfolio import PortfolioTracker
 
@@ -70,6 +68,15 @@ def test_dca_buy_date_generation_weekly(temp_db):
         assert d.weekday() == 0  # Monday
 
 
+def test_dca_buy_date_generation_daily_and_biweekly(temp_db):
+    engine = DCAEngine(temp_db)
+    daily = engine._generate_buy_dates(date(2024, 1, 30), date(2024, 2, 2), Frequency.DAILY)
+    assert daily == [date(2024, 1, 30), date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 2)]
+    # Starts on a Wednesday: first buy is the following Monday, then every 14 days
+    biweekly = engine._generate_buy_dates(date(2024, 1, 3), date(2024, 2, 5), "biweekly")
+    assert biweekly == [date(2024, 1, 8), date(2024, 1, 22), date(2024, 2, 5)]
+
+
 def test_dca_buy_date_generation_monthly(temp_db):
     """Monthly buys on 1st of month."""
     _seed_prices(temp_db, {str(date(2024, m, 1)): 50000 for m in range(1, 7)})
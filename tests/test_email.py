@@ -19,6 +19,15 @@ class MockAlert:
 
 
 class TestEmailSender:
+    CONFIG = {"email": {
+        "smtp_host": "smtp.test.com",
+        "smtp_port": 587,
+        "from_address": "test@test.com",
+        "to_address": "recv@test.com",
+        "smtp_username": "user",
+        "smtp_password": "pass",
+    }}
+
     def test_not_configured_missing_fields(self):
         sender = EmailSender({"email": {}})
         assert sender.is_configured() is False
@@ -72,8 +81,7 @@ class TestEmailSender:
     @patch("notifications.email_sender.smtplib.SMTP")
     def test_send_digest_success(self, mock_smtp_class):
         mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp_class.return_value = mock_server
 
         sender = EmailSender({"email": {
             "smtp_host": "smtp.test.com",
@@ -91,8 +99,7 @@ class TestEmailSender:
     @patch("notifications.email_sender.smtplib.SMTP")
     def test_send_digest_with_charts(self, mock_smtp_class):
         mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp_class.return_value = mock_server
 
         sender = EmailSender({"email": {
             "smtp_host": "smtp.test.com",
@@ -114,11 +121,27 @@ class TestEmailSender:
         # Should have multipart/alternative + image
         assert len(payloads) == 2  # alternative + image
 
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_chart_encoding_cached_across_sends(self, mock_smtp_class):
+        from notifications.email_sender import _base64_payload
+        mock_server = MagicMock()
+        mock_smtp_class.return_value = mock_server
+        sender = EmailSender(self.CONFIG)
+        fake_png = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+
+        _base64_payload.cache_clear()
+        sender.send_digest("<h1>Digest</h1>", chart_images=[("chart", fake_png)])
+        sender.send_digest("<h1>Digest</h1>", chart_images=[("chart", fake_png)])
+        assert _base64_payload.cache_info().hits == 1
+
+        img = mock_server.send_message.call_args[0][0].get_payload()[1]
+        assert img["Content-Transfer-Encoding"] == "base64"
+        assert img.get_payload(decode=True) == fake_png
+
     @patch("notifications.email_sender.smtplib.SMTP")
     def test_send_alert_success(self, mock_smtp_class):
         mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp_class.return_value = mock_server
 
         sender = EmailSender({"email": {
             "smtp_host": "smtp.test.com",
@@ -137,8 +160,7 @@ class TestEmailSender:
         import smtplib
         mock_server = MagicMock()
         mock_server.login.side_effect = smtplib.SMTPAuthenticationError(535, b"Bad credentials")
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp_class.return_value = mock_server
 
         sender = EmailSender({"email": {
             "smtp_host": "smtp.test.com",
@@ -152,6 +174,96 @@ class TestEmailSender:
         result = sender.send_digest("<h1>Test</h1>")
         assert result is False
 
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_connection_reused_across_sends(self, mock_smtp_class):
+        mock_server = MagicMock()
+        mock_smtp_class.return_value = mock_server
+        sender = EmailSender(self.CONFIG)
+
+        with sender:
+            assert sender.send_digest("<h1>Digest</h1>") is True
+            assert sender.send_alert("High MVRV", "CRITICAL", "MVRV above 3.5") is True
+
+        assert mock_smtp_class.call_count == 1
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+        mock_server.quit.assert_called_once()
+
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_reconnects_once_when_server_dropped_connection(self, mock_smtp_class):
+        import smtplib
+        stale, fresh = MagicMock(), MagicMock()
+        stale.send_message.side_effect = [None, smtplib.SMTPServerDisconnected("closed")]
+        mock_smtp_class.side_effect = [stale, fresh]
+        sender = EmailSender(self.CONFIG)
+
+        assert sender.send_alert("A", "CRITICAL", "first") is True
+        assert sender.send_alert("B", "CRITICAL", "second") is True
+        fresh.send_message.assert_called_once()
+        assert mock_smtp_class.call_count == 2
+
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_idle_connection_checked_with_noop(self, mock_smtp_class):
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.return_value = (421, b"timeout")
+        mock_smtp_class.side_effect = [stale, fresh]
+        sender = EmailSender(self.CONFIG)
+
+        assert sender.send_alert("A", "CRITICAL", "first") is True
+        sender._smtp_last_used -= 120
+        assert sender.send_alert("B", "CRITICAL", "second") is True
+        stale.noop.assert_called_once()
+        fresh.send_message.assert_called_once()
+
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_reconnects_after_message_cap(self, mock_smtp_class):
+        first, second = MagicMock(), MagicMock()
+        mock_smtp_class.side_effect = [first, second]
+        config = {"email": {**self.CONFIG["email"], "max_messages_per_conn": 2}}
+        sender = EmailSender(config)
+
+        for i in range(3):
+            assert sender.send_alert(f"A{i}", "CRITICAL", "msg") is True
+        assert first.send_message.call_count == 2
+        first.quit.assert_called_once()
+        second.send_message.assert_called_once()
+
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_send_batch_shares_one_connection(self, mock_smtp_class):
+        mock_server = MagicMock()
+        mock_smtp_class.return_value = mock_server
+        sender = EmailSender(self.CONFIG)
+
+        msgs = [sender.build_alert(f"A{i}", "CRITICAL", "msg") for i in range(4)]
+        assert sender.send_batch(msgs) == [True] * 4
+        assert mock_smtp_class.call_count == 1
+        assert mock_server.send_message.call_count == 4
+
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_send_batch_aborts_after_a_third_fail(self, mock_smtp_class):
+        import smtplib
+        mock_server = MagicMock()
+        mock_server.send_message.side_effect = smtplib.SMTPDataError(554, b"rejected")
+        mock_smtp_class.return_value = mock_server
+        sender = EmailSender(self.CONFIG)
+
+        msgs = [sender.build_alert(f"A{i}", "CRITICAL", "msg") for i in range(6)]
+        assert sender.send_batch(msgs) == [False] * 6
+        assert mock_server.send_message.call_count == 2
+
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_ssl_context_built_once(self, mock_smtp_class):
+        mock_smtp_class.side_effect = lambda *a, **kw: MagicMock()
+        config = {"email": {**self.CONFIG["email"], "max_messages_per_conn": 1}}
+        sender = EmailSender(config)
+
+        with patch("notifications.email_sender.ssl.create_default_context") as make_ctx:
+            sender.send_alert("A", "CRITICAL", "msg")
+            sender.send_alert("B", "CRITICAL", "msg")
+            sender.test_connection()
+        assert mock_smtp_class.call_count == 3
+        make_ctx.assert_called_once()
+
     def test_test_connection_no_server(self):
         sender = EmailSender({"email": {
             "smtp_host": "nonexistent.invalid",
@@ -189,8 +301,7 @@ class TestEmailChannel:
     @patch("notifications.email_sender.smtplib.SMTP")
     def test_sends_critical(self, mock_smtp_class):
         mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp_class.return_value = mock_server
 
         config = {"email": {
             "smtp_host": "smtp.test.com",
@@ -207,8 +318,7 @@ class TestEmailChannel:
     @patch("notifications.email_sender.smtplib.SMTP")
     def test_rate_limiting(self, mock_smtp_class):
         mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp_class.return_value = mock_server
 
         config = {"email": {
             "smtp_host": "smtp.test.com",
@@ -226,6 +336,33 @@ class TestEmailChannel:
         # Second send within cooldown should be rate limited
         assert channel.send(alert) is False
 
+    @patch("notifications.email_sender.smtplib.SMTP")
+    def test_batch_combines_pass_into_one_email(self, mock_smtp_class):
+        mock_server = MagicMock()
+        mock_smtp_class.return_value = mock_server
+
+        config = {"email": {
+            "smtp_host": "smtp.test.com",
+            "from_address": "a@b.com",
+            "to_address": "c@d.com",
+            "smtp_username": "u",
+            "smtp_password": "p",
+        }}
+        channel = EmailChannel(config)
+        alerts = [MockAlert(rule_name="mvrv_low", severity="CRITICAL"), MockAlert(severity="WARNING"),
+                  MockAlert(rule_name="extreme_fear", severity="CRITICAL")]
+
+        assert channel.send_batch(alerts) == [True, False, True]
+        assert mock_server.send_message.call_count == 1  # still at most one email per cooldown
+        msg = mock_server.send_message.call_args.args[0]
+        assert msg["Subject"] == "[CRITICAL] BTC Monitor: 2 critical alerts"
+        body = msg.get_payload()[0].get_payload()
+        assert "mvrv_low: test" in body and "extreme_fear: test" in body
+
+        # The whole next pass falls inside the cooldown
+        assert channel.send_batch(alerts) == [False, False, False]
+        assert mock_server.send_message.call_count == 1
+
     def test_disabled_returns_false(self):
         config = {"email": {"critical_alerts_enabled": False}}
         channel = EmailChannel(config)
@@ -1,9 +1,6 @@
 """Tests for formatters, rate limiter, cache."""
 import pytest
 import time
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.formatters import format_usd, format_pct, format_hashrate, format_btc, format_compact, time_ago
 from utils.rate_limiter import RateLimiter
@@ -0,0 +1,113 @@
+"""Tests for HTTPClient caching behavior."""
+import json
+import time
+from unittest.mock import MagicMock
+from utils.http_client import HTTPClient
+
+
+def _response(payload, status=200):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.content = json.dumps(payload).encode()
+    resp.headers = {}
+    return resp
+
+
+def _client(**kwargs):
+    client = HTTPClient("https://example.test", **kwargs)
+    client.session.request = MagicMock(return_value=_response({"v": 1}))
+    return client
+
+
+def test_fresh_cache_hit_skips_network():
+    client = _client(cache_ttl=60)
+    assert client.get("/x") == {"v": 1}
+    assert client.get("/x") == {"v": 1}
+    assert client.session.request.call_count == 1
+
+
+def test_stale_entry_served_while_revalidating():
+    client = _client(cache_ttl=60, stale_ttl=600)
+    client.get("/x")
+    key = client._cache_key("GET", "/x", None)
+    client._cache[key]["time"] -= 120  # past fresh, inside stale window
+
+    client.session.request.return_value = _response({"v": 2})
+    assert client.get("/x") == {"v": 1}  # stale body returned immediately
+
+    deadline = time.time() + 2
+    while client._cache[key]["data"] != {"v": 2} and time.time() < deadline:
+        time.sleep(0.01)
+    assert client.get("/x") == {"v": 2}
+    assert client.session.request.call_count == 2
+    client.close()
+
+
+def test_stale_entry_survives_revalidation_pool_shutdown():
+    from concurrent.futures import ThreadPoolExecutor
+    client = _client(cache_ttl=60, stale_ttl=600)
+    client.get("/x")
+    key = client._cache_key("GET", "/x", None)
+    client._cache[key]["time"] -= 120
+
+    # As if close() shut the pool down between the stale check and the submit
+    client._revalidate_pool = ThreadPoolExecutor(max_workers=1)
+    client._revalidate_pool.shutdown()
+    assert client.get("/x") == {"v": 1}
+    assert key not in client._revalidating  # not stuck; a later stale hit may refresh
+    client.close()
+
+
+def test_expired_beyond_stale_window_blocks_on_fetch():
+    client = _client(cache_ttl=60, stale_ttl=60)
+    client.get("/x")
+    client._cache[client._cache_key("GET", "/x", None)]["time"] -= 500
+    client.session.request.return_value = _response({"v": 3})
+    assert client.get("/x") == {"v": 3}
+
+
+def test_concurrent_misses_share_one_request():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    client = _client(cache_ttl=60)
+    release = threading.Event()
+
+    def slow_request(*args, **kwargs):
+        release.wait(2)
+        return _response({"v": 1})
+
+    client.session.request.side_effect = slow_request
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        futures = [ex.submit(client.get, "/x") for _ in range(5)]
+        time.sleep(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == [{"v": 1}] * 5
+    assert client.session.request.call_count == 1
+
+
+def test_non_json_body_falls_back_to_text():
+    client = _client()
+    resp = _response(None)
+    resp.content = b"<html>ok</html>"
+    resp.text = "<html>ok</html>"
+    client.session.request.return_value = resp
+    assert client.get("/page") == "<html>ok</html>"
+
+
+def test_session_requests_compressed_responses():
+    client = HTTPClient("https://example.test")
+    assert "gzip" in client.session.headers["Accept-Encoding"]
+
+
+def test_cache_evicts_least_recently_used():
+    client = _client(cache_ttl=60)
+    client.CACHE_MAXSIZE = 2
+    client.get("/a")
+    client.get("/b")
+    client.get("/a")  # refresh /a so /b is the eviction candidate
+    client.get("/c")
+    assert client._cache_key("GET", "/b", None) not in client._cache
+    assert client._cache_key("GET", "/a", None) in client._cache
+    assert len(client._cache) == 2
@@ -403,7 +403,5 @@ def test_cli_report_couples_help():
 def cli_module():
     """Import the CLI module."""
     import importlib
-    import sys
-    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     import main as m
     return m
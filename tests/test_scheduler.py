@@ -0,0 +1,24 @@
+"""Tests for the background fetch scheduler."""
+import time
+from unittest.mock import MagicMock
+from monitor.scheduler import MonitorScheduler
+
+
+def test_fetches_immediately_then_on_interval():
+    monitor = MagicMock()
+    scheduler = MonitorScheduler(monitor, interval_seconds=0.2)
+    scheduler.start()
+    time.sleep(0.5)
+    scheduler.stop()
+    assert monitor.fetch_and_store.call_count == 3  # t=0, 0.2, 0.4
+
+
+def test_stop_wakes_idle_loop():
+    monitor = MagicMock()
+    scheduler = MonitorScheduler(monitor, interval_seconds=3600)
+    scheduler.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    scheduler.stop()
+    assert time.monotonic() - started < 1
+    assert monitor.fetch_and_store.call_count == 1
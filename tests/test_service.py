@@ -151,6 +151,12 @@ class TestEnvironmentVariables:
             assert "BTC_MONITOR_SMTP_USER" not in env
             assert "BTC_MONITOR_SMTP_PASS" not in env
 
+    def test_env_read_once_per_manager(self, manager):
+        with patch.dict(os.environ, {"BTC_MONITOR_LOG_LEVEL": "DEBUG"}):
+            fetch_env = manager.generate_fetch_plist()["EnvironmentVariables"]
+        digest_env = manager.generate_digest_plist()["EnvironmentVariables"]
+        assert digest_env == fetch_env and digest_env is not fetch_env
+
     def test_optional_vars_passed(self, manager):
         with patch.dict(os.environ, {"BTC_MONITOR_LOG_LEVEL": "DEBUG"}):
             plist = manager.generate_fetch_plist()
@@ -210,6 +216,81 @@ class TestInstallUninstall:
             data = plistlib.load(f)
             assert data["StartInterval"] == 300
 
+    @patch("service.launchd.LaunchdManager._launchctl")
+    @patch("service.launchd.PLIST_DIR")
+    @patch("service.launchd.LOG_DIR")
+    def test_install_hands_rotation_to_newsyslog(self, mock_log_dir, mock_plist_dir, mock_launchctl, tmp_path):
+        mock_plist_dir.__truediv__ = lambda self, x: tmp_path / x
+        mock_log_dir.__truediv__ = lambda self, x: tmp_path / "logs" / x
+        conf = tmp_path / "newsyslog.d" / "bitcoin-monitor.conf"
+        conf.parent.mkdir()
+
+        mgr = LaunchdManager(str(tmp_path), python_path="/usr/bin/python3")
+        with patch("service.launchd.NEWSYSLOG_CONF", conf):
+            assert mgr.install()["log_rotation"] == "installed"
+            entries = [l.split("\t") for l in conf.read_text().splitlines() if not l.startswith("#")]
+            assert [e[0].rsplit("/", 1)[-1] for e in entries] == ["fetch.log", "digest.log"]
+            assert all(e[4] == "10240" and e[6] == "NJ" for e in entries)
+
+            assert mgr.uninstall()["log_rotation"] == "removed"
+            assert not conf.exists()
+
+    @patch("service.launchd.LaunchdManager._launchctl")
+    @patch("service.launchd.PLIST_DIR")
+    @patch("service.launchd.LOG_DIR")
+    def test_install_without_newsyslog_dir_falls_back(self, mock_log_dir, mock_plist_dir, mock_launchctl, tmp_path):
+        mock_plist_dir.__truediv__ = lambda self, x: tmp_path / x
+        mgr = LaunchdManager(str(tmp_path), python_path="/usr/bin/python3")
+        with patch("service.launchd.NEWSYSLOG_CONF", tmp_path / "missing" / "bitcoin-monitor.conf"):
+            assert mgr.install()["log_rotation"].startswith("skipped")
+
+    @patch("service.launchd.LaunchdManager._launchctl")
+    @patch("service.launchd.PLIST_DIR")
+    @patch("service.launchd.LOG_DIR")
+    def test_reinstall_skips_unchanged_plists(self, mock_log_dir, mock_plist_dir, mock_launchctl, tmp_path):
+        mock_plist_dir.__truediv__ = lambda self, x: tmp_path / x
+        mgr = LaunchdManager(str(tmp_path), python_path="/usr/bin/python3")
+        mgr.install()
+        assert mock_launchctl.call_count == 2
+
+        with patch.object(LaunchdManager, "_is_loaded", return_value=True):
+            results = mgr.install()
+            assert (results["fetch"], results["digest"]) == ("unchanged", "unchanged")
+            assert mock_launchctl.call_count == 2
+
+            results = mgr.install(fetch_interval=5)
+        assert (results["fetch"], results["digest"]) == ("installed", "unchanged")
+        assert mock_launchctl.call_count == 3
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    @patch("service.launchd.LaunchdManager._launchctl")
+    @patch("service.launchd.PLIST_DIR")
+    @patch("service.launchd.LOG_DIR")
+    def test_reinstall_loads_unchanged_but_unloaded_job(self, mock_log_dir, mock_plist_dir, mock_launchctl, tmp_path):
+        mock_plist_dir.__truediv__ = lambda self, x: tmp_path / x
+        mgr = LaunchdManager(str(tmp_path), python_path="/usr/bin/python3")
+        mgr.install()
+        mock_launchctl.reset_mock()
+
+        # e.g. after a manual `launchctl unload`: plist still current, job gone
+        with patch.object(LaunchdManager, "_is_loaded", side_effect=lambda label: label == DIGEST_LABEL):
+            results = mgr.install()
+        assert (results["fetch"], results["digest"]) == ("installed", "unchanged")
+        mock_launchctl.assert_called_once_with("load", str(tmp_path / f"{FETCH_LABEL}.plist"))
+
+    @patch("service.launchd.PLIST_DIR")
+    @patch("service.launchd.LOG_DIR")
+    def test_install_loads_jobs_concurrently(self, mock_log_dir, mock_plist_dir, tmp_path):
+        import threading
+        mock_plist_dir.__truediv__ = lambda self, x: tmp_path / x
+        barrier = threading.Barrier(2, timeout=2)
+
+        mgr = LaunchdManager(str(tmp_path), python_path="/usr/bin/python3")
+        with patch.object(LaunchdManager, "_launchctl", lambda *_: barrier.wait()), \
+                patch("service.launchd.NEWSYSLOG_CONF", tmp_path / "missing" / "bitcoin-monitor.conf"):
+            results = mgr.install()
+        assert (results["fetch"], results["digest"]) == ("installed", "installed")
+
     @patch("service.launchd.LaunchdManager._launchctl")
     def test_uninstall_removes_plists(self, mock_launchctl, tmp_path):
         # Create fake plist files
@@ -237,13 +318,17 @@ class TestInstallUninstall:
         assert results["digest"] == "not installed"
 
 
+def _launchctl_proc(returncode, stdout):
+    proc = MagicMock(returncode=returncode)
+    proc.communicate.return_value = (stdout, b"")
+    return proc
+
+
 class TestStatus:
-    @patch("subprocess.run")
-    def test_status_loaded(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout='"PID" = 1234;\n"LastExitStatus" = 0;\n',
-        )
+    @patch("subprocess.Popen")
+    def test_status_loaded(self, mock_popen):
+        mock_popen.return_value = _launchctl_proc(
+            0, b'{\n\t"LimitLoadToSessionType" = "Aqua";\n\t"PID" = 1234;\n\t"LastExitStatus" = 0;\n};\n')
         mgr = LaunchdManager("/tmp/test", python_path="/usr/bin/python3")
         with patch("service.launchd.LOG_DIR", Path("/nonexistent")):
             result = mgr.status()
@@ -251,10 +336,13 @@ class TestStatus:
         assert result["fetch"]["loaded"] is True
         assert result["fetch"]["running"] is True
         assert result["fetch"]["pid"] == 1234
+        assert result["fetch"]["last_exit"] == 0
+        assert "text" not in mock_popen.call_args.kwargs  # raw bytes, no decode
+        assert mock_popen.call_count == 2
 
-    @patch("subprocess.run")
-    def test_status_not_loaded(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=113, stdout="", stderr="")
+    @patch("subprocess.Popen")
+    def test_status_not_loaded(self, mock_popen):
+        mock_popen.return_value = _launchctl_proc(113, b"")
         mgr = LaunchdManager("/tmp/test", python_path="/usr/bin/python3")
         with patch("service.launchd.LOG_DIR", Path("/nonexistent")):
             result = mgr.status()
@@ -262,12 +350,9 @@ class TestStatus:
         assert result["fetch"]["loaded"] is False
         assert result["fetch"]["running"] is False
 
-    @patch("subprocess.run")
-    def test_status_with_log(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout='"PID" = 0;\n"LastExitStatus" = 0;\n',
-        )
+    @patch("subprocess.Popen")
+    def test_status_with_log(self, mock_popen, tmp_path):
+        mock_popen.return_value = _launchctl_proc(0, b'"PID" = 0;\n"LastExitStatus" = 0;\n')
         log_dir = tmp_path / "logs"
         log_dir.mkdir()
         (log_dir / "fetch.log").write_text("=== Fetch completed ===\n")
@@ -280,9 +365,9 @@ class TestStatus:
         assert "last_log_line" in result["fetch"]
         assert "Fetch completed" in result["fetch"]["last_log_line"]
 
-    @patch("subprocess.run")
-    def test_status_exception_handling(self, mock_run):
-        mock_run.side_effect = Exception("timeout")
+    @patch("subprocess.Popen")
+    def test_status_exception_handling(self, mock_popen):
+        mock_popen.side_effect = Exception("timeout")
         mgr = LaunchdManager("/tmp/test", python_path="/usr/bin/python3")
         with patch("service.launchd.LOG_DIR", Path("/nonexistent")):
             result = mgr.status()
@@ -290,6 +375,19 @@ class TestStatus:
         assert result["fetch"]["loaded"] is False
         assert result["digest"]["loaded"] is False
 
+    @patch("subprocess.Popen")
+    def test_status_timeout_kills_process(self, mock_popen):
+        import subprocess
+        proc = _launchctl_proc(0, b"")
+        proc.communicate.side_effect = [subprocess.TimeoutExpired("launchctl", 5), (b"", b"")] * 2
+        mock_popen.return_value = proc
+        mgr = LaunchdManager("/tmp/test", python_path="/usr/bin/python3")
+        with patch("service.launchd.LOG_DIR", Path("/nonexistent")):
+            result = mgr.status()
+
+        assert result["fetch"]["loaded"] is False
+        assert proc.kill.call_count == 2
+
 
 class TestGetLogs:
     def test_get_logs_no_files(self, tmp_path):
@@ -320,6 +418,15 @@ class TestGetLogs:
         assert "line99" in output
         assert "line0" not in output
 
+    def test_tail_matches_full_read_across_blocks(self, tmp_path):
+        from service.launchd import _tail_lines
+        log = tmp_path / "fetch.log"
+        log.write_text("\n".join(f"line{i}" for i in range(5000)) + "\n\n")
+        expected = log.read_text().strip().split("\n")
+        assert _tail_lines(log, 3, block=16) == ["line4997", "line4998", "line4999"]
+        assert _tail_lines(log, 1000, block=64) == expected[-1000:]
+        assert _tail_lines(log, 10_000) == expected
+
     def test_get_logs_all_jobs(self, tmp_path):
         (tmp_path / "fetch.log").write_text("fetch data\n")
         (tmp_path / "digest.log").write_text("digest data\n")
@@ -353,6 +460,15 @@ class TestLogRotation:
         remaining_lines = content.strip().split("\n")
         assert len(remaining_lines) == 1000
 
+    def test_rotate_skipped_when_newsyslog_installed(self, tmp_path):
+        log = tmp_path / "fetch.log"
+        log.write_text("x" * (2 * 1024 * 1024))
+        conf = tmp_path / "bitcoin-monitor.conf"
+        conf.write_text("")
+        with patch("service.launchd.LOG_DIR", tmp_path), patch("service.launchd.NEWSYSLOG_CONF", conf):
+            rotate_logs(max_size_mb=1)
+        assert log.stat().st_size == 2 * 1024 * 1024
+
     def test_rotate_missing_file_no_error(self, tmp_path):
         with patch("service.launchd.LOG_DIR", tmp_path):
             rotate_logs()  # Should not raise
@@ -7,7 +7,7 @@ from unittest.mock import patch, MagicMock
 
 def test_send_message():
     """send_message makes correct HTTP POST."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value = MagicMock(
             status_code=200,
             json=MagicMock(return_value={"ok": True, "result": {}}),
@@ -28,7 +28,7 @@ def test_send_message():
 
 def test_send_message_custom_chat_id():
     """send_message with explicit chat_id overrides default."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value = MagicMock(
             status_code=200,
             json=MagicMock(return_value={"ok": True}),
@@ -45,7 +45,7 @@ def test_send_message_custom_chat_id():
 
 def test_verify_token():
     """verify_token calls getMe."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value = MagicMock(
             status_code=200,
             json=MagicMock(return_value={"ok": True, "result": {"username": "testbot"}}),
@@ -59,6 +59,54 @@ def test_verify_token():
         assert "getMe" in mock_get.call_args[0][0]
 
 
+def test_messages_share_one_session():
+    with patch("requests.Session.post") as mock_post, patch("utils.rate_limiter.time.sleep"):
+        mock_post.return_value = MagicMock(json=MagicMock(return_value={"ok": True}))
+
+        from notifications.telegram_bot import TelegramBot
+        bot = TelegramBot("token", "123")
+        session = bot.session
+        bot.send_message("one")
+        bot.send_alert("two")
+        assert bot.session is session
+        assert mock_post.call_count == 2
+        assert session.get_adapter("https://api.telegram.org")._pool_maxsize > 1
+
+        with patch.object(session, "close") as close:
+            bot.close()
+        close.assert_called_once()
+
+
+def test_per_chat_pacing():
+    with patch("requests.Session.post") as mock_post, patch("utils.rate_limiter.time.sleep") as sleep:
+        mock_post.return_value = MagicMock(status_code=200, json=MagicMock(return_value={"ok": True}))
+
+        from notifications.telegram_bot import TelegramBot
+        bot = TelegramBot("token", "123")
+        bot.send_message("a")
+        bot.send_message("b", chat_id="456")
+        assert sleep.call_count == 0  # different chats, within the global burst
+        bot.send_message("c")
+        assert sleep.call_count == 1
+        assert 0 < sleep.call_args[0][0] <= 1
+
+
+def test_retries_once_after_429():
+    with patch("requests.Session.post") as mock_post, \
+            patch("notifications.telegram_bot.time.sleep") as sleep:
+        limited = MagicMock(status_code=429, json=MagicMock(
+            return_value={"ok": False, "parameters": {"retry_after": 3}}))
+        ok = MagicMock(status_code=200, json=MagicMock(return_value={"ok": True}))
+        mock_post.side_effect = [limited, ok]
+
+        from notifications.telegram_bot import TelegramBot
+        bot = TelegramBot("token", "123")
+        bot._chat_limiters["123"] = MagicMock()  # isolate from per-chat pacing
+        assert bot.send_message("hi") == {"ok": True}
+        assert mock_post.call_count == 2
+        assert 2 < sleep.call_args[0][0] <= 3
+
+
 def test_format_digest():
     """_format_digest produces readable Markdown."""
     from notifications.telegram_bot import TelegramBot
@@ -78,9 +126,23 @@ def test_format_digest():
     assert "sats" in text.lower() or "Stack" in text
 
 
+def test_format_digest_education_excerpt():
+    """Only the first paragraph of the lesson is included, capped at 200 chars."""
+    from notifications.telegram_bot import TelegramBot
+    bot = TelegramBot("token", "123")
+
+    def excerpt(content):
+        return bot._format_digest({"education": {"title": "T", "content": content}}).split("\n")[-1]
+
+    assert excerpt("First.\n\nSecond.") == "First."
+    assert excerpt("x" * 500) == "x" * 200
+    assert excerpt("y" * 300 + "\n\nmore") == "y" * 200
+    assert excerpt(None) == ""
+
+
 def test_send_weekly_digest():
     """send_weekly_digest calls send_message with formatted text."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value = MagicMock(
             status_code=200,
             json=MagicMock(return_value={"ok": True}),
@@ -100,6 +162,29 @@ def test_send_weekly_digest():
         mock_post.assert_called_once()
 
 
+def test_async_send_runs_off_caller_thread_in_order():
+    import threading
+    from notifications.telegram_bot import TelegramBot
+    bot = TelegramBot("token", "123")
+    seen = []
+    release = threading.Event()
+
+    def fake_send(text, chat_id=None, parse_mode="Markdown"):
+        release.wait(2)
+        seen.append((text, threading.current_thread().name))
+        return {"ok": True}
+
+    bot.send_message = fake_send
+    first = bot.send_message_async("one")
+    second = bot.send_message_async("two")
+    assert not first.done()  # caller returned before the HTTP round-trip
+    release.set()
+    assert second.result(timeout=2) == {"ok": True}
+    assert [t for t, _ in seen] == ["one", "two"]
+    assert all(name.startswith("telegram-send") for _, name in seen)
+    bot.close()
+
+
 # ── TelegramChannel tests ────────────────────────────
 
 def test_channel_filters_info():
@@ -114,7 +199,7 @@ def test_channel_filters_info():
     alert.message = "Test msg"
 
     channel.send(alert)
-    bot.send_message.assert_not_called()
+    bot.send_message_async.assert_not_called()
 
 
 def test_channel_passes_warning():
@@ -129,8 +214,8 @@ def test_channel_passes_warning():
     alert.message = "F&G below 20"
 
     channel.send(alert)
-    bot.send_message.assert_called_once()
-    text = bot.send_message.call_args[0][0]
+    bot.send_message_async.assert_called_once()
+    text = bot.send_message_async.call_args[0][0]
     assert "WARNING" in text
     assert "Extreme Fear" in text
 
@@ -147,14 +232,17 @@ def test_channel_passes_critical():
     alert.message = "BTC down 20%"
 
     channel.send(alert)
-    bot.send_message.assert_called_once()
+    bot.send_message_async.assert_called_once()
 
 
 def test_channel_handles_send_failure():
     """TelegramChannel logs warning on send failure, doesn't raise."""
     from alerts.telegram_channel import TelegramChannel
+    from concurrent.futures import Future
+    failed = Future()
+    failed.set_exception(Exception("Network error"))
     bot = MagicMock()
-    bot.send_message.side_effect = Exception("Network error")
+    bot.send_message_async.side_effect = [Exception("Queue closed"), failed]
     channel = TelegramChannel(bot, min_severity="WARNING")
 
     alert = MagicMock()
@@ -162,8 +250,11 @@ def test_channel_handles_send_failure():
     alert.rule_name = "Test"
     alert.message = "msg"
 
-    # Should not raise
-    channel.send(alert)
+    # Should not raise, whether queuing fails or the send itself fails
+    with patch("alerts.telegram_channel.logger") as log:
+        channel.send(alert)
+        channel.send(alert)
+    assert log.warning.call_count == 2
 
 
 # ── CLI help tests ───────────────────────────────────
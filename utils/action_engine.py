@@ -27,6 +27,21 @@ class ActionRecommendation:
         return asdict(self)
 
 
+def format_action_markdown(rec: ActionRecommendation) -> str:
+    """Format a recommendation as Markdown (for Telegram); needs no engine state."""
+    lines = [
+        f"{rec.emoji} *{rec.action}*  _{rec.confidence} confidence_",
+        "",
+        rec.headline,
+        "",
+        rec.plain_english,
+        "",
+        f"Signal: {rec.traffic_light} | Bias: {rec.nadeau_bias} | "
+        f"F&G: {rec.fear_greed}/100",
+    ]
+    return "\n".join(lines)
+
+
 class ActionEngine:
     """Distills all market signals into a single action recommendation."""
 
@@ -197,17 +212,7 @@ class ActionEngine:
 
     def format_markdown(self, rec: ActionRecommendation) -> str:
         """Format as Markdown (for Telegram)."""
-        lines = [
-            f"{rec.emoji} *{rec.action}*  _{rec.confidence} confidence_",
-            "",
-            rec.headline,
-            "",
-            rec.plain_english,
-            "",
-            f"Signal: {rec.traffic_light} | Bias: {rec.nadeau_bias} | "
-            f"F&G: {rec.fear_greed}/100",
-        ]
-        return "\n".join(lines)
+        return format_action_markdown(rec)
 
     # ── helpers ──────────────────────────────────────
 
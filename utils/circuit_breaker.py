@@ -0,0 +1,91 @@
+"""Circuit breaker for failing upstream providers."""
+import time
+import logging
+import threading
+from functools import wraps
+
+logger = logging.getLogger("btcmonitor.breaker")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures, fails fast for reset_timeout, then probes once.
+
+    States: closed (calls pass), open (calls raise CircuitOpenError), and
+    half-open (one trial call after reset_timeout; success closes, failure reopens).
+    Calls arriving while the trial is in flight wait for its outcome rather
+    than failing. Overlapping calls that fail together (one provider fanned out
+    across endpoints) count as a single failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name, fail_threshold=3, reset_timeout=60):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._failure_seq = 0  # bumped per counted failure; calls started before it don't count again
+        self._lock = threading.Lock()
+        self._settled = threading.Condition(self._lock)
+
+    def _before_call(self):
+        """Admit a call, returning the failure sequence it started under."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"{self.name} circuit open")
+                self.state = self.HALF_OPEN
+            elif self.state == self.HALF_OPEN:
+                # A trial call is in flight; its result decides whether we go ahead
+                if not self._settled.wait_for(lambda: self.state != self.HALF_OPEN,
+                                              timeout=self.reset_timeout):
+                    raise CircuitOpenError(f"{self.name} circuit half-open")
+                if self.state == self.OPEN:
+                    raise CircuitOpenError(f"{self.name} circuit open")
+            return self._failure_seq
+
+    def _on_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"{self.name} circuit closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._settled.notify_all()
+
+    def _on_failure(self, seq):
+        with self._lock:
+            if self.state != self.HALF_OPEN and seq != self._failure_seq:
+                return  # an overlapping call already counted this outage
+            self._failure_seq += 1
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.fail_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"{self.name} circuit opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._settled.notify_all()
+
+    def call(self, func, *args, **kwargs):
+        seq = self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._on_failure(seq)
+            raise
+        self._on_success()
+        return result
+
+    def wrap(self, func):
+        """Return func guarded by this breaker."""
+        @wraps(func)
+        def guarded(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        return guarded
@@ -1,5 +1,6 @@
 """Bitcoin constants and cycle data."""
 from datetime import date
+from functools import lru_cache
 
 SATOSHIS_PER_BTC = 100_000_000
 MAX_SUPPLY = 21_000_000
@@ -49,9 +50,12 @@ REFERENCE_COST_BASES = {
 }
 
 
-def get_current_halving_era():
-    """Return current halving era number."""
-    today = date.today()
+# Halving figures only change at midnight, so they are memoized per calendar
+# day (keyed on the date ordinal; a new day is a new cache key).
+
+@lru_cache(maxsize=8)
+def _halving_era(ordinal):
+    today = date.fromordinal(ordinal)
     era = 0
     for e, d in sorted(HALVING_DATES.items()):
         if today >= d:
@@ -59,20 +63,33 @@ def get_current_halving_era():
     return era
 
 
+@lru_cache(maxsize=8)
+def _days_since_halving(ordinal):
+    halving_date = HALVING_DATES.get(_halving_era(ordinal), HALVING_DATES[4])
+    return ordinal - halving_date.toordinal()
+
+
+@lru_cache(maxsize=8)
+def _days_until_halving(ordinal):
+    next_date = HALVING_DATES.get(_halving_era(ordinal) + 1)
+    if next_date is None:
+        return None
+    return next_date.toordinal() - ordinal
+
+
+def get_current_halving_era():
+    """Return current halving era number."""
+    return _halving_era(date.today().toordinal())
+
+
 def days_since_last_halving():
     """Days since the most recent halving."""
-    era = get_current_halving_era()
-    halving_date = HALVING_DATES.get(era, HALVING_DATES[4])
-    return (date.today() - halving_date).days
+    return _days_since_halving(date.today().toordinal())
 
 
 def days_until_next_halving():
     """Days until the next estimated halving."""
-    era = get_current_halving_era()
-    next_date = HALVING_DATES.get(era + 1)
-    if next_date is None:
-        return None
-    return (next_date - date.today()).days
+    return _days_until_halving(date.today().toordinal())
 
 
 def get_current_block_reward():
@@ -1,8 +1,17 @@
 """HTTP client with retries, caching, and rate limiting."""
 import time
 import logging
-import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    from orjson import loads as json_loads  # optional, faster parse of large payloads
+except ImportError:
+    from json import loads as json_loads
 
 logger = logging.getLogger("btcmonitor.http")
 
@@ -22,34 +31,146 @@ class HTTPClient:
     RETRYABLE_STATUS = {429, 500, 502, 503, 504}
     NON_RETRYABLE_STATUS = {400, 401, 403, 404}
 
-    def __init__(self, base_url, rate_limiter=None, timeout=30, max_retries=3, cache_ttl=0):
+    # Keep-alive pool per host; retries are handled in _request, not by urllib3
+    POOL_CONNECTIONS = 8
+    POOL_MAXSIZE = 32
+
+    # Cached responses kept per client; least recently used are evicted first
+    CACHE_MAXSIZE = 256
+
+    def __init__(self, base_url, rate_limiter=None, timeout=30, max_retries=3, cache_ttl=0, stale_ttl=0,
+                 session=None):
         self.base_url = base_url.rstrip("/")
         self.rate_limiter = rate_limiter
         self.timeout = timeout
         self.max_retries = max_retries
         self.cache_ttl = cache_ttl
-        self._cache = {}
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "BTCMonitor/1.0"})
+        # After cache_ttl, serve the cached body for up to stale_ttl more
+        # seconds while a background refresh runs (stale-while-revalidate).
+        self.stale_ttl = stale_ttl
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._revalidating = set()
+        self._revalidate_lock = threading.Lock()
+        self._revalidate_pool = None
+        # Single-flight: concurrent misses on one key share a single upstream call
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # A session passed in is shared with other clients and closed by its owner
+        self._owns_session = session is None
+        self.session = session or self.new_session()
+
+    @classmethod
+    def new_session(cls):
+        """Session with keep-alive pools for up to POOL_CONNECTIONS hosts."""
+        session = requests.Session()
+        # Every encoding urllib3 can decode here (br/zstd only if their packages are installed)
+        session.headers.update({"User-Agent": "BTCMonitor/1.0", "Accept-Encoding": ACCEPT_ENCODING})
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """Release pooled keep-alive connections and the revalidation worker."""
+        with self._revalidate_lock:
+            if self._revalidate_pool:
+                self._revalidate_pool.shutdown(wait=False)
+                self._revalidate_pool = None
+        if self._owns_session:
+            self.session.close()
 
     def get(self, path="", params=None):
         """Make a GET request with retry and caching."""
         return self._request("GET", path, params)
 
     def _cache_key(self, method, path, params):
-        raw = f"{method}:{self.base_url}{path}:{sorted((params or {}).items())}"
-        return hashlib.md5(raw.encode()).hexdigest()
+        return (method, path, tuple(sorted(params.items())) if params else ())
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key, data):
+        with self._cache_lock:
+            self._cache[key] = {"data": data, "time": time.time()}
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
 
     def _request(self, method, path, params=None):
         url = f"{self.base_url}/{path.lstrip('/')}" if path else self.base_url
+        key = self._cache_key(method, path, params)
 
         # Check cache
         if self.cache_ttl > 0:
-            key = self._cache_key(method, path, params)
-            cached = self._cache.get(key)
-            if cached and time.time() - cached["time"] < self.cache_ttl:
-                return cached["data"]
-
+            cached = self._cache_get(key)
+            if cached:
+                age = time.time() - cached["time"]
+                if age < self.cache_ttl:
+                    return cached["data"]
+                if age < self.cache_ttl + self.stale_ttl:
+                    self._revalidate(key, method, url, path, params)
+                    return cached["data"]
+
+        return self._fetch_once(key, method, url, path, params)
+
+    def _fetch_once(self, key, method, url, path, params):
+        """Run _fetch for key, or wait on the identical request already in flight."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            data = self._fetch(method, url, path, params)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _revalidate(self, key, method, url, path, params):
+        """Refresh a stale cache entry in the background, once per key."""
+        def _run():
+            try:
+                self._fetch_once(key, method, url, path, params)
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {url}: {e}")
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(key)
+
+        with self._revalidate_lock:
+            if key in self._revalidating:
+                return
+            if self._revalidate_pool is None:
+                self._revalidate_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="http-revalidate")
+            try:
+                self._revalidate_pool.submit(_run)
+            except RuntimeError as e:
+                # Pool shut down by a concurrent close(); the caller still gets the stale body
+                logger.debug(f"Background refresh not scheduled for {url}: {e}")
+                return
+            self._revalidating.add(key)
+
+    def _fetch(self, method, url, path, params):
         last_error = None
         for attempt in range(self.max_retries + 1):
             if self.rate_limiter:
@@ -59,18 +180,17 @@ class HTTPClient:
                 start = time.time()
                 resp = self.session.request(method, url, params=params, timeout=self.timeout)
                 latency = int((time.time() - start) * 1000)
-                logger.debug(f"{method} {url} → {resp.status_code} ({latency}ms)")
+                logger.debug(f"{method} {url} → {resp.status_code} ({latency}ms, "
+                             f"encoding={resp.headers.get('Content-Encoding', 'identity')})")
 
                 if resp.status_code == 200:
                     try:
-                        data = resp.json()
+                        data = json_loads(resp.content)
                     except ValueError:
                         data = resp.text
 
                     if self.cache_ttl > 0:
-                        self._cache[self._cache_key(method, path, params)] = {
-                            "data": data, "time": time.time()
-                        }
+                        self._cache_put(self._cache_key(method, path, params), data)
                     return data
 
                 if resp.status_code in self.NON_RETRYABLE_STATUS:
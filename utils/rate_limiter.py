@@ -6,10 +6,11 @@ import threading
 class RateLimiter:
     """Token bucket rate limiter, thread-safe."""
 
-    def __init__(self, calls_per_minute):
+    def __init__(self, calls_per_minute, burst=None):
         self.rate = calls_per_minute / 60.0  # tokens per second
-        self.max_tokens = calls_per_minute
-        self.tokens = float(calls_per_minute)
+        # Bucket size; defaults to a full minute's allowance
+        self.max_tokens = burst or calls_per_minute
+        self.tokens = float(self.max_tokens)
         self.last_time = time.monotonic()
         self._lock = threading.Lock()
 
@@ -31,7 +31,7 @@ setup_logging(os.environ.get("BTC_MONITOR_LOG_LEVEL", "INFO"))
 config = load_config()
 
 db_path = os.environ.get("BTC_MONITOR_DB_PATH", config["database"]["path"])
-db = Database(db_path)
+db = Database(db_path, packed_snapshots=config["database"].get("packed_snapshots", False))
 db.connect()
 
 api = APIRegistry(config)